@@ -2,22 +2,74 @@
 File in charge of automating and simplify the process of asking a question and expecting a specific type of response
 """
 
-from .ask_question import AskQuestion
-from .ask_question_response_paquet import AQFlexibleDictionary, AskQuestionResponse
-TUI_AVAILABLE = True
-
-
-try:
-    from .ask_question_tui import AskQuestionTUI
-except ImportError:
-    TUI_AVAILABLE = False
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Dict, List, Tuple
 
-__all__ = [
-    "AQFlexibleDictionary", "AskQuestionResponse",
+from .ask_question import AskQuestion
+from .ask_question_response_paquet import (
+    AQFlexibleDictionary, AskQuestionResponse, FrozenAQFlexibleDictionary, FrozenAskQuestionResponse
+)
+from .ask_question_validator import AskQuestionValidator, compile
+from .ask_question_response_batch import ResponseBatch
+from .ask_question_numpy import NUMPY_AVAILABLE
+from .ask_question_instrumentation import Instrumentation
+from .ask_question_memo import AnswerMemo
+from .ask_question_input import (
+    InputProvider, TTYInputProvider, BufferedInputProvider, FileInputProvider,
+    EnvironmentInputProvider, CallableInputProvider, AutoInputProvider
+)
+
+# The submodule is shadowed by the ask_question alias (resolved in __getattr__)
+globals().pop("ask_question", None)
+
+# Checked without importing asciimatics, the TUI is only imported when one of its classes is used
+TUI_AVAILABLE = find_spec("asciimatics") is not None and find_spec("asciimatics_overlay_ov") is not None
+
+# The classes imported on their first use: name -> (module, attribute)
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "StreamStatistics": (".ask_question_stream", "StreamStatistics"),
+    "IncrementalValidator": (".ask_question_incremental", "IncrementalValidator"),
+    "AskQuestionProcessPool": (".ask_question_parallel", "AskQuestionProcessPool"),
+    "AskQuestionServer": (".ask_question_server", "AskQuestionServer"),
+    "QuestionSession": (".ask_question_server", "QuestionSession"),
+    "SessionStatistics": (".ask_question_server", "SessionStatistics"),
+    "Question": (".ask_question_questionnaire", "Question"),
+    "Questionnaire": (".ask_question_questionnaire", "Questionnaire"),
+    "QuestionnairePlan": (".ask_question_questionnaire", "QuestionnairePlan"),
+    "QuestionnaireError": (".ask_question_questionnaire", "QuestionnaireError"),
+}
+
+# The other names of the classes, created on their first use: alias -> class name
+_ALIASES: Dict[str, str] = {
+    "ask_question": "AskQuestion",
+    "askquestion": "AskQuestion",
+    "Ask_Question": "AskQuestion",
+    "ASK_QUESTION": "AskQuestion",
+    "ASKQUESTION": "AskQuestion",
+}
+
+_TUI_ALIASES: Dict[str, str] = {
+    "ask_question_tui": "AskQuestionTUI",
+    "askquestiontui": "AskQuestionTUI",
+    "Ask_Question_TUI": "AskQuestionTUI",
+    "ASK_QUESTION_TUI": "AskQuestionTUI",
+    "ASKQUESTIONTUI": "AskQuestionTUI",
+}
+
+__all__: List[str] = [
+    "AQFlexibleDictionary", "AskQuestionResponse", "FrozenAQFlexibleDictionary", "FrozenAskQuestionResponse",
+    "AskQuestionValidator", "compile", "IncrementalValidator", "ResponseBatch", "StreamStatistics", "Instrumentation", "AnswerMemo",
+    "AskQuestionProcessPool", "AskQuestionServer", "QuestionSession", "SessionStatistics",
+    "Question", "Questionnaire", "QuestionnairePlan", "QuestionnaireError",
+    "InputProvider", "TTYInputProvider", "BufferedInputProvider", "FileInputProvider",
+    "EnvironmentInputProvider", "CallableInputProvider", "AutoInputProvider",
     "ask_question", "askquestion", "Ask_Question", "ASK_QUESTION", "ASKQUESTION"
 ]
 
 if TUI_AVAILABLE:
+    _LAZY_ATTRIBUTES["AskQuestionTUI"] = (".ask_question_tui", "AskQuestionTUI")
+    _ALIASES.update(_TUI_ALIASES)
     __all__.extend([
         "AskQuestionTUI", "ask_question_tui", "askquestiontui",
         "Ask_Question_TUI", "ASK_QUESTION_TUI", "ASKQUESTIONTUI"
@@ -25,43 +77,29 @@ if TUI_AVAILABLE:
 
 __version__ = "1.2.0"
 
-if TUI_AVAILABLE:
-    class ask_question_tui(AskQuestionTUI):
-        """ Ask a question to the user while expecting a specific format """
-
-    class askquestiontui(AskQuestionTUI):
-        """ Ask a question to the user while expecting a specific format """
-
-    class Ask_Question_TUI(AskQuestionTUI):
-        """ Ask a question to the user while expecting a specific format """
-
-    class ASK_QUESTION_TUI(AskQuestionTUI):
-        """ Ask a question to the user while expecting a specific format """
-
-    class ASKQUESTIONTUI(AskQuestionTUI):
-        """ Ask a question to the user while expecting a specific format """
-
-
-class ask_question(AskQuestion):
-    """ Ask a question to the user while expecting a specific format """
-    pass
-
-
-class askquestion(AskQuestion):
-    """ Ask a question to the user while expecting a specific format """
-    pass
-
-
-class Ask_Question(AskQuestion):
-    """ Ask a question to the user while expecting a specific format """
-    pass
-
-
-class ASK_QUESTION(AskQuestion):
-    """ Ask a question to the user while expecting a specific format """
-    pass
-
 
-class ASKQUESTION(AskQuestion):
-    """ Ask a question to the user while expecting a specific format """
-    pass
+def __getattr__(name: str) -> Any:
+    """ Import the lazy classes and create the aliases on their first use """
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(import_module(module_name, __name__), attribute)
+        # Importing a submodule binds it on the package, it must not hide the alias of the same name
+        if module_name[1:] in _ALIASES:
+            globals().pop(module_name[1:], None)
+    elif name in _ALIASES:
+        parent = globals().get(_ALIASES[name])
+        if parent is None:
+            parent = __getattr__(_ALIASES[name])
+        value = type(name, (parent,), {
+            "__doc__": " Ask a question to the user while expecting a specific format ",
+            "__module__": __name__,
+        })
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """ List the attributes, the lazy ones included """
+    return sorted(set(globals()) | set(__all__))
@@ -14,8 +14,14 @@ Crediting the author is appreciated.
 
 __Author__ = "(c) Henry Letellier"
 
-from string import printable
-from typing import Union, Dict, List, Any
+from threading import Lock
+from time import perf_counter
+from collections import OrderedDict
+from types import ModuleType
+from typing import Union, Dict, List, Any, Iterable, Iterator, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader, StreamWriter
 
 try:
     from .ask_question_response_paquet import AskQuestionResponse
@@ -27,21 +33,123 @@ except ImportError:
             "Class AskQuestionResponse not found in the module, make sure the path is valid or that your module is not corrupt"
         ) from exc
 
+try:
+    from . import ask_question_validator as AQV
+except ImportError:
+    try:
+        import ask_question_validator as AQV
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_validator not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from . import ask_question_numpy as AQN
+except ImportError:
+    try:
+        import ask_question_numpy as AQN
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_numpy not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from . import ask_question_parallel as AQP
+except ImportError:
+    try:
+        import ask_question_parallel as AQP
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_parallel not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from . import ask_question_stream as AQS
+except ImportError:
+    try:
+        import ask_question_stream as AQS
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_stream not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from . import ask_question_input as AQIP
+except ImportError:
+    try:
+        import ask_question_input as AQIP
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_input not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from . import ask_question_instrumentation as AQM
+except ImportError:
+    try:
+        import ask_question_instrumentation as AQM
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_instrumentation not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from . import ask_question_memo as AQMM
+except ImportError:
+    try:
+        import ask_question_memo as AQMM
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_memo not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+try:
+    from .ask_question_response_batch import ResponseBatch
+except ImportError:
+    try:
+        from ask_question_response_batch import ResponseBatch
+    except ImportError as exc:
+        raise ImportError(
+            "Class ResponseBatch not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+
+def _import_async() -> ModuleType:
+    """ Import the asyncio helpers on their first use, asyncio is slow to import and most programs never need it """
+    try:
+        from . import ask_question_async as AQA
+    except ImportError:
+        try:
+            import ask_question_async as AQA
+        except ImportError as exc:
+            raise ImportError(
+                "Module ask_question_async not found in the module, make sure the path is valid or that your module is not corrupt"
+            ) from exc
+    return AQA
+
 
 class AskQuestion:
     """ An advanced function that contains boiling to gain time when asking a question """
 
-    def __init__(self, human_type: Dict = {}, illegal_characters_nb: str = "", tui: bool = False, allow_blank: bool = False) -> None:
+    def __init__(self, human_type: Dict = {}, illegal_characters_nb: str = "", tui: bool = False, allow_blank: bool = False, validator_cache_size: int = 32, input_provider: Union["AQIP.InputProvider", Callable[[str], str], Iterable[str], str, None] = None) -> None:
         """ The globals for the class """
+        self._validators: "OrderedDict[str, AQV.AskQuestionValidator]" = OrderedDict()
+        self._validators_lock = Lock()
+        self.validator_cache_size = validator_cache_size
+        # The results of the checks, None while the memoization is disabled (see enable_memoization)
+        self.memo: Union[AQMM.AnswerMemo, None] = None
         self.human_type = human_type
         self.illegal_characters_nb = illegal_characters_nb
         self.author = "(c) Henry Letellier"
         self.in_tui = tui
+        # Where the answers come from (the terminal, or stdin read in chunks when it is not a terminal, by default)
+        self.input_provider = AQIP.get_input_provider(input_provider)
+        # The counters of the checks, None while the instrumentation is disabled (see enable_instrumentation)
+        self.instrumentation: Union[AQM.Instrumentation, None] = None
         self.usr_answer: Union[str, int, float,  None, bool, List[Any]] = ""
         self.allow_blank: bool = allow_blank
         self.answer_was_found = True
         self.answer_was_not_found = False
-        self.illegal_characters_found = False
         self._tui_key = "tui"
         self._message_key = "message"
         self._usr_answer_key = "user_answer"
@@ -52,41 +160,133 @@ class AskQuestion:
     def check_load(self) -> None:
         """ Check that the ressources are present """
         if isinstance(self.human_type, dict) is False or len(self.human_type) == 0:
-            self.human_type = {
-                "int": "whole number (-1, 0, 1, 2, 3, etc...)",
-                "float": "floating number (-1.2, 0.1, 1.2, etc...)",
-                "uint": "whole positive number (0, 1, 2, etc...)",
-                "ufloat": "whole positive floating number (0.1, 1.2, etc ...)",
-                "num": "numeric (numbers from 0 onwards)",
-                "alnum": "alphanumeric (only numbers and the alphabet)",
-                "alpha": "alphabet (from a to z and A to Z)",
-                "char": "alphabet (from a to z and A to Z)",
-                "ascii": "ascii Table",
-                "str": "string (any character you can type)",
-                "version": "version (numbers separated by '.' characters)",
-                "ver": "version (numbers separated by '.' characters)",
-                "bool": "boolean (yes/True/1 or no/False/0 answer type)",
-                "up": "Convert the user input to uppercase",
-                "low": "Convert the user input to lowercase"
-            }
+            self.human_type = dict(AQV.DEFAULT_HUMAN_TYPE)
         if self.illegal_characters_nb == "":
-            self.illegal_characters_nb = printable.replace("-", "")
-            self.illegal_characters_nb = self.illegal_characters_nb.replace(
-                ".",
-                ""
-            )
-            self.illegal_characters_nb = self.illegal_characters_nb.replace(
-                ",",
-                ""
-            )
-            self.illegal_characters_nb = self.illegal_characters_nb.replace(
-                "+",
-                ""
-            )
-            self.illegal_characters_nb = self.illegal_characters_nb.replace(
-                "0123456789",
-                ""
+            self.illegal_characters_nb = AQV.DEFAULT_ILLEGAL_CHARACTERS_NB
+
+    @property
+    def human_type(self) -> Dict:
+        """ The descriptions of the answer types shown when an answer is refused """
+        return self._human_type
+
+    @human_type.setter
+    def human_type(self, human_type: Dict) -> None:
+        """ Update the descriptions and forget the validators compiled with the old ones """
+        with self._validators_lock:
+            self._human_type = human_type
+            self._validators.clear()
+            if self.memo is not None:
+                self.memo.clear()
+
+    @property
+    def illegal_characters_nb(self) -> str:
+        """ The characters refused in an answer destined to be converted to a number """
+        return self._illegal_characters_nb
+
+    @illegal_characters_nb.setter
+    def illegal_characters_nb(self, illegal_characters_nb: str) -> None:
+        """ Update the illegal characters and forget the validators compiled with the old ones """
+        with self._validators_lock:
+            self._illegal_characters_nb = illegal_characters_nb
+            self._validators.clear()
+            if self.memo is not None:
+                self.memo.clear()
+
+    @property
+    def allow_blank(self) -> bool:
+        """ Whether an empty answer is accepted """
+        return self._allow_blank
+
+    @allow_blank.setter
+    def allow_blank(self, allow_blank: bool) -> None:
+        """ Update the blank status and forget the validators compiled with the old one """
+        with self._validators_lock:
+            self._allow_blank = allow_blank
+            self._validators.clear()
+            if self.memo is not None:
+                self.memo.clear()
+
+    def compile(self, answer_type: str) -> AQV.AskQuestionValidator:
+        """ Get the validator for the answer type, it is compiled on the first use and kept in a small LRU cache (compiled again when human_type was changed in place) """
+        with self._validators_lock:
+            validator = self._validators.get(answer_type)
+            if validator is not None:
+                if AQV.human_description(self._human_type, validator.cleaned_answer_type) == validator.human_description:
+                    self._validators.move_to_end(answer_type)
+                    return validator
+                # The results checked with the old description are forgotten, like when human_type is reassigned
+                if self.memo is not None:
+                    self.memo.clear()
+            validator = AQV.AskQuestionValidator(
+                answer_type,
+                human_type=self.human_type,
+                illegal_characters_nb=self.illegal_characters_nb,
+                allow_blank=self.allow_blank
             )
+            if self.memo is not None:
+                validator.use_memo(self.memo)
+            self._validators[answer_type] = validator
+            if len(self._validators) > self.validator_cache_size:
+                self._validators.popitem(last=False)
+            return validator
+
+    def enable_instrumentation(self, instrumentation: Union[AQM.Instrumentation, None] = None) -> AQM.Instrumentation:
+        """_summary_
+            Start counting the checks of check_input (and test_input) and the retries of ask_question_detailed.
+            The instrumented check_input replaces the plain one on this instance only, disabling the instrumentation puts the plain one back.
+
+        Args:
+            instrumentation (Union[Instrumentation, None], optional): _description_: Where the counters are stored (it can be shared between instances). Defaults to None (the current one, or a new one).
+
+        Returns:
+            Instrumentation: _description_: The counters, their hooks and their exports.
+        """
+        if instrumentation is None:
+            instrumentation = self.instrumentation
+        if instrumentation is None:
+            instrumentation = AQM.Instrumentation()
+        self.instrumentation = instrumentation
+        self.check_input = self._check_input_instrumented
+        return instrumentation
+
+    def disable_instrumentation(self) -> Union[AQM.Instrumentation, None]:
+        """ Stop counting the checks, returns the counters that were used """
+        instrumentation = self.instrumentation
+        self.instrumentation = None
+        self.__dict__.pop("check_input", None)
+        return instrumentation
+
+    def enable_memoization(self, max_size: int = AQMM.DEFAULT_MEMO_SIZE, memo: Union[AQMM.AnswerMemo, None] = None) -> AQMM.AnswerMemo:
+        """_summary_
+            Remember the results of the checks, an answer already checked against the same answer type is not checked again.
+            The key is the answer, the resolved answer type, allow_blank, the illegal characters and the error message, the memo is cleared when human_type (reassigned or changed in place), illegal_characters_nb or allow_blank change.
+            The results are immutable tuples, every check still returns a new response.
+
+        Args:
+            max_size (int, optional): _description_: The number of results kept, the least recently used ones are forgotten first. Defaults to AQMM.DEFAULT_MEMO_SIZE.
+            memo (Union[AnswerMemo, None], optional): _description_: The memo to use (it can be shared between instances). Defaults to None (the current one, or a new one).
+
+        Returns:
+            AnswerMemo: _description_: The memo, with its hit and miss statistics.
+        """
+        if memo is None:
+            memo = self.memo
+        if memo is None:
+            memo = AQMM.AnswerMemo(max_size)
+        with self._validators_lock:
+            self.memo = memo
+            for validator in self._validators.values():
+                validator.use_memo(memo)
+        return memo
+
+    def disable_memoization(self) -> Union[AQMM.AnswerMemo, None]:
+        """ Stop remembering the results of the checks, returns the memo that was used """
+        with self._validators_lock:
+            memo = self.memo
+            self.memo = None
+            for validator in self._validators.values():
+                validator.use_memo(None)
+        return memo
 
     def update_tui_status(self, tui: bool = False) -> None:
         """ Update the processing method used by the tui class """
@@ -112,285 +312,152 @@ class AskQuestion:
 
     def is_version(self, string: str) -> bool:
         """ Check if the given string is a version """
-        string_length = len(string)-1
-        for i in enumerate(string):
-            if i[1].isdigit() is False:
-                if i[0] == string_length and (i[1] == '.' or i[1] == ','):
-                    return False
-                if i[1] != "." and i[1] != ",":
-                    return False
-        return True
+        return AQV.is_version(string)
 
     def is_float(self, number: str) -> bool:
         """ Check if the given string is a float """
-        try:
-            float(number)
-            return True
-        except ValueError:
-            return False
+        return AQV.is_float(number)
 
     def contains_illegal_characters(self, string: str, illegal_characters: str) -> bool:
         """ Check if there are no forbidden characters in a string destined to be converted to a number """
-        for i in string:
-            if i in illegal_characters:
-                return True
-        return False
+        return AQV.contains_illegal_characters(string, illegal_characters)
 
     def remove_char_overflow(self, string: str, char: str, presence_tolerance: int = 1, case_sensitive: bool = False) -> str:
         """ Remove the number of times a specific character appears in a string after the allowed number of times """
-        result = ""
-        for i in string:
-            if case_sensitive is False:
-                if i.lower() == char:
-                    if presence_tolerance > 0:
-                        result += i
-                        presence_tolerance -= 1
-                else:
-                    result += i
-            else:
-                if i == char:
-                    if presence_tolerance > 0:
-                        result += i
-                        presence_tolerance -= 1
-                else:
-                    result += i
-        return result
+        return AQV.remove_char_overflow(string, char, presence_tolerance, case_sensitive)
 
     def clean_number(self, string: str, char: str = ".", tolerance: int = 1, case_sensitive: bool = False) -> str:
         """ Remove content that should not be in a number input """
-        if " " in string:
-            string = string.replace(" ", "")
-        if "," in string:
-            string = string.replace(",", ".")
-        if string.count(char) > tolerance:
-            string = self.remove_char_overflow(
-                string, char, tolerance, case_sensitive)
-        return string
+        return AQV.clean_number(string, char, tolerance, case_sensitive)
+
+    def _create_response(self, raw_usr_answer: str, message: str, answer_status: bool, user_answer: Union[str, int, float, None, bool, List[Any]], answer_type: str = "", question: Union[str, None] = None, tui: Union[bool, None] = None) -> AskQuestionResponse:
+        """ Create the response of a check, the instance state is not used besides its configuration """
+        if tui is None:
+            tui = self.in_tui
+        return AskQuestionResponse.from_fields(
+            tui,
+            self.allow_blank,
+            message,
+            question,
+            answer_type,
+            answer_status,
+            raw_usr_answer,
+            user_answer
+        )
 
     def _display_accordingly(self, raw_usr_answer: str, message: str, answer_status: bool = True, print_error: bool = True, answer_type: str = "", question: Union[str, None] = None) -> AskQuestionResponse:
         """ Display the message depending on is_tui """
-        final = AskQuestionResponse()
-        final.tui = self.in_tui
-        final.allow_blanks = self.allow_blank
-        final.message = message
-        final.raw_user_answer = raw_usr_answer
-        final.user_answer = self.usr_answer
-        final.answer_found = answer_status
-        final.question = question
-        final.answer_type = answer_type
+        final = self._create_response(
+            raw_usr_answer,
+            message,
+            answer_status,
+            self.usr_answer,
+            answer_type,
+            question
+        )
         if self.in_tui is False and print_error is True:
             print(message)
         return final
 
-    def _process_isint(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the uint data """
-        if (answer_type == "int" or answer_type == "isint") and not ("uint" in answer_type or "isuint" in answer_type) and self.illegal_characters_found is False:
-            input_answer = self.clean_number(input_answer, ".", 0, False)
-            input_answer = self.remove_char_overflow(
-                input_answer, "-", 1, False)
-            try:
-                self.usr_answer = int(input_answer)
-                return self.answer_was_found
-            except TypeError:
-                self.usr_answer = ""
-                return self.answer_was_not_found
-            except BaseException:
-                self.usr_answer = ""
-                return self.answer_was_not_found
-        return self.answer_was_not_found
-
-    def _process_isfloat(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the float data """
-        if ("isfloat" in answer_type or "float" in answer_type) and not ("isufloat" in answer_type or "ufloat" in answer_type) and self.illegal_characters_found is False:
-            input_answer = self.clean_number(input_answer, ".", 1, False)
-            input_answer = self.remove_char_overflow(
-                input_answer,
-                "-",
-                1,
-                False
-            )
-            try:
-                self.usr_answer = float(input_answer)
-                return self.answer_was_found
-            except TypeError:
-                self.usr_answer = ""
-                return self.answer_was_not_found
-            except BaseException:
-                self.usr_answer = input_answer
-                return self.answer_was_not_found
-        return self.answer_was_not_found
-
-    def _process_isuint(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the uint data """
-        # We don't need to check the '-' sign because isdigit does not consider '-' as a number
-        if input_answer.isdigit() is True and ("isuint" in answer_type or "uint" in answer_type):
-            self.usr_answer = int(input_answer)
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isufloat(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the ufloat data """
-        if self.is_float(input_answer) is True and ("isufloat" in answer_type or "ufloat" in answer_type):
-            if len(input_answer) > 0 and input_answer[0] != "-":
-                self.usr_answer = float(input_answer)
-                return self.answer_was_found
-            return self.answer_was_not_found
-        return self.answer_was_not_found
-
-    def _process_isnum(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the isnum data """
-        if input_answer.isdigit() is True and ("isnum" in answer_type or "num" in answer_type):
-            self.usr_answer = float(input_answer)
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isalnum(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the isalnum data """
-        if input_answer.isalnum() is True and ("isalnum" in answer_type or "alnum" in answer_type):
-            self.usr_answer = input_answer
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isalpha(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the isalpha data """
-        if input_answer.isalpha() is True and ("isalpha" in answer_type or "alpha" in answer_type):
-            self.usr_answer = input_answer
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_ischar(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the char data """
-        if input_answer.isalpha() is True and ("ischar" in answer_type or "char" in answer_type):
-            self.usr_answer = input_answer
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isascii(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the isascii data """
-        if input_answer.isascii() is True and ("isascii" in answer_type or "ascii" in answer_type):
-            self.usr_answer = input_answer
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isstr(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the isstr data """
-        if ("isstr" in answer_type or "str" in answer_type) and isinstance(input_answer, str) is True:
-            for i in input_answer:
-                if i not in printable:
-                    return self.answer_was_not_found
-            self.usr_answer = input_answer
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isversion(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the version data """
-        if self.is_version(input_answer) is True and ("isversion" in answer_type or "version" in answer_type or "isver" in answer_type or "ver" in answer_type):
-            self.usr_answer = input_answer
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_isbool(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the bool data """
-        if ("isbool" in answer_type or "bool" in answer_type):
-            input_answer = input_answer.lower()
-            if "y" in input_answer or "t" in input_answer or "1" in input_answer:
-                self.usr_answer = True
-                return self.answer_was_found
-            if "n" in input_answer or "f" in input_answer or "0" in input_answer:
-                self.usr_answer = False
-                return self.answer_was_found
-            self.usr_answer = None
-            return self.answer_was_not_found
-        return self.answer_was_not_found
-
-    def _process_to_up(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the to up data """
-        if "up" in answer_type:
-            self.usr_answer = input_answer.upper()
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _process_to_low(self, input_answer: str, answer_type: str) -> bool:
-        """ Process the to low data """
-        if "low" in answer_type:
-            self.usr_answer = input_answer.lower()
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _first_chunk(self, input_answer: str, answer_type: str) -> bool:
-        """ The second chunk in charge of checking the inputted data """
-        if self._process_isint(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isfloat(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isuint(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isufloat(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isnum(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _second_chunk(self, input_answer: str, answer_type: str) -> bool:
-        """ The second chunk in charge of checking the inputted data """
-        if self._process_to_low(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isalnum(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isalpha(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_ischar(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isascii(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def _third_chunk(self, input_answer: str, answer_type: str) -> bool:
-        """ The third chunk in charge of checking the inputted data """
-        if self._process_isstr(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isversion(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_isbool(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_to_up(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        if self._process_to_low(input_answer, answer_type) is self.answer_was_found:
-            return self.answer_was_found
-        return self.answer_was_not_found
-
-    def test_input(self, input_answer: str, answer_type: str, print_error: bool = True) -> AskQuestionResponse:
+    def check_input(self, input_answer: str, answer_type: str, tui: Union[bool, None] = None) -> AskQuestionResponse:
+        """ Check the answer without printing or storing anything on the instance, safe to call from several threads at once """
+        answer_found, user_answer, message = self.compile(
+            answer_type
+        ).validate(input_answer)
+        return self._create_response(input_answer, message, answer_found, user_answer, answer_type, tui=tui)
+
+    def _check_input_instrumented(self, input_answer: str, answer_type: str, tui: Union[bool, None] = None) -> AskQuestionResponse:
+        """ check_input while the instrumentation is enabled """
+        start = perf_counter()
+        validator = self.compile(answer_type)
+        compiled = perf_counter()
+        result, resolution, (blank, illegal_characters, parse) = validator.trace(input_answer)
+        validated = perf_counter()
+        answer_found, user_answer, message = result
+        response = self._create_response(input_answer, message, answer_found, user_answer, answer_type, tui=tui)
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            instrumentation.record_validation(answer_type, answer_found, resolution, {
+                AQM.STAGE_COMPILE: compiled - start,
+                AQM.STAGE_BLANK: blank,
+                AQM.STAGE_ILLEGAL_CHARACTERS: illegal_characters,
+                AQM.STAGE_PARSE: parse,
+                AQM.STAGE_RESPONSE: perf_counter() - validated,
+            })
+        return response
+
+    def test_input(self, input_answer: str, answer_type: str, print_error: bool = True, tui: Union[bool, None] = None) -> AskQuestionResponse:
         """ The function in charge of ensuring that the user's response corresponds to the programmer's expectations """
-        answer_type_cleaned = answer_type\
-            .replace("is", "", 1)\
-            .replace("is_", "", 1)\
-            .replace("is ", "", 1)
-        if (self.is_empty(input_answer) is True or input_answer.isspace()) and self.allow_blank is True:
-            return self._display_accordingly(input_answer, "", self.answer_was_found, print_error, answer_type)
-        if self.is_empty(input_answer) is False and input_answer.isspace() is False and input_answer.isprintable() is True:
-            self.illegal_characters_found = self.contains_illegal_characters(
-                input_answer,
-                self.illegal_characters_nb
+        response = self.check_input(input_answer, answer_type, tui)
+        if response[self._tui_key] is False and print_error is True:
+            print(response[self._message_key])
+        self.usr_answer = response[self._usr_answer_key]
+        return response
+
+    def test_inputs(self, input_answers: Iterable[str], answer_type: str, engine: str = "auto", processes: int = 0, chunk_size: int = AQP.DEFAULT_CHUNK_SIZE) -> ResponseBatch:
+        """_summary_
+            Check several answers against the same answer type, the results are stored in a columnar batch.
+
+        Args:
+            input_answers (Iterable[str]): _description_: The answers to check.
+            answer_type (str): _description_: The type of answer expected.
+            engine (str, optional): _description_: "python", "numpy" (numeric types only) or "auto" to use numpy when it is installed and the type is numeric. Defaults to "auto".
+            processes (int, optional): _description_: When above 1, the answers are checked by a pool of this many processes (use an AskQuestionProcessPool to keep the pool between calls). Defaults to 0.
+            chunk_size (int, optional): _description_: The number of answers sent to a process at once. Defaults to AQP.DEFAULT_CHUNK_SIZE.
+
+        Returns:
+            ResponseBatch: _description_: The results of every answer, in the same order.
+        """
+        validator = self.compile(answer_type)
+        if engine not in ("auto", "python", "numpy"):
+            raise ValueError(f"Unknown validation engine '{engine}'")
+        if processes > 1:
+            with AQP.AskQuestionProcessPool(self, processes) as pool:
+                return pool.test_inputs(input_answers, answer_type, chunk_size, engine)
+        if engine == "numpy" or (engine == "auto" and AQN.supports(validator) is True):
+            if isinstance(input_answers, list) is False:
+                input_answers = list(input_answers)
+            return ResponseBatch.from_numeric_column(
+                validator,
+                input_answers,
+                tui=self.in_tui
             )
-            status1 = self._first_chunk(input_answer, answer_type_cleaned)
-            if status1 == self.answer_was_found:
-                return self._display_accordingly(input_answer, "", self.answer_was_found, print_error, answer_type)
-            status2 = self._second_chunk(input_answer, answer_type_cleaned)
-            if status2 == self.answer_was_found:
-                return self._display_accordingly(input_answer, "", self.answer_was_found, print_error, answer_type)
-            status3 = self._third_chunk(input_answer, answer_type_cleaned)
-            if status3 == self.answer_was_found:
-                return self._display_accordingly(input_answer, "", self.answer_was_found, print_error, answer_type)
-            self.usr_answer = ""
-            response = "Please enter a response of type '"
-            if answer_type_cleaned in self.human_type:
-                response += f"{self.human_type[answer_type_cleaned]}'"
-            else:
-                response += "Unknown demanded type"
-            return self._display_accordingly(input_answer, response, self.answer_was_not_found, print_error, answer_type)
-        self.usr_answer = ""
-        response = "Response must not be empty or only contain spaces or any non visible character."
-        return self._display_accordingly(input_answer, response, self.answer_was_not_found, print_error, answer_type)
+        return ResponseBatch.from_validator(
+            validator,
+            input_answers,
+            tui=self.in_tui
+        )
+
+    def validate_stream(self, source: Union[Iterable[str], None], answer_type: Union[str, Dict[Union[str, int], str]], source_format: str = "lines", field: Union[str, int, None] = None, chunk_size: int = 0, engine: str = "auto", statistics: Union["AQS.StreamStatistics", None] = None, on_progress: Union[Callable[["AQS.StreamStatistics"], None], None] = None, progress_interval: int = 10000) -> Iterator["AQS.StreamResult"]:
+        """_summary_
+            Lazily validate the answers read from a stream, only one record (or chunk) is kept in memory at a time.
+
+        Args:
+            source (Union[Iterable[str], None]): _description_: A text file object (or any iterable of lines), None to read stdin.
+            answer_type (Union[str, Dict[Union[str, int], str]]): _description_: The answer type, or a schema mapping the csv columns / jsonl fields to their answer type.
+            source_format (str, optional): _description_: "lines", "csv" or "jsonl". Defaults to "lines".
+            field (Union[str, int, None], optional): _description_: The csv column (name or index) or jsonl field to check when a single answer type is given. Defaults to None.
+            chunk_size (int, optional): _description_: When above 0, the results are yielded as a ResponseBatch of up to chunk_size records. Defaults to 0.
+            engine (str, optional): _description_: The engine used for the chunks (see test_inputs). Defaults to "auto".
+            statistics (Union[StreamStatistics, None], optional): _description_: The object in which the counters and the throughput are updated. Defaults to None.
+            on_progress (Union[Callable[[StreamStatistics], None], None], optional): _description_: Called with the statistics every progress_interval records and once the stream is exhausted. Defaults to None.
+            progress_interval (int, optional): _description_: The number of records between two progress calls. Defaults to 10000.
+
+        Yields:
+            Iterator[StreamResult]: _description_: An AskQuestionResponse (or a ResponseBatch when chunked) per record, wrapped in a dictionary keyed by field when a schema is used.
+        """
+        return AQS.validate_stream(
+            self,
+            source,
+            answer_type,
+            source_format=source_format,
+            field=field,
+            chunk_size=chunk_size,
+            engine=engine,
+            statistics=statistics,
+            on_progress=on_progress,
+            progress_interval=progress_interval
+        )
 
     def ask_question_detailed(self, question: str, answer_type: str) -> AskQuestionResponse:
         """_summary_
@@ -403,38 +470,98 @@ class AskQuestion:
         Returns:
             Dict[str, Union[str, int, float, bool, List[Any]]]: _description_: A dictionary with the details of the details of the responses.
         """
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            start = perf_counter()
+            attempts = 0
+            reading = 0.0
+        validator = self.compile(answer_type)
         answer_found = False
         usr_answer = ""
+        user_answer: Union[str, int, float, None, bool] = ""
         self.usr_answer = ""
+        read_answer = self.input_provider.read_answer
         while answer_found != self.answer_was_found:
-            usr_answer = input(str(question))
-            provided_answer: AskQuestionResponse = self.test_input(
-                usr_answer,
-                answer_type,
-                print_error=False
-            )
-            provided_answer.question = str(question)
-            if self._answer_found_key in provided_answer:
-                answer_found = provided_answer[self._answer_found_key]
-                if answer_found is False:
-                    print(provided_answer[self._message_key])
-            if self._usr_answer_key in provided_answer:
-                self.usr_answer = provided_answer[self._usr_answer_key]
-        return provided_answer
+            if instrumentation is None:
+                usr_answer = read_answer(str(question))
+                answer_found, user_answer, message = validator.validate(
+                    usr_answer
+                )
+            else:
+                read_start = perf_counter()
+                usr_answer = read_answer(str(question))
+                reading += perf_counter() - read_start
+                attempts += 1
+                response = self._check_input_instrumented(usr_answer, answer_type, tui=self.in_tui)
+                answer_found = response[self._answer_found_key]
+                user_answer = response[self._usr_answer_key]
+                message = response[self._message_key]
+            if answer_found is False:
+                self.input_provider.display(message)
+        self.usr_answer = user_answer
+        if instrumentation is not None:
+            instrumentation.record_question(str(question), answer_type, attempts, perf_counter() - start, {
+                AQM.STAGE_READ_ANSWER: reading
+            })
+        return self._create_response(usr_answer, "", self.answer_was_found, user_answer, answer_type, str(question))
 
     def ask_question(self, question: str, answer_type: str) -> Union[str, int, float,  None, bool, List[Any]]:
         """ Ask a question and continue asking until type met """
         response: AskQuestionResponse = self.ask_question_detailed(
             question, answer_type
         )
-        return response.user_answer
+        return response[self._usr_answer_key]
 
     def pause(self, pause_message: str = "Press enter to continue...") -> None:
         """ Act like the windows batch pause function """
         empty = ""
-        pause_response = input(pause_message)
+        pause_response = self.input_provider.read_answer(pause_message)
         empty += pause_response
 
+    async def ask_question_detailed_async(self, question: str, answer_type: str, reader: Union["StreamReader", None] = None, writer: Union["StreamWriter", None] = None, timeout: Union[float, None] = None) -> AskQuestionResponse:
+        """_summary_
+            Ask a question and continue asking until suffisant response is met, without blocking the event loop.
+
+        Args:
+            question (str): _description_: The question you wish to display to the user.
+            answer_type (str): _description_: The type of answer expected of the user.
+            reader (Union[StreamReader, None], optional): _description_: Where the answers are read from. Defaults to None (stdin).
+            writer (Union[StreamWriter, None], optional): _description_: Where the question and the error messages are written. Defaults to None (stdout).
+            timeout (Union[float, None], optional): _description_: The number of seconds given to answer. Defaults to None (no limit).
+
+        Raises:
+            asyncio.TimeoutError: _description_: When no valid answer was given in time.
+            EOFError: _description_: When the reader is closed before a valid answer.
+
+        Returns:
+            AskQuestionResponse: _description_: The details of the response.
+        """
+        response = await _import_async().ask_question_detailed(
+            self,
+            question,
+            answer_type,
+            reader=reader,
+            writer=writer,
+            timeout=timeout
+        )
+        self.usr_answer = response[self._usr_answer_key]
+        return response
+
+    async def ask_question_async(self, question: str, answer_type: str, reader: Union["StreamReader", None] = None, writer: Union["StreamWriter", None] = None, timeout: Union[float, None] = None) -> Union[str, int, float,  None, bool, List[Any]]:
+        """ Ask a question and continue asking until type met, without blocking the event loop """
+        response = await self.ask_question_detailed_async(
+            question,
+            answer_type,
+            reader=reader,
+            writer=writer,
+            timeout=timeout
+        )
+        return response[self._usr_answer_key]
+
+    async def pause_async(self, pause_message: str = "Press enter to continue...", reader: Union["StreamReader", None] = None, writer: Union["StreamWriter", None] = None, timeout: Union[float, None] = None) -> None:
+        """ Act like the windows batch pause function, without blocking the event loop """
+        await _import_async().pause(pause_message, reader=reader, writer=writer, timeout=timeout)
+
 
 if __name__ == "__main__":
     print("tui=True, allow_blank=False")
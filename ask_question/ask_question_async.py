@@ -0,0 +1,153 @@
+"""
+File in charge of asking questions without blocking the asyncio event loop.
+The answers are read from asyncio streams (stdin by default, or any
+StreamReader such as a socket) so other tasks keep running while a
+human is typing, and every prompt can be cancelled or given a timeout.
+"""
+
+import asyncio
+import os
+import sys
+from typing import Any, AsyncIterator, Callable, Dict, Tuple, Union, TYPE_CHECKING
+
+from .ask_question_response_paquet import AskQuestionResponse
+
+if TYPE_CHECKING:
+    from .ask_question import AskQuestion
+
+ENCODING = "utf-8"
+
+# The stdin reader of each event loop and the generator closing it when the loop ends, stdin can only be connected once per loop
+_STDIN_READERS: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.StreamReader, Any]] = {}
+
+
+def _restore_blocking(fd: int, blocking: bool) -> None:
+    """ Put stdin back in the blocking mode it had before it was connected to a loop """
+    try:
+        os.set_blocking(fd, blocking)
+    except OSError:
+        # stdin was closed in the meantime
+        pass
+
+
+class _StdinProtocol(asyncio.StreamReaderProtocol):
+    """ Reads stdin, puts it back in its blocking mode when the pipe is closed (end of the input or end of the loop) """
+
+    def __init__(self, reader: asyncio.StreamReader, fd: int, blocking: bool) -> None:
+        """ The globals for the class """
+        super().__init__(reader)
+        self.fd = fd
+        self.blocking = blocking
+
+    def connection_lost(self, exc: Union[Exception, None]) -> None:
+        """ Restore the blocking mode, the synchronous reads of stdin work again """
+        super().connection_lost(exc)
+        _restore_blocking(self.fd, self.blocking)
+
+
+async def _close_at_loop_end(transport: asyncio.ReadTransport, fd: int, blocking: bool) -> AsyncIterator[None]:
+    """ Close the stdin pipe when the loop ends (asyncio.run closes the pending asynchronous generators) """
+    try:
+        yield
+    finally:
+        transport.close()
+        _restore_blocking(fd, blocking)
+
+
+async def _connect_stdin() -> Union[asyncio.StreamReader, None]:
+    """ Get a stream reader on stdin for the running loop, None when stdin cannot be read asynchronously (Windows, regular files) """
+    loop = asyncio.get_running_loop()
+    connection = _STDIN_READERS.get(loop)
+    if connection is not None:
+        return connection[0]
+    reader = asyncio.StreamReader()
+    pipe = None
+    try:
+        # connect_read_pipe makes stdin non blocking, a later input() would fail without the restore
+        fd = sys.stdin.fileno()
+        blocking = os.get_blocking(fd)
+        # A duplicate is connected, closing the transport must not close sys.stdin
+        pipe = os.fdopen(os.dup(fd), "rb", buffering=0)
+        transport, _ = await loop.connect_read_pipe(
+            lambda: _StdinProtocol(reader, fd, blocking),
+            pipe
+        )
+    except (NotImplementedError, ValueError, OSError, AttributeError):
+        if pipe is not None:
+            pipe.close()
+        return None
+    closer = _close_at_loop_end(transport, fd, blocking)
+    await closer.__anext__()
+    for known_loop in [known for known in _STDIN_READERS if known.is_closed()]:
+        del _STDIN_READERS[known_loop]
+    # The generator is only weakly referenced by the loop, it is kept alive here
+    _STDIN_READERS[loop] = (reader, closer)
+    return reader
+
+
+async def read_line(reader: Union[asyncio.StreamReader, None] = None) -> str:
+    """_summary_
+        Read one answer without blocking the event loop.
+
+    Args:
+        reader (Union[asyncio.StreamReader, None], optional): _description_: The stream to read. Defaults to None (stdin).
+
+    Raises:
+        EOFError: _description_: When the stream is closed, like input().
+
+    Returns:
+        str: _description_: The line read, without the line ending.
+    """
+    if reader is None:
+        reader = await _connect_stdin()
+    if reader is None:
+        # Last resort, a thread blocked on stdin (the thread cannot be interrupted by a cancellation)
+        line = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+    else:
+        raw_line = await reader.readline()
+        line = raw_line.decode(ENCODING, errors="replace")
+    if line == "":
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\r\n")
+
+
+async def write(text: str, writer: Union[asyncio.StreamWriter, None] = None) -> None:
+    """ Display text on the writer (stdout by default) """
+    if writer is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    writer.write(text.encode(ENCODING))
+    await writer.drain()
+
+
+async def _ask_until_valid(answer_question: "AskQuestion", question: str, answer_type: str, reader: Union[asyncio.StreamReader, None], writer: Union[asyncio.StreamWriter, None], on_answer: Union[Callable[[bool], None], None] = None) -> AskQuestionResponse:
+    """ Ask the question until the answer matches the type, on_answer is called with answer_found for every answer read """
+    validator = answer_question.compile(answer_type)
+    while True:
+        await write(question, writer)
+        usr_answer = await read_line(reader)
+        answer_found, user_answer, message = validator.validate(usr_answer)
+        if on_answer is not None:
+            on_answer(answer_found)
+        if answer_found is True:
+            return answer_question._create_response(usr_answer, "", True, user_answer, answer_type, question)
+        await write(f"{message}\n", writer)
+
+
+async def ask_question_detailed(answer_question: "AskQuestion", question: str, answer_type: str, reader: Union[asyncio.StreamReader, None] = None, writer: Union[asyncio.StreamWriter, None] = None, timeout: Union[float, None] = None) -> AskQuestionResponse:
+    """_summary_
+        Ask a question until a valid answer is given, see AskQuestion.ask_question_detailed_async.
+    """
+    return await asyncio.wait_for(
+        _ask_until_valid(answer_question, str(question), answer_type, reader, writer),
+        timeout
+    )
+
+
+async def pause(pause_message: str = "Press enter to continue...", reader: Union[asyncio.StreamReader, None] = None, writer: Union[asyncio.StreamWriter, None] = None, timeout: Union[float, None] = None) -> None:
+    """ Wait for the user to press enter, see AskQuestion.pause_async """
+    async def _pause() -> None:
+        await write(pause_message, writer)
+        await read_line(reader)
+    await asyncio.wait_for(_pause(), timeout)
@@ -0,0 +1,535 @@
+"""
+File in charge of checking an answer one character at a time.
+Every parser of a compiled validator is turned into a small state machine,
+adding (or removing) a character only moves the machines by one step, so
+an answer being typed is checked in constant time per key press instead of
+validating the whole answer again.
+The status of the answer typed so far is one of:
+    VALID:      the answer is accepted as it is
+    INCOMPLETE: the answer is refused, but adding characters can make it valid
+    INVALID:    the answer is refused whatever is added after it
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Union
+
+try:
+    from . import ask_question_validator as AQV
+except ImportError:
+    try:
+        import ask_question_validator as AQV
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_validator not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+VALID = "valid"
+INCOMPLETE = "incomplete"
+INVALID = "invalid"
+
+# The number of transitions remembered per validator before the memory is cleared
+MAX_TRANSITIONS = 1 << 16
+
+MachineState = Any
+
+# The state of a parser that can never accept the answer
+DEAD = None
+
+
+def _max_int_digits() -> int:
+    """ The number of digits int accepts (0 when there is no limit) """
+    get_limit = getattr(sys, "get_int_max_str_digits", None)
+    if get_limit is None:
+        return 0
+    return get_limit()
+
+
+class _Machine(ABC):
+    """ The state machine of a parser, step returns DEAD when no answer starting with the characters can be accepted """
+
+    start: MachineState = 0
+
+    @abstractmethod
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Get the state after a character """
+
+    @abstractmethod
+    def accepts(self, state: MachineState) -> bool:
+        """ Check if the answer leading to the state is accepted """
+
+
+class _PredicateMachine(_Machine):
+    """ Answers made of characters that all match a predicate (alnum, alpha, ascii, str, uint, num) """
+
+    def __init__(self, predicate: Callable[[str], bool], max_length: int = 0) -> None:
+        """ The globals for the class """
+        self.predicate = predicate
+        self.max_length = max_length
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Count the characters while they match """
+        if self.predicate(char) is False:
+            return DEAD
+        if self.max_length > 0 and state >= self.max_length:
+            return DEAD
+        return state + 1
+
+    def accepts(self, state: MachineState) -> bool:
+        """ At least one character """
+        return state > 0
+
+
+class _AnyMachine(_Machine):
+    """ Any answer (up, low) """
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Every character is accepted """
+        return 1
+
+    def accepts(self, state: MachineState) -> bool:
+        """ At least one character """
+        return state == 1
+
+
+class _BoolMachine(_Machine):
+    """ Answers containing one of the letters of yes/true/1 or no/false/0 """
+
+    letters = frozenset("ytn1f0")
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Remember that a letter was found """
+        if state == 1 or self.letters.isdisjoint(char.lower()) is False:
+            return 1
+        return 0
+
+    def accepts(self, state: MachineState) -> bool:
+        """ One of the letters was found """
+        return state == 1
+
+
+class _VersionMachine(_Machine):
+    """ Digits separated by '.' or ',', not ending with a separator, state is (has_digit, last_is_digit) """
+
+    start = (False, False)
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Accept the digits and the separators """
+        if char == "." or char == ",":
+            return (state[0], False)
+        if char.isdigit() is True:
+            return (True, True)
+        return DEAD
+
+    def accepts(self, state: MachineState) -> bool:
+        """ At least one digit and no separator at the end """
+        return state[0] is True and state[1] is True
+
+
+# The phases of the int machine
+_START, _SIGN, _DIGITS, _UNDERSCORE = range(4)
+
+
+class _IntMachine(_Machine):
+    """ The answers accepted by int once cleaned (spaces, dots and commas dropped, only the first '-' kept), state is (phase, minus_seen, digits) """
+
+    start = (_START, False, 0)
+
+    def __init__(self, illegal_characters: FrozenSet[str], max_digits: int) -> None:
+        """ The globals for the class """
+        self.illegal_characters = illegal_characters
+        self.max_digits = max_digits
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Follow the grammar of int on the cleaned answer """
+        if char in self.illegal_characters:
+            return DEAD
+        phase, minus_seen, digits = state
+        if char == " " or char == "." or char == ",":
+            return state
+        if char == "-":
+            if minus_seen is True:
+                return state
+            if phase != _START:
+                return DEAD
+            return (_SIGN, True, digits)
+        if char == "+":
+            if phase != _START:
+                return DEAD
+            return (_SIGN, minus_seen, digits)
+        if char.isdecimal() is True:
+            digits += 1
+            if self.max_digits > 0 and digits > self.max_digits:
+                return DEAD
+            return (_DIGITS, minus_seen, digits)
+        if char == "_" and phase == _DIGITS:
+            return (_UNDERSCORE, minus_seen, digits)
+        return DEAD
+
+    def accepts(self, state: MachineState) -> bool:
+        """ The answer ends with a digit """
+        return state[0] == _DIGITS
+
+
+# The phases of the float machine
+(
+    _F_START, _F_SIGN, _F_INT, _F_INT_UNDERSCORE, _F_DOT, _F_INT_DOT,
+    _F_FRACTION, _F_FRACTION_UNDERSCORE, _F_EXPONENT, _F_EXPONENT_SIGN,
+    _F_EXPONENT_DIGITS, _F_EXPONENT_UNDERSCORE, _F_WORD, _F_TRAILING
+) = range(14)
+
+_F_ACCEPTING = frozenset((_F_INT, _F_INT_DOT, _F_FRACTION, _F_EXPONENT_DIGITS))
+_F_WORDS = ("infinity", "nan")
+_F_ACCEPTED_WORDS = frozenset(("inf", "infinity", "nan"))
+
+
+def _float_step(phase: int, word: str, char: str) -> Tuple[int, str]:
+    """ Follow the grammar of float (without the surrounding spaces), returns (-1, '') when the answer can never be a float """
+    if char.isdecimal() is True:
+        if phase in (_F_START, _F_SIGN, _F_INT, _F_INT_UNDERSCORE):
+            return (_F_INT, "")
+        if phase in (_F_DOT, _F_INT_DOT, _F_FRACTION, _F_FRACTION_UNDERSCORE):
+            return (_F_FRACTION, "")
+        if phase in (_F_EXPONENT, _F_EXPONENT_SIGN, _F_EXPONENT_DIGITS, _F_EXPONENT_UNDERSCORE):
+            return (_F_EXPONENT_DIGITS, "")
+        return (-1, "")
+    if char == "_":
+        underscore = {_F_INT: _F_INT_UNDERSCORE, _F_FRACTION: _F_FRACTION_UNDERSCORE, _F_EXPONENT_DIGITS: _F_EXPONENT_UNDERSCORE}
+        return (underscore.get(phase, -1), "")
+    if char == "+" or char == "-":
+        if phase == _F_START:
+            return (_F_SIGN, "")
+        if phase == _F_EXPONENT:
+            return (_F_EXPONENT_SIGN, "")
+        return (-1, "")
+    if char == ".":
+        if phase in (_F_START, _F_SIGN):
+            return (_F_DOT, "")
+        if phase == _F_INT:
+            return (_F_INT_DOT, "")
+        return (-1, "")
+    lowered = char.lower() if char.isascii() is True else ""
+    if lowered == "e" and phase in (_F_INT, _F_INT_DOT, _F_FRACTION):
+        return (_F_EXPONENT, "")
+    if phase in (_F_START, _F_SIGN, _F_WORD) and lowered != "":
+        word += lowered
+        if any(name.startswith(word) for name in _F_WORDS):
+            return (_F_WORD, word)
+    return (-1, "")
+
+
+def _float_accepts(phase: int, word: str) -> bool:
+    """ Check if the phase ends a float """
+    if phase == _F_WORD:
+        return word in _F_ACCEPTED_WORDS
+    return phase in _F_ACCEPTING
+
+
+class _FloatMachine(_Machine):
+    """ The answers accepted by float once cleaned (spaces dropped, commas read as dots, only the first '.' and '-' kept), state is (phase, word, dot_seen, minus_seen) """
+
+    start = (_F_START, "", False, False)
+
+    def __init__(self, illegal_characters: FrozenSet[str]) -> None:
+        """ The globals for the class """
+        self.illegal_characters = illegal_characters
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Clean the character and follow the grammar of float """
+        if char in self.illegal_characters:
+            return DEAD
+        phase, word, dot_seen, minus_seen = state
+        if char == " ":
+            return state
+        if char == ",":
+            char = "."
+        if char == ".":
+            if dot_seen is True:
+                return state
+            dot_seen = True
+        elif char == "-":
+            if minus_seen is True:
+                return state
+            minus_seen = True
+        phase, word = _float_step(phase, word, char)
+        if phase == -1:
+            return DEAD
+        return (phase, word, dot_seen, minus_seen)
+
+    def accepts(self, state: MachineState) -> bool:
+        """ The cleaned answer is a float """
+        return _float_accepts(state[0], state[1])
+
+
+class _UnsignedFloatMachine(_Machine):
+    """ The answers accepted by float as they are (surrounding spaces allowed) that do not start with '-', state is (phase, word, started) """
+
+    start = (_F_START, "", False)
+
+    def step(self, state: MachineState, char: str) -> MachineState:
+        """ Follow the grammar of float with the surrounding spaces """
+        phase, word, started = state
+        if started is False and char == "-":
+            return DEAD
+        if char.isspace() is True:
+            if phase == _F_START:
+                return (_F_START, "", True)
+            if phase == _F_TRAILING or _float_accepts(phase, word) is True:
+                return (_F_TRAILING, "", True)
+            return DEAD
+        if phase == _F_TRAILING:
+            return DEAD
+        phase, word = _float_step(phase, word, char)
+        if phase == -1:
+            return DEAD
+        return (phase, word, True)
+
+    def accepts(self, state: MachineState) -> bool:
+        """ The answer is a float """
+        return state[0] == _F_TRAILING or _float_accepts(state[0], state[1])
+
+
+def _build_machine(parser: AQV.AnswerParser, validator: "AQV.AskQuestionValidator") -> Union[_Machine, None]:
+    """ Get the state machine of a parser, None when there is none """
+    max_digits = _max_int_digits()
+    machines: Dict[AQV.AnswerParser, Callable[[], _Machine]] = {
+        AQV._parse_int: lambda: _IntMachine(validator.illegal_characters, max_digits),
+        AQV._parse_float: lambda: _FloatMachine(validator.illegal_characters),
+        AQV._parse_uint: lambda: _PredicateMachine(str.isdecimal, max_digits),
+        AQV._parse_ufloat: _UnsignedFloatMachine,
+        AQV._parse_num: lambda: _PredicateMachine(str.isdecimal),
+        AQV._parse_alnum: lambda: _PredicateMachine(str.isalnum),
+        AQV._parse_alpha: lambda: _PredicateMachine(str.isalpha),
+        AQV._parse_ascii: lambda: _PredicateMachine(str.isascii),
+        AQV._parse_str: lambda: _PredicateMachine(AQV.PRINTABLE_CHARACTERS.__contains__),
+        AQV._parse_version: _VersionMachine,
+        AQV._parse_bool: _BoolMachine,
+        AQV._parse_to_up: _AnyMachine,
+        AQV._parse_to_low: _AnyMachine,
+    }
+    factory = machines.get(parser)
+    if factory is None:
+        return None
+    return factory()
+
+
+class IncrementalMachine:
+    """ The state machine of a whole validator, the states of its parsers plus the blank and printable checks, transitions are remembered once computed """
+
+    def __init__(self, validator: "AQV.AskQuestionValidator") -> None:
+        """ The globals for the class """
+        self.validator = validator
+        machines = [_build_machine(parser, validator) for parser in validator.parsers]
+        # Parsers without a state machine (custom ones) make every status a full validation
+        self.supported = all(machine is not None for machine in machines)
+        self.machines: Tuple[_Machine, ...] = tuple(
+            machine for machine in machines if machine is not None
+        )
+        # (only spaces so far, a non printable character was found, the parser states)
+        self.start = (True, False, tuple(machine.start for machine in self.machines))
+        self._transitions: Dict[Tuple[Any, str], Any] = {}
+        self._statuses: Dict[Any, str] = {}
+
+    def step(self, state: Any, char: str) -> Any:
+        """ Get the state after a character """
+        key = (state, char)
+        following = self._transitions.get(key)
+        if following is not None:
+            return following
+        only_spaces, not_printable, parser_states = state
+        following = (
+            only_spaces is True and char.isspace() is True,
+            not_printable is True or char.isprintable() is False,
+            tuple(
+                DEAD if parser_state is DEAD else machine.step(parser_state, char)
+                for machine, parser_state in zip(self.machines, parser_states)
+            )
+        )
+        if len(self._transitions) >= MAX_TRANSITIONS:
+            self._transitions.clear()
+            self._statuses.clear()
+        self._transitions[key] = following
+        return following
+
+    def status(self, state: Any) -> str:
+        """ Get the status of the answer leading to the state """
+        status = self._statuses.get(state)
+        if status is not None:
+            return status
+        only_spaces, not_printable, parser_states = state
+        alive = any(parser_state is not DEAD for parser_state in parser_states)
+        if only_spaces is True:
+            # Blank answers, adding a visible character is the only way to change the result
+            if self.validator.allow_blank is True:
+                status = VALID
+            elif not_printable is False and alive is True:
+                status = INCOMPLETE
+            else:
+                status = INVALID
+        elif not_printable is True or alive is False:
+            status = INVALID
+        elif any(
+            parser_state is not DEAD and machine.accepts(parser_state)
+            for machine, parser_state in zip(self.machines, parser_states)
+        ):
+            status = VALID
+        else:
+            status = INCOMPLETE
+        self._statuses[state] = status
+        return status
+
+
+class IncrementalValidator:
+    """ An answer being typed (or read by chunks), checked one character at a time """
+
+    def __init__(self, validator: "AQV.AskQuestionValidator", history: bool = True) -> None:
+        """_summary_
+            Check an answer one character at a time, the characters are added with feed (or push).
+
+        Args:
+            validator (AQV.AskQuestionValidator): _description_: The compiled validator of the answer type.
+            history (bool, optional): _description_: Keep the answer and the state after every character so that characters can be removed (pop, set_text). Without it only the last state is kept, for the answers too long to be kept in memory. Defaults to True.
+        """
+        self.validator = validator
+        self.machine = validator.incremental_machine()
+        self.history = history
+        self.text = ""
+        # The number of characters of the answer, the ones after the first refused character are not checked
+        self.length = 0
+        self._checked = 0
+        # The state after every checked character (only the last one without history), the first one is the state of the empty answer
+        self._states: List[Any] = [self.machine.start]
+        # What validate looks at in the characters that are not checked: are they all spaces, is one of them not printable
+        self._unchecked_blank = True
+        self._unchecked_not_printable = False
+
+    @property
+    def status(self) -> str:
+        """ The status of the answer typed so far """
+        if self.machine.supported is False:
+            answer_found = self.validator.validate(self.text)[0]
+            return VALID if answer_found is True else INCOMPLETE
+        return self.machine.status(self._states[-1])
+
+    @property
+    def is_valid(self) -> bool:
+        """ True when the answer typed so far is accepted """
+        return self.status == VALID
+
+    @property
+    def can_become_valid(self) -> bool:
+        """ True when the answer typed so far is accepted or can still be accepted once characters are added """
+        return self.status != INVALID
+
+    @property
+    def message(self) -> str:
+        """ The message validate gives to the answer typed so far when it is refused (empty when it is not) """
+        status = self.status
+        if status == VALID:
+            return ""
+        if self.machine.supported is True:
+            only_spaces, not_printable, _ = self._states[-1]
+            # validate checks the whole answer for blanks and non printable characters before the parsers
+            if self._checked < self.length:
+                only_spaces = only_spaces is True and self._unchecked_blank is True
+                not_printable = not_printable is True or self._unchecked_not_printable is True
+            if only_spaces is True or not_printable is True:
+                return AQV.EMPTY_RESPONSE_MESSAGE
+        return self.validator.error_message
+
+    def push(self, characters: str) -> str:
+        """ Add characters at the end of the answer, returns the new status """
+        machine = self.machine
+        all_checked = self._checked == self.length
+        # Parsers without a state machine check the whole answer, it is kept even without history
+        if self.history is True or machine.supported is False:
+            self.text += characters
+        self.length += len(characters)
+        # Once refused, adding characters cannot change the status, they are not checked
+        if machine.supported is False:
+            return self.status
+        if all_checked is False:
+            self._skip(characters)
+            return self.status
+        step = machine.step
+        status = machine.status
+        states = self._states
+        state = states[-1]
+        checked = self._checked
+        for char in characters:
+            state = step(state, char)
+            checked += 1
+            if self.history is True:
+                states.append(state)
+            if status(state) == INVALID:
+                break
+        if self.history is False:
+            states[0] = state
+        self._skip(characters[checked - self._checked:])
+        self._checked = checked
+        return self.status
+
+    # The name used when the answer is read by chunks
+    feed = push
+
+    def pop(self, count: int = 1) -> str:
+        """ Remove characters from the end of the answer, returns the new status """
+        self._require_history()
+        count = min(count, self.length)
+        if count > 0:
+            self.length -= count
+            self.text = self.text[:-count]
+            if self._checked > self.length:
+                del self._states[self.length + 1:]
+                self._checked = self.length
+            self._unchecked_blank = True
+            self._unchecked_not_printable = False
+            if self.machine.supported is True:
+                self._skip(self.text[self._checked:])
+        return self.status
+
+    def reset(self) -> None:
+        """ Forget the answer """
+        self.text = ""
+        self.length = 0
+        self._checked = 0
+        self._states = [self.machine.start]
+        self._unchecked_blank = True
+        self._unchecked_not_printable = False
+
+    def set_text(self, text: str) -> str:
+        """ Replace the answer, only the characters after the common beginning are checked again, returns the new status """
+        self._require_history()
+        previous = self.text
+        if text == previous:
+            return self.status
+        common = 0
+        limit = min(len(text), len(previous))
+        # Typing and deleting at the end are the usual edits, check them first
+        if text.startswith(previous):
+            common = len(previous)
+        elif previous.startswith(text):
+            common = len(text)
+        else:
+            while common < limit and text[common] == previous[common]:
+                common += 1
+        self.pop(len(previous) - common)
+        return self.push(text[common:])
+
+    def _skip(self, characters: str) -> None:
+        """ Remember what validate looks at in the characters added after the answer was refused """
+        if characters == "":
+            return
+        if self._unchecked_blank is True and characters.isspace() is False:
+            self._unchecked_blank = False
+        if self._unchecked_not_printable is False and characters.isprintable() is False:
+            self._unchecked_not_printable = True
+
+    def _require_history(self) -> None:
+        """ Refuse the edits that need the previous states when they are not kept """
+        if self.history is False:
+            raise ValueError("Characters can only be removed from an IncrementalValidator created with history=True")
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.validator.answer_type!r}, length={self.length}, status={self.status!r})"
@@ -0,0 +1,285 @@
+"""
+File in charge of providing the answers to the questions.
+By default the answers are typed in the terminal (input), when stdin is
+a pipe or a file its lines are read without displaying the prompts, and the
+answers can also come from a list, a file (read in large chunks),
+environment variables or any function.
+"""
+
+import builtins
+import codecs
+import os
+import re
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, Iterator, Mapping, TextIO, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# The input function of the interpreter, to know when it was replaced (unittest.mock.patch for instance)
+_BUILTIN_INPUT = builtins.input
+
+
+def read_lines(stream: Any, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8") -> Iterator[str]:
+    """_summary_
+        Lazily split a stream into lines, reading it in large chunks.
+
+    Args:
+        stream (Any): _description_: A text or binary file object, read1 is used when available so a pipe is never waited on for more than what is already written.
+        chunk_size (int, optional): _description_: The number of bytes (or characters) read at once. Defaults to DEFAULT_CHUNK_SIZE.
+        encoding (str, optional): _description_: The encoding of the binary streams. Defaults to "utf-8".
+
+    Yields:
+        Iterator[str]: _description_: The lines, without the line endings.
+    """
+    read = getattr(stream, "read1", stream.read)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line[:-1] if line.endswith("\r") else line
+    pending += decoder.decode(b"", final=True)
+    if pending != "":
+        yield pending[:-1] if pending.endswith("\r") else pending
+
+
+def _strip_line_ending(line: str) -> str:
+    """ Remove the line ending of a line read from a text stream """
+    if line.endswith("\n"):
+        line = line[:-1]
+    return line[:-1] if line.endswith("\r") else line
+
+
+class InputProvider(ABC):
+    """ The source of the answers, read_answer behaves like input (EOFError when there is nothing left) """
+
+    # False when nobody is typing the answers
+    interactive = True
+
+    @abstractmethod
+    def read_answer(self, prompt: str = "") -> str:
+        """ Display the prompt and return the answer """
+
+    def display(self, message: str) -> None:
+        """ Display a message (the error messages of the refused answers) """
+        print(message)
+
+    def __call__(self, prompt: str = "") -> str:
+        """ Shortcut for read_answer """
+        return self.read_answer(prompt)
+
+
+class TTYInputProvider(InputProvider):
+    """ The answers typed in the terminal, read with input """
+
+    def read_answer(self, prompt: str = "") -> str:
+        """ Display the prompt and return the answer """
+        # Looked up on every call so that replacing builtins.input keeps working
+        return builtins.input(prompt)
+
+
+class BufferedInputProvider(InputProvider):
+    """ Answers prepared in advance (a list, a generator, the lines of a file, ...) """
+
+    interactive = False
+
+    def __init__(self, answers: Iterable[str], output: Union[TextIO, None] = None) -> None:
+        """_summary_
+            Read the answers from an iterable.
+
+        Args:
+            answers (Iterable[str]): _description_: The answers, consumed lazily in order.
+            output (Union[TextIO, None], optional): _description_: Where the prompts and the answers are echoed (without flushing), None to hide them. Defaults to None.
+        """
+        self.answers: Iterator[str] = iter(answers)
+        self.output = output
+        self.pending: Deque[str] = deque()
+
+    def push(self, *answers: str) -> None:
+        """ Add answers to read before the remaining ones """
+        self.pending.extendleft(reversed(answers))
+
+    def read_answer(self, prompt: str = "") -> str:
+        """ Return the next answer, EOFError when there is none left """
+        if len(self.pending) > 0:
+            answer = self.pending.popleft()
+        else:
+            answer = next(self.answers, None)
+            if answer is None:
+                raise EOFError("EOF when reading a line")
+        if self.output is not None:
+            self.output.write(f"{prompt}{answer}\n")
+        return answer
+
+    def display(self, message: str) -> None:
+        """ Display a message, with the echoed prompts when there is an output """
+        if self.output is not None:
+            self.output.write(f"{message}\n")
+        else:
+            print(message)
+
+
+class FileInputProvider(BufferedInputProvider):
+    """ The answers of a file (or of a stream such as stdin), one per line, read in large chunks """
+
+    def __init__(self, source: Union[str, os.PathLike, Any], output: Union[TextIO, None] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8") -> None:
+        """_summary_
+            Read the answers from a file.
+
+        Args:
+            source (Union[str, os.PathLike, Any]): _description_: The path of the answer file or a file object.
+            output (Union[TextIO, None], optional): _description_: Where the prompts and the answers are echoed, None to hide them. Defaults to None.
+            chunk_size (int, optional): _description_: The number of bytes read at once. Defaults to DEFAULT_CHUNK_SIZE.
+            encoding (str, optional): _description_: The encoding of the file. Defaults to "utf-8".
+        """
+        self.file = None
+        if isinstance(source, (str, os.PathLike)):
+            source = self.file = open(source, "rb")
+        elif hasattr(source, "buffer"):
+            # Read the bytes directly, the text layer would wait for whole chunks on a pipe
+            source = source.buffer
+        super().__init__(read_lines(source, chunk_size, encoding), output)
+
+    def close(self) -> None:
+        """ Close the file opened by the provider """
+        if self.file is not None:
+            self.file.close()
+
+    def __enter__(self) -> "FileInputProvider":
+        """ Use the provider as a context manager """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """ Close the file when leaving the context """
+        self.close()
+
+
+class EnvironmentInputProvider(InputProvider):
+    """ The answers stored in environment variables, the variable of a question is the prefix followed by the question in uppercase """
+
+    interactive = False
+
+    def __init__(self, prefix: str = "ASK_QUESTION_", variables: Union[Mapping[str, str], None] = None, fallback: Union[InputProvider, None] = None, environ: Union[Mapping[str, str], None] = None) -> None:
+        """_summary_
+            Read the answers from the environment.
+
+        Args:
+            prefix (str, optional): _description_: The prefix of the variables. Defaults to "ASK_QUESTION_".
+            variables (Union[Mapping[str, str], None], optional): _description_: The variable to use for some questions, by question. Defaults to None.
+            fallback (Union[InputProvider, None], optional): _description_: The provider used when the variable is not set. Defaults to None (EOFError).
+            environ (Union[Mapping[str, str], None], optional): _description_: The variables to use. Defaults to None (os.environ).
+        """
+        self.prefix = prefix
+        self.variables = dict(variables) if variables is not None else {}
+        self.fallback = fallback
+        self.environ = os.environ if environ is None else environ
+
+    def variable_name(self, prompt: str) -> str:
+        """ Get the name of the variable holding the answer of a question ('How old are you?' gives ASK_QUESTION_HOW_OLD_ARE_YOU) """
+        if prompt in self.variables:
+            return self.variables[prompt]
+        return self.prefix + re.sub(r"[^0-9A-Za-z]+", "_", prompt).strip("_").upper()
+
+    def read_answer(self, prompt: str = "") -> str:
+        """ Return the value of the variable of the question """
+        answer = self.environ.get(self.variable_name(prompt))
+        if answer is not None:
+            return answer
+        if self.fallback is not None:
+            return self.fallback.read_answer(prompt)
+        raise EOFError(f"The variable {self.variable_name(prompt)} is not set")
+
+    def display(self, message: str) -> None:
+        """ Display the messages with the fallback, a refused variable cannot be fixed by the user """
+        if self.fallback is not None:
+            self.fallback.display(message)
+        else:
+            print(message)
+
+
+class CallableInputProvider(InputProvider):
+    """ The answers returned by a function receiving the question """
+
+    def __init__(self, function: Callable[[str], str], interactive: bool = False) -> None:
+        """ The globals for the class """
+        self.function = function
+        self.interactive = interactive
+
+    def read_answer(self, prompt: str = "") -> str:
+        """ Return the answer given by the function """
+        return self.function(prompt)
+
+
+class AutoInputProvider(InputProvider):
+    """ Use the terminal when stdin is one, otherwise read the lines of stdin without displaying the prompts.
+    The lines are read one at a time through the buffer of sys.stdin, which is shared by every reader:
+    the other instances (and input) get the lines that follow (use a FileInputProvider on sys.stdin to read it in large chunks).
+    """
+
+    def __init__(self, output: Union[TextIO, None] = None) -> None:
+        """ The globals for the class """
+        self.output = output
+        self.tty = TTYInputProvider()
+        self.piped: Union[BufferedInputProvider, None] = None
+
+    def _select(self) -> InputProvider:
+        """ Get the provider matching the current stdin """
+        stdin = sys.stdin
+        # A replaced stdin or input (tests, wrappers) must keep receiving the calls to input
+        if builtins.input is not _BUILTIN_INPUT or stdin is None or stdin is not sys.__stdin__:
+            return self.tty
+        if self.piped is not None:
+            return self.piped
+        try:
+            if stdin.isatty():
+                return self.tty
+        except (AttributeError, ValueError):
+            return self.tty
+        # Nothing is read ahead of the answer asked, the unread lines stay in the buffer of sys.stdin
+        self.piped = BufferedInputProvider(
+            map(_strip_line_ending, iter(stdin.readline, "")),
+            output=self.output
+        )
+        return self.piped
+
+    @property
+    def interactive(self) -> bool:
+        """ True when the answers are typed by someone """
+        return self._select() is self.tty
+
+    def read_answer(self, prompt: str = "") -> str:
+        """ Display the prompt (on a terminal) and return the answer """
+        return self._select().read_answer(prompt)
+
+    def display(self, message: str) -> None:
+        """ Display a message """
+        self._select().display(message)
+
+
+def get_input_provider(source: Union[InputProvider, Callable[[str], str], Iterable[str], str, os.PathLike, None] = None) -> InputProvider:
+    """_summary_
+        Create the provider matching a source of answers.
+
+    Args:
+        source (Union[InputProvider, Callable[[str], str], Iterable[str], str, os.PathLike, None], optional): _description_: A provider, a function, a list of answers, the path of an answer file or a file object. Defaults to None (AutoInputProvider).
+
+    Returns:
+        InputProvider: _description_: The provider.
+    """
+    if source is None:
+        return AutoInputProvider()
+    if isinstance(source, InputProvider):
+        return source
+    if isinstance(source, (str, os.PathLike)) or hasattr(source, "read"):
+        return FileInputProvider(source)
+    if callable(source):
+        return CallableInputProvider(source)
+    return BufferedInputProvider(source)
@@ -0,0 +1,193 @@
+"""
+File in charge of the optional instrumentation of the checks.
+Once enabled on an AskQuestion instance, every checked answer and every
+question asked with ask_question_detailed are counted (per answer type,
+accepted or refused, which parser decided, the time spent in each stage,
+the number of retries) and the hooks are called with the details.
+While it is disabled the instance runs the plain methods, nothing is measured.
+"""
+
+import json
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+# The stages of a check, the seconds spent in each are added up
+STAGE_COMPILE = "compile"
+STAGE_BLANK = "blank"
+STAGE_ILLEGAL_CHARACTERS = "illegal_characters"
+STAGE_PARSE = "parse"
+STAGE_RESPONSE = "response"
+STAGE_READ_ANSWER = "read_answer"
+STAGES: Tuple[str, ...] = (
+    STAGE_COMPILE, STAGE_BLANK, STAGE_ILLEGAL_CHARACTERS,
+    STAGE_PARSE, STAGE_RESPONSE, STAGE_READ_ANSWER
+)
+
+# The names of the events sent to the hooks
+EVENT_VALIDATION = "validation"
+EVENT_QUESTION = "question"
+
+InstrumentationHook = Callable[[str, Dict[str, Any]], None]
+
+
+def _escape_label(value: Any) -> str:
+    """ Escape a label value of the Prometheus text format """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace("\"", "\\\"")
+
+
+class Instrumentation:
+    """ The counters of the checks and of the questions, safe to update from several threads at once """
+
+    def __init__(self, hooks: Union[List[InstrumentationHook], None] = None) -> None:
+        """ The globals for the class """
+        self._lock = Lock()
+        self.hooks: List[InstrumentationHook] = list(hooks) if hooks is not None else []
+        self.reset()
+
+    def reset(self) -> None:
+        """ Set all the counters back to 0 """
+        with self._lock:
+            # answer type -> number of checks
+            self.calls: Dict[str, int] = {}
+            self.answers_found: Dict[str, int] = {}
+            self.answers_not_found: Dict[str, int] = {}
+            # answer type -> parser (or blank, not_printable, none) -> number of checks it decided
+            self.resolutions: Dict[str, Dict[str, int]] = {}
+            # stage -> seconds
+            self.stage_seconds: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+            self.questions = 0
+            self.retries = 0
+            # number of retries -> number of questions that needed them
+            self.retries_per_question: Dict[int, int] = {}
+
+    def add_hook(self, hook: InstrumentationHook) -> InstrumentationHook:
+        """ Call a function with the name and the details of every event (can be used as a decorator) """
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: InstrumentationHook) -> None:
+        """ Stop calling a function """
+        self.hooks.remove(hook)
+
+    def _emit(self, event: str, details: Dict[str, Any]) -> None:
+        """ Send an event to the hooks """
+        for hook in self.hooks:
+            hook(event, details)
+
+    def record_validation(self, answer_type: str, answer_found: bool, resolution: str, stages: Dict[str, float]) -> None:
+        """_summary_
+            Count a checked answer.
+
+        Args:
+            answer_type (str): _description_: The answer type of the check.
+            answer_found (bool): _description_: True when the answer was accepted.
+            resolution (str): _description_: The parser that accepted the answer (blank, not_printable or none when no parser did).
+            stages (Dict[str, float]): _description_: The seconds spent in each stage of the check.
+        """
+        with self._lock:
+            self.calls[answer_type] = self.calls.get(answer_type, 0) + 1
+            found = self.answers_found if answer_found is True else self.answers_not_found
+            found[answer_type] = found.get(answer_type, 0) + 1
+            resolutions = self.resolutions.setdefault(answer_type, {})
+            resolutions[resolution] = resolutions.get(resolution, 0) + 1
+            for stage, seconds in stages.items():
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        if len(self.hooks) > 0:
+            self._emit(EVENT_VALIDATION, {
+                "answer_type": answer_type,
+                "answer_found": answer_found,
+                "resolution": resolution,
+                "stages": stages,
+            })
+
+    def record_question(self, question: str, answer_type: str, attempts: int, seconds: float, stages: Union[Dict[str, float], None] = None) -> None:
+        """_summary_
+            Count a question that received a valid answer.
+
+        Args:
+            question (str): _description_: The question asked.
+            answer_type (str): _description_: The answer type of the question.
+            attempts (int): _description_: The number of answers read, the retries are the refused ones.
+            seconds (float): _description_: The seconds spent from the question to the accepted answer.
+            stages (Union[Dict[str, float], None], optional): _description_: The seconds spent in the stages of the question that are not part of the checks (read_answer). Defaults to None.
+        """
+        retries = attempts - 1
+        if stages is None:
+            stages = {}
+        with self._lock:
+            for stage, stage_seconds in stages.items():
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + stage_seconds
+            self.questions += 1
+            self.retries += retries
+            self.retries_per_question[retries] = self.retries_per_question.get(retries, 0) + 1
+        if len(self.hooks) > 0:
+            self._emit(EVENT_QUESTION, {
+                "question": question,
+                "answer_type": answer_type,
+                "attempts": attempts,
+                "retries": retries,
+                "seconds": seconds,
+                "stages": stages,
+            })
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ Get a copy of the counters, it can be serialised as json """
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "answers_found": dict(self.answers_found),
+                "answers_not_found": dict(self.answers_not_found),
+                "resolutions": {kind: dict(counts) for kind, counts in self.resolutions.items()},
+                "stage_seconds": dict(self.stage_seconds),
+                "questions": self.questions,
+                "retries": self.retries,
+                "retries_per_question": {str(retries): count for retries, count in sorted(self.retries_per_question.items())},
+            }
+
+    def to_json(self, indent: Union[int, None] = None) -> str:
+        """ Export the counters as json """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "ask_question") -> str:
+        """ Export the counters in the Prometheus text format """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def _metric(name: str, kind: str, description: str, samples: List[Tuple[Dict[str, Any], Union[int, float]]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f"{key}=\"{_escape_label(label)}\"" for key, label in labels.items())
+                if label_text != "":
+                    label_text = "{" + label_text + "}"
+                lines.append(f"{prefix}_{name}{label_text} {value}")
+
+        _metric("validations_total", "counter", "The number of checked answers.", [
+            ({"answer_type": kind, "answer_found": "true"}, count)
+            for kind, count in snapshot["answers_found"].items()
+        ] + [
+            ({"answer_type": kind, "answer_found": "false"}, count)
+            for kind, count in snapshot["answers_not_found"].items()
+        ])
+        _metric("resolutions_total", "counter", "The number of checks decided by each parser.", [
+            ({"answer_type": kind, "resolution": resolution}, count)
+            for kind, counts in snapshot["resolutions"].items()
+            for resolution, count in counts.items()
+        ])
+        _metric("stage_seconds_total", "counter", "The seconds spent in each stage of the checks.", [
+            ({"stage": stage}, seconds) for stage, seconds in snapshot["stage_seconds"].items()
+        ])
+        _metric("questions_total", "counter", "The number of questions that received a valid answer.", [
+            ({}, snapshot["questions"])
+        ])
+        _metric("retries_total", "counter", "The number of refused answers to the questions.", [
+            ({}, snapshot["retries"])
+        ])
+        _metric("question_retries", "gauge", "The number of questions by number of retries.", [
+            ({"retries": retries}, count) for retries, count in snapshot["retries_per_question"].items()
+        ])
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.snapshot()})"
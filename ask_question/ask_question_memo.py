@@ -0,0 +1,93 @@
+"""
+File in charge of remembering the results of the checks.
+The answers of a feed are often the same few values (yes, no, 0, 1, ...),
+once enabled the result of each (answer, answer type, configuration) is
+kept in a bounded LRU memo so that the next identical answers skip the check.
+The results are immutable tuples, every response built from them is a new one.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Union
+
+# The number of results kept by default
+DEFAULT_MEMO_SIZE = 4096
+
+
+class AnswerMemo:
+    """ A bounded LRU memo of the results of the checks, safe to use from several threads at once.
+    A lookup is a single get and move_to_end of an OrderedDict, which are atomic, a lock would cost more than most checks
+    (the statistics can miss a few counts when several threads update them at once).
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MEMO_SIZE) -> None:
+        """ The globals for the class """
+        if max_size < 1:
+            raise ValueError("The memo must be able to keep at least one result")
+        self.max_size = max_size
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Union[Any, None]:
+        """ Get the result remembered for a key, None when there is none """
+        results = self._results
+        result = results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        try:
+            results.move_to_end(key)
+        except KeyError:
+            # Forgotten by another thread in the meantime, the result is still valid
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """ Remember a result, the least recently used one is forgotten when the memo is full """
+        results = self._results
+        results[key] = result
+        if len(results) > self.max_size:
+            try:
+                results.popitem(last=False)
+            except KeyError:
+                return
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """ Forget the results, the statistics are kept """
+        self._results.clear()
+
+    def reset_statistics(self) -> None:
+        """ Set the statistics back to 0 """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """ The share of the lookups that found a result (0 before the first lookup) """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """ Get the statistics of the memo, they can be serialised as json """
+        return {
+            "size": len(self._results),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        """ The number of results remembered """
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.statistics()})"
@@ -0,0 +1,215 @@
+"""
+File in charge of validating whole columns of numeric answers with NumPy.
+The answers are turned into a matrix of character codes so that the checks
+of the int, uint, float, ufloat and num types run once per column.
+Answers that do not have the simple shape handled here (blank, non-ascii,
+exponent, '+' sign, too many digits to be exact, ...) are checked by the
+compiled validator so the results are always the same as test_input.
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, Sequence, Tuple
+
+from . import ask_question_validator as AQV
+
+# Checked without importing numpy, it is only imported when a column is validated
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+np: Any = None
+
+# The column kind handled for each parser chain
+_NUMERIC_KINDS = {
+    (AQV._parse_int,): "int",
+    (AQV._parse_float,): "float",
+    (AQV._parse_uint,): "uint",
+    (AQV._parse_ufloat,): "ufloat",
+    (AQV._parse_num,): "num",
+}
+
+# Longest answer handled by the matrix, longer ones use the validator
+MAX_ANSWER_LENGTH = 40
+# The number of digits that can be converted without any rounding difference
+_MAX_INT_DIGITS = 18
+_MAX_FLOAT_DIGITS = 15
+DEFAULT_CHUNK_SIZE = 65536
+
+_SPACE = ord(" ")
+_COMMA = ord(",")
+_MINUS = ord("-")
+_DOT = ord(".")
+
+# Row states of the matrix pass
+_REJECTED = 0
+_ACCEPTED = 1
+_FALLBACK = 2
+
+
+def _require_numpy() -> None:
+    """ Import NumPy on the first use, raise an error when it is not installed """
+    global np
+    if NUMPY_AVAILABLE is False:
+        raise ImportError(
+            "The numpy engine requires numpy. Install with `pip install numpy`."
+        )
+    if np is None:
+        import numpy
+        np = numpy
+
+
+def get_numeric_kind(validator: AQV.AskQuestionValidator) -> str:
+    """ Get the kind of numeric column handled for the validator, an empty string if it is not supported """
+    return _NUMERIC_KINDS.get(validator.parsers, "")
+
+
+def supports(validator: AQV.AskQuestionValidator) -> bool:
+    """ Check if the validator can be run with the NumPy engine """
+    return NUMPY_AVAILABLE is True and get_numeric_kind(validator) != ""
+
+
+@lru_cache(maxsize=32)
+def _illegal_table(illegal_characters: str) -> "np.ndarray":
+    """ Build the lookup table of the illegal ascii characters, cached per distinct string """
+    table = np.zeros(128, dtype=bool)
+    for char in illegal_characters:
+        if ord(char) < 128:
+            table[ord(char)] = True
+    table.flags.writeable = False
+    return table
+
+
+def _digits_value(codes: "np.ndarray", is_digit: "np.ndarray", digit_count: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """ Read the digits of every row as one whole number (ignoring the other characters), also returns the running digit count """
+    seen = np.cumsum(is_digit, axis=1)
+    exponent = np.clip(digit_count[:, None] - seen, 0, _MAX_INT_DIGITS)
+    weights = np.power(np.int64(10), np.arange(_MAX_INT_DIGITS + 1, dtype=np.int64))
+    digits = np.where(is_digit, codes.astype(np.int64) - ord("0"), 0)
+    return (digits * weights[exponent]).sum(axis=1), seen
+
+
+def _first_position(mask: "np.ndarray", width: int) -> "np.ndarray":
+    """ Get the column of the first True of every row, width when there is none """
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), width)
+
+
+def _process_chunk(kind: str, answers: Sequence[str], lengths: "np.ndarray", illegal_table: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """ Run the matrix pass on answers that are at most MAX_ANSWER_LENGTH long, returns the row states and the values """
+    size = len(answers)
+    width = max(int(lengths.max()) if size > 0 else 0, 1)
+    column = np.array(answers, dtype=f"<U{width}")
+    codes = column.view(np.uint32).reshape(size, width)
+    in_row = np.arange(width)[None, :] < lengths[:, None]
+
+    state = np.full(size, _FALLBACK, dtype=np.int8)
+    # Blank, non printable and non ascii answers go to the validator
+    printable = ((codes >= 32) & (codes <= 126)) | ~in_row
+    blank = ((codes == _SPACE) | ~in_row).all(axis=1)
+    simple = printable.all(axis=1) & ~blank
+
+    is_digit = (codes >= ord("0")) & (codes <= ord("9")) & in_row
+    is_dot = codes == _DOT
+    is_minus = codes == _MINUS
+    digit_count = is_digit.sum(axis=1)
+    number, seen = _digits_value(codes, is_digit, digit_count)
+    first_digit = _first_position(is_digit, width)
+
+    if kind in ("int", "float"):
+        is_comma = codes == _COMMA
+        has_illegal = (illegal_table[np.minimum(codes, 127)] & in_row).any(axis=1)
+        known = is_digit | is_dot | is_comma | is_minus | (codes == _SPACE) | ~in_row
+        # clean_number turns the commas into dots before removing the overflowing dots
+        is_dot = is_dot | is_comma
+        first_minus = _first_position(is_minus, width)
+        sign_ok = first_minus < first_digit
+        if kind == "float":
+            first_dot = _first_position(is_dot, width)
+            sign_ok &= first_minus < first_dot
+        sign_ok |= first_minus == width
+        max_digits = _MAX_INT_DIGITS if kind == "int" else _MAX_FLOAT_DIGITS
+        exact = known.all(axis=1) & (digit_count <= max_digits)
+        valid = (digit_count > 0) & sign_ok
+        state[simple & exact] = np.where(valid, _ACCEPTED, _REJECTED)[simple & exact]
+        state[simple & has_illegal] = _REJECTED
+        negative = first_minus != width
+    elif kind in ("uint", "num"):
+        all_digits = (is_digit | ~in_row).all(axis=1)
+        state[simple & ~all_digits] = _REJECTED
+        state[simple & all_digits & (digit_count <= _MAX_INT_DIGITS)] = _ACCEPTED
+        negative = np.zeros(size, dtype=bool)
+    else:
+        dot_count = is_dot.sum(axis=1)
+        known = (is_digit | is_dot | ~in_row).all(axis=1)
+        valid = (dot_count <= 1) & (digit_count > 0)
+        exact = known & (digit_count <= _MAX_FLOAT_DIGITS)
+        state[simple & exact] = np.where(valid, _ACCEPTED, _REJECTED)[simple & exact]
+        state[simple & known & ~valid] = _REJECTED
+        negative = np.zeros(size, dtype=bool)
+
+    if kind in ("int", "uint"):
+        values = np.where(negative, -number, number)
+    else:
+        if kind == "num":
+            fraction_digits = np.zeros(size, dtype=np.int64)
+        else:
+            first_dot = _first_position(is_dot, width)
+            before_dot = np.where(
+                first_dot < width,
+                np.take_along_axis(seen, np.minimum(first_dot, width - 1)[:, None], axis=1)[:, 0],
+                digit_count
+            )
+            fraction_digits = digit_count - before_dot
+        values = number.astype(np.float64) / np.power(10.0, fraction_digits)
+        values = np.where(negative, -values, values)
+    values = np.where(state == _ACCEPTED, values, 0)
+    return state, values
+
+
+def validate_numeric_column_detailed(validator: AQV.AskQuestionValidator, answers: Sequence[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple["np.ndarray", "np.ndarray", Dict[int, AQV.ValidationResult]]:
+    """ Validate a column of answers, returns the values, the validity mask and the validator results of the answers checked one by one """
+    _require_numpy()
+    kind = get_numeric_kind(validator)
+    if kind == "":
+        raise ValueError(
+            f"The answer type '{validator.answer_type}' is not a numeric type handled by the numpy engine"
+        )
+    size = len(answers)
+    dtype = np.int64 if kind in ("int", "uint") else np.float64
+    values = np.zeros(size, dtype=dtype)
+    mask = np.zeros(size, dtype=bool)
+    fallback: Dict[int, AQV.ValidationResult] = {}
+    illegal_table = _illegal_table(validator.illegal_characters_nb)
+    for start in range(0, size, chunk_size):
+        chunk = answers[start:start + chunk_size]
+        lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+        short = lengths <= MAX_ANSWER_LENGTH
+        rows = np.arange(start, start + len(chunk))
+        if not short.all():
+            for row in rows[~short].tolist():
+                fallback[row] = validator.validate(answers[row])
+            rows = rows[short]
+            chunk = [answers[row] for row in rows.tolist()]
+            lengths = lengths[short]
+        state, chunk_values = _process_chunk(kind, chunk, lengths, illegal_table)
+        values[rows] = chunk_values
+        mask[rows] = state == _ACCEPTED
+        for row in rows[state == _FALLBACK].tolist():
+            fallback[row] = validator.validate(answers[row])
+    for row, (answer_found, user_answer, _) in fallback.items():
+        mask[row] = answer_found
+        if answer_found is False or user_answer == "":
+            continue
+        try:
+            values[row] = user_answer
+        except OverflowError:
+            values = values.astype(object)
+            values[row] = user_answer
+    return values, mask, fallback
+
+
+def validate_numeric_column(validator: AQV.AskQuestionValidator, answers: Sequence[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple["np.ndarray", "np.ndarray"]:
+    """ Validate a column of numeric answers at once, returns the values and the validity mask """
+    values, mask, _ = validate_numeric_column_detailed(
+        validator,
+        answers,
+        chunk_size
+    )
+    return values, mask
@@ -0,0 +1,179 @@
+"""
+File in charge of spreading the validation of large answer sets over several processes.
+The configuration of the validators is installed once per worker process
+(the workers are started again when the AskQuestion instance changes it), every
+task only carries the version of that configuration, the answer type and a
+chunk of answers, and the results come back as the compact columns of a
+ResponseBatch. Only a few chunks are in flight at once, the answers can be a
+stream larger than the memory.
+"""
+
+import os
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Tuple, Union, TYPE_CHECKING
+
+from .ask_question_response_batch import BatchColumns, ResponseBatch
+from .ask_question_validator import AskQuestionValidator
+
+if TYPE_CHECKING:
+    from .ask_question import AskQuestion
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# The number of chunks in flight per worker process
+CHUNKS_PER_WORKER = 2
+
+# The configuration installed in the workers: (human_type, illegal_characters_nb, allow_blank, tui)
+WorkerConfig = Tuple[Dict, str, bool, bool]
+
+# The configuration of the validators built by the current worker process
+_WORKER_CONFIG: Dict[str, Any] = {}
+_WORKER_VALIDATORS: Dict[str, AskQuestionValidator] = {}
+
+
+def _init_worker(version: int, config: WorkerConfig) -> None:
+    """ Install the configuration in a new worker process """
+    human_type, illegal_characters_nb, allow_blank, tui = config
+    _WORKER_CONFIG.clear()
+    _WORKER_CONFIG.update(
+        version=version,
+        human_type=human_type,
+        illegal_characters_nb=illegal_characters_nb,
+        allow_blank=allow_blank,
+        tui=tui
+    )
+    _WORKER_VALIDATORS.clear()
+
+
+def _validate_chunk(version: int, answer_type: str, answers: List[str], engine: str) -> BatchColumns:
+    """ Validate a chunk of answers in the worker process """
+    if _WORKER_CONFIG.get("version") != version:
+        raise RuntimeError(
+            f"The worker uses the configuration {_WORKER_CONFIG.get('version')}, the task expects the configuration {version}"
+        )
+    validator = _WORKER_VALIDATORS.get(answer_type)
+    if validator is None:
+        validator = _WORKER_VALIDATORS[answer_type] = AskQuestionValidator(
+            answer_type,
+            human_type=_WORKER_CONFIG["human_type"],
+            illegal_characters_nb=_WORKER_CONFIG["illegal_characters_nb"],
+            allow_blank=_WORKER_CONFIG["allow_blank"]
+        )
+    from . import ask_question_numpy as AQN
+    if engine == "numpy" or (engine == "auto" and AQN.supports(validator) is True):
+        batch = ResponseBatch.from_numeric_column(
+            validator,
+            answers,
+            tui=_WORKER_CONFIG["tui"]
+        )
+    else:
+        batch = ResponseBatch.from_validator(
+            validator,
+            answers,
+            tui=_WORKER_CONFIG["tui"]
+        )
+    return batch.to_columns()
+
+
+def _chunks(answers: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """ Split the answers in lists of chunk_size answers """
+    chunk: List[str] = []
+    for answer in answers:
+        chunk.append(answer)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+
+class AskQuestionProcessPool:
+    """ A pool of processes validating answers with the configuration of an AskQuestion instance """
+
+    def __init__(self, answer_question: "AskQuestion", processes: Union[int, None] = None, mp_context: Any = None) -> None:
+        """ The globals for the class """
+        self.answer_question = answer_question
+        self.processes = processes
+        self.mp_context = mp_context
+        # The workers, started on the first use with the configuration of config_version
+        self.executor: Any = None
+        self.config: Union[WorkerConfig, None] = None
+        self.config_version = 0
+        # The number of chunks submitted before waiting for the oldest one
+        self.max_in_flight = CHUNKS_PER_WORKER * (processes or os.cpu_count() or 1)
+
+    def _config(self) -> WorkerConfig:
+        """ Take a snapshot of the configuration of the AskQuestion instance """
+        answer_question = self.answer_question
+        return (
+            dict(answer_question.human_type),
+            answer_question.illegal_characters_nb,
+            answer_question.allow_blank,
+            answer_question.in_tui
+        )
+
+    def __enter__(self) -> "AskQuestionProcessPool":
+        """ Use the pool as a context manager """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """ Stop the workers when leaving the context """
+        self.close()
+
+    def close(self) -> None:
+        """ Stop the workers """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def _executor(self) -> Any:
+        """ Get the workers, started again with the new configuration when the AskQuestion instance changed it """
+        config = self._config()
+        if self.executor is None or config != self.config:
+            # Imported here, concurrent.futures is slow to import and most programs never start a pool
+            from concurrent.futures import ProcessPoolExecutor
+            self.close()
+            self.config = config
+            self.config_version += 1
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(self.config_version, config)
+            )
+        return self.executor
+
+    def test_inputs(self, input_answers: Iterable[str], answer_type: str, chunk_size: int = DEFAULT_CHUNK_SIZE, engine: str = "auto") -> ResponseBatch:
+        """_summary_
+            Check the answers in the worker processes, the results keep the order of the answers.
+
+        Args:
+            input_answers (Iterable[str]): _description_: The answers to check.
+            answer_type (str): _description_: The type of answer expected.
+            chunk_size (int, optional): _description_: The number of answers sent to a worker at once. Defaults to DEFAULT_CHUNK_SIZE.
+            engine (str, optional): _description_: The engine used by the workers (see AskQuestion.test_inputs). Defaults to "auto".
+
+        Returns:
+            ResponseBatch: _description_: The results of every answer.
+        """
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be above 0")
+        validator = self.answer_question.compile(answer_type)
+        batch = ResponseBatch(
+            validator.answer_type,
+            validator.value_type,
+            tui=self.answer_question.in_tui,
+            allow_blanks=validator.allow_blank
+        )
+        executor = self._executor()
+        version = self.config_version
+        in_flight: Deque[Any] = deque()
+        for chunk in _chunks(input_answers, chunk_size):
+            if len(in_flight) >= self.max_in_flight:
+                batch.merge_columns(in_flight.popleft().result())
+            in_flight.append(
+                executor.submit(_validate_chunk, version, answer_type, chunk, engine)
+            )
+        while in_flight:
+            batch.merge_columns(in_flight.popleft().result())
+        return batch
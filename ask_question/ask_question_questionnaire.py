@@ -0,0 +1,307 @@
+"""
+File in charge of running a whole questionnaire described by data (a dictionary, JSON or a dataclass).
+The questionnaire is compiled once into a plan where every answer type
+and every condition is resolved, the plan can then be run interactively
+or against prepared answers (an answer file, a pipe, ...).
+"""
+
+import dataclasses
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple, Union, TYPE_CHECKING
+
+from .ask_question_response_paquet import AskQuestionResponse
+from .ask_question_validator import AskQuestionValidator
+
+if TYPE_CHECKING:
+    from .ask_question import AskQuestion
+
+Answers = Dict[str, Any]
+Condition = Callable[[Answers], bool]
+AnswerSource = Union[Mapping[str, Any], Iterable[str], None]
+
+# Answer types used for the dataclass fields that do not give one
+_DATACLASS_ANSWER_TYPES = {
+    "int": "int",
+    "float": "float",
+    "bool": "bool",
+    "str": "str",
+}
+
+# The comparisons available in the conditions of a definition
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "equals": lambda answer, value: answer == value,
+    "not_equals": lambda answer, value: answer != value,
+    "in": lambda answer, value: answer in value,
+    "not_in": lambda answer, value: answer not in value,
+}
+
+
+class _NoDefault:
+    """ Marker of the questions without a default answer """
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return "NO_DEFAULT"
+
+
+NO_DEFAULT = _NoDefault()
+
+
+class QuestionnaireError(ValueError):
+    """ Raised for an invalid questionnaire or when the prepared answers cannot complete it """
+
+
+class Question:
+    """ A question of a questionnaire """
+
+    def __init__(self, name: str, question: Union[str, None] = None, answer_type: str = "str", default: Any = NO_DEFAULT, when: Union[Condition, Mapping[str, Any], None] = None) -> None:
+        """_summary_
+            Describe a question.
+
+        Args:
+            name (str): _description_: The key of the answer in the results.
+            question (Union[str, None], optional): _description_: The text displayed. Defaults to None (the name followed by ': ').
+            answer_type (str, optional): _description_: The type of answer expected. Defaults to "str".
+            default (Any, optional): _description_: The answer used when the user gives a blank answer (or the answer file has none). Defaults to NO_DEFAULT.
+            when (Union[Condition, Mapping[str, Any], None], optional): _description_: The condition on the previous answers for the question to be asked. Defaults to None (always asked).
+        """
+        self.name = name
+        self.question = f"{name}: " if question is None else question
+        self.answer_type = answer_type
+        self.default = default
+        self.when = when
+
+    @classmethod
+    def from_dict(cls, definition: Mapping[str, Any]) -> "Question":
+        """ Create a question from its dictionary definition """
+        if "name" not in definition:
+            raise QuestionnaireError(f"A question has no name: {dict(definition)}")
+        unknown = set(definition) - {"name", "question", "answer_type", "default", "when"}
+        if len(unknown) > 0:
+            raise QuestionnaireError(
+                f"Unknown keys {sorted(unknown)} in the question '{definition['name']}'"
+            )
+        return cls(
+            definition["name"],
+            definition.get("question"),
+            definition.get("answer_type", "str"),
+            definition.get("default", NO_DEFAULT),
+            definition.get("when")
+        )
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.name!r}, {self.question!r}, {self.answer_type!r})"
+
+
+def _compile_condition(when: Union[Condition, Mapping[str, Any], None], known: List[str], name: str) -> Union[Condition, None]:
+    """ Turn the condition of a question into a function of the previous answers """
+    if when is None or callable(when):
+        return when
+    if not isinstance(when, Mapping):
+        raise QuestionnaireError(f"The condition of '{name}' must be a dictionary or a function")
+    if "all" in when or "any" in when:
+        combine = all if "all" in when else any
+        conditions = [
+            _compile_condition(condition, known, name)
+            for condition in when["all" if "all" in when else "any"]
+        ]
+        return lambda answers: combine(condition(answers) for condition in conditions)
+    target = when.get("question")
+    if target not in known:
+        raise QuestionnaireError(
+            f"The condition of '{name}' refers to '{target}' which is not asked before it"
+        )
+    operators = [operator for operator in _OPERATORS if operator in when]
+    if len(operators) != 1:
+        raise QuestionnaireError(
+            f"The condition of '{name}' needs exactly one of {list(_OPERATORS)}"
+        )
+    compare = _OPERATORS[operators[0]]
+    value = when[operators[0]]
+    # A question skipped because of its own condition never matches
+    return lambda answers: target in answers and compare(answers[target], value)
+
+
+class QuestionnairePlan:
+    """ A compiled questionnaire, ready to be run any number of times """
+
+    def __init__(self, answer_question: "AskQuestion", steps: List[Tuple[str, str, AskQuestionValidator, Any, Union[Condition, None]]]) -> None:
+        """ The globals for the class """
+        self.answer_question = answer_question
+        # (name, question, validator, default, condition) of every question, in order
+        self.steps = steps
+
+    def __len__(self) -> int:
+        """ Return the number of questions """
+        return len(self.steps)
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({[step[0] for step in self.steps]})"
+
+    @staticmethod
+    def load_answers(path: str, encoding: str = "utf-8") -> Union[Dict[str, Any], List[str]]:
+        """ Read an answer file, a JSON object (answers by question name) or one answer per line """
+        with open(path, "r", encoding=encoding) as file:
+            content = file.read()
+        if path.endswith(".json"):
+            answers = json.loads(content)
+            if not isinstance(answers, dict):
+                raise QuestionnaireError(f"The answer file '{path}' must contain a JSON object")
+            return answers
+        return content.splitlines()
+
+    def _response(self, raw_user_answer: str, user_answer: Any, answer_type: str, question: str) -> AskQuestionResponse:
+        """ Create the response of an accepted answer """
+        return self.answer_question._create_response(raw_user_answer, "", True, user_answer, answer_type, question)
+
+    def _ask(self, name: str, question: str, validator: AskQuestionValidator, default: Any) -> AskQuestionResponse:
+        """ Ask a question to the user until the answer is valid """
+        input_provider = self.answer_question.input_provider
+        while True:
+            raw_user_answer = input_provider.read_answer(question)
+            if default is not NO_DEFAULT and (raw_user_answer == "" or raw_user_answer.isspace()):
+                return self._response(raw_user_answer, default, validator.answer_type, question)
+            answer_found, user_answer, message = validator.validate(raw_user_answer)
+            if answer_found is True:
+                return self._response(raw_user_answer, user_answer, validator.answer_type, question)
+            input_provider.display(message)
+
+    def _answer(self, name: str, question: str, validator: AskQuestionValidator, default: Any, raw_user_answer: Any) -> AskQuestionResponse:
+        """ Check a prepared answer, there is nobody to ask again so an invalid answer is an error """
+        if raw_user_answer is None or raw_user_answer == "" or (isinstance(raw_user_answer, str) and raw_user_answer.isspace()):
+            if default is not NO_DEFAULT:
+                return self._response("" if raw_user_answer is None else raw_user_answer, default, validator.answer_type, question)
+            if raw_user_answer is None:
+                raise QuestionnaireError(f"No answer was provided for '{name}'")
+        if isinstance(raw_user_answer, bool):
+            raw_user_answer = str(raw_user_answer).lower()
+        raw_user_answer = str(raw_user_answer)
+        answer_found, user_answer, message = validator.validate(raw_user_answer)
+        if answer_found is False:
+            raise QuestionnaireError(
+                f"Invalid answer {raw_user_answer!r} for '{name}': {message}"
+            )
+        return self._response(raw_user_answer, user_answer, validator.answer_type, question)
+
+    def run_detailed(self, answers: AnswerSource = None) -> Dict[str, AskQuestionResponse]:
+        """_summary_
+            Run the questionnaire and keep the details of every answer.
+
+        Args:
+            answers (AnswerSource, optional): _description_: None to ask the user, a mapping of the answers by question name (an answer file) or an iterable of lines (one answer per asked question, a pipe for instance). Defaults to None.
+
+        Raises:
+            QuestionnaireError: _description_: When a prepared answer is invalid or missing.
+
+        Returns:
+            Dict[str, AskQuestionResponse]: _description_: The responses of the asked questions by name.
+        """
+        responses: Dict[str, AskQuestionResponse] = {}
+        values: Answers = {}
+        lines: Union[Iterator[str], None] = None
+        if answers is not None and not isinstance(answers, Mapping):
+            lines = iter(answers)
+        for name, question, validator, default, condition in self.steps:
+            if condition is not None and not condition(values):
+                continue
+            if answers is None:
+                response = self._ask(name, question, validator, default)
+            elif lines is not None:
+                line = next(lines, None)
+                if line is not None:
+                    line = line.rstrip("\r\n")
+                response = self._answer(name, question, validator, default, line)
+            else:
+                response = self._answer(name, question, validator, default, answers.get(name))
+            responses[name] = response
+            values[name] = response["user_answer"]
+        return responses
+
+    def run(self, answers: AnswerSource = None) -> Answers:
+        """ Run the questionnaire and return the answers by question name (see run_detailed) """
+        return {
+            name: response["user_answer"]
+            for name, response in self.run_detailed(answers).items()
+        }
+
+
+class Questionnaire:
+    """ A list of questions, with defaults and conditions on the previous answers """
+
+    def __init__(self, questions: Iterable[Union[Question, Mapping[str, Any]]]) -> None:
+        """ The globals for the class """
+        self.questions: List[Question] = [
+            question if isinstance(question, Question) else Question.from_dict(question)
+            for question in questions
+        ]
+
+    @classmethod
+    def from_dict(cls, definition: Mapping[str, Any]) -> "Questionnaire":
+        """ Create a questionnaire from a dictionary with a 'questions' list """
+        if "questions" not in definition:
+            raise QuestionnaireError("The definition must contain a 'questions' list")
+        return cls(definition["questions"])
+
+    @classmethod
+    def from_json(cls, document: str) -> "Questionnaire":
+        """ Create a questionnaire from a JSON document """
+        return cls.from_dict(json.loads(document))
+
+    @classmethod
+    def from_json_file(cls, path: str, encoding: str = "utf-8") -> "Questionnaire":
+        """ Create a questionnaire from a JSON file """
+        with open(path, "r", encoding=encoding) as file:
+            return cls.from_dict(json.load(file))
+
+    @classmethod
+    def from_dataclass(cls, datacls: type) -> "Questionnaire":
+        """ Create a questionnaire from the fields of a dataclass, the field metadata can hold 'question', 'answer_type' and 'when' """
+        if not dataclasses.is_dataclass(datacls):
+            raise QuestionnaireError(f"{datacls!r} is not a dataclass")
+        questions = []
+        for field in dataclasses.fields(datacls):
+            answer_type = field.metadata.get("answer_type")
+            if answer_type is None:
+                # from __future__ import annotations stores the types as strings
+                kind = field.type.__name__ if isinstance(field.type, type) else field.type
+                answer_type = _DATACLASS_ANSWER_TYPES.get(kind, "str")
+            default = NO_DEFAULT
+            if field.default is not dataclasses.MISSING:
+                default = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                default = field.default_factory()
+            questions.append(Question(
+                field.name,
+                field.metadata.get("question"),
+                answer_type,
+                default,
+                field.metadata.get("when")
+            ))
+        return cls(questions)
+
+    def compile(self, answer_question: "AskQuestion") -> QuestionnairePlan:
+        """ Resolve the answer types and the conditions once, with the configuration of the AskQuestion instance """
+        steps = []
+        known: List[str] = []
+        for question in self.questions:
+            if question.name in known:
+                raise QuestionnaireError(f"The question '{question.name}' is defined twice")
+            steps.append((
+                question.name,
+                str(question.question),
+                answer_question.compile(question.answer_type),
+                question.default,
+                _compile_condition(question.when, known, question.name)
+            ))
+            known.append(question.name)
+        return QuestionnairePlan(answer_question, steps)
+
+    def __len__(self) -> int:
+        """ Return the number of questions """
+        return len(self.questions)
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.questions!r})"
@@ -0,0 +1,262 @@
+"""
+File in charge of storing the results of a bulk validation under a columnar form.
+The rows are only turned into AskQuestionResponse instances when they are accessed.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from .ask_question_response_paquet import AskQuestionResponse
+from .ask_question_validator import AskQuestionValidator
+
+# answer_type, value_type, tui, allow_blanks, answer_found, values, raw answers, raw codes, messages, message codes
+BatchColumns = Tuple[str, Union[type, None], bool, bool, bytes, Tuple[Any, ...], List[str], bytes, List[str], bytes]
+
+# Typecode of the array used to store the answers of a validator, by answer type
+_VALUE_TYPECODES = {
+    int: "q",
+    float: "d",
+    bool: "b",
+}
+
+
+class ResponseBatch:
+    """ The results of validating several answers against the same answer type """
+
+    def __init__(self, answer_type: str, value_type: Union[type, None] = None, tui: bool = False, allow_blanks: bool = False) -> None:
+        """ The globals for the class """
+        self.answer_type = answer_type
+        self.value_type = value_type
+        self.tui = tui
+        self.allow_blanks = allow_blanks
+        self.answer_found = bytearray()
+        # A typed array (or a NumPy array with the numpy engine) when the answers all have the same type
+        self.values: Union[array, List[Any], Any] = self._new_value_column(value_type)
+        self.raw_user_answer_codes = array("I")
+        self.raw_user_answers: List[str] = []
+        self.message_codes = array("I")
+        self.messages: List[str] = []
+        self._raw_user_answer_index: Dict[str, int] = {}
+        self._message_index: Dict[str, int] = {}
+
+    @staticmethod
+    def _new_value_column(value_type: Union[type, None]) -> Union[array, List[Any]]:
+        """ Create the column in charge of storing the converted answers """
+        if value_type in _VALUE_TYPECODES:
+            return array(_VALUE_TYPECODES[value_type])
+        return []
+
+    @classmethod
+    def from_validator(cls, validator: AskQuestionValidator, answers: Iterable[str], tui: bool = False) -> "ResponseBatch":
+        """ Validate every answer with the validator and store the results """
+        batch = cls(
+            validator.answer_type,
+            validator.value_type,
+            tui=tui,
+            allow_blanks=validator.allow_blank
+        )
+        batch.extend(validator, answers)
+        return batch
+
+    @classmethod
+    def from_numeric_column(cls, validator: AskQuestionValidator, answers: Sequence[str], tui: bool = False) -> "ResponseBatch":
+        """ Validate a column of numeric answers with the NumPy engine and store the results """
+        from . import ask_question_numpy as AQN
+        batch = cls(
+            validator.answer_type,
+            validator.value_type,
+            tui=tui,
+            allow_blanks=validator.allow_blank
+        )
+        values, mask, fallback = AQN.validate_numeric_column_detailed(
+            validator,
+            answers
+        )
+        batch.answer_found = bytearray(mask.tobytes())
+        batch.values = values
+        raw_index = batch._raw_user_answer_index
+        batch.raw_user_answer_codes.extend(
+            [raw_index.setdefault(answer, len(raw_index)) for answer in answers]
+        )
+        batch.raw_user_answers = list(raw_index)
+        batch.messages = ["", validator.error_message]
+        batch._message_index = {"": 0, validator.error_message: 1}
+        message_codes = AQN.np.where(mask, 0, 1).astype(
+            f"u{batch.message_codes.itemsize}"
+        )
+        for row, (_, _, message) in fallback.items():
+            code = batch._message_index.get(message)
+            if code is None:
+                code = batch._message_index[message] = len(batch.messages)
+                batch.messages.append(message)
+            message_codes[row] = code
+        batch.message_codes.frombytes(message_codes.tobytes())
+        return batch
+
+    def extend(self, validator: AskQuestionValidator, answers: Iterable[str]) -> None:
+        """ Validate the answers and append their results to the batch """
+        validate = validator.validate
+        placeholder = self.value_type() if self.value_type in _VALUE_TYPECODES else ""
+        found_append = self.answer_found.append
+        raw_codes_append = self.raw_user_answer_codes.append
+        message_codes_append = self.message_codes.append
+        raw_index = self._raw_user_answer_index
+        message_index = self._message_index
+        for raw_user_answer in answers:
+            answer_found, user_answer, message = validate(raw_user_answer)
+            found_append(answer_found)
+            if user_answer == "" and self.value_type in _VALUE_TYPECODES:
+                user_answer = placeholder
+            try:
+                self.values.append(user_answer)
+            except OverflowError:
+                # The number does not fit in the typed column anymore
+                self.values = list(self.values)
+                self.values.append(user_answer)
+            code = raw_index.get(raw_user_answer)
+            if code is None:
+                code = raw_index[raw_user_answer] = len(self.raw_user_answers)
+                self.raw_user_answers.append(raw_user_answer)
+            raw_codes_append(code)
+            code = message_index.get(message)
+            if code is None:
+                code = message_index[message] = len(self.messages)
+                self.messages.append(message)
+            message_codes_append(code)
+
+    def to_columns(self) -> BatchColumns:
+        """ Export the batch as plain picklable columns (used to send it from one process to another) """
+        values: Any = self.values
+        if isinstance(values, array):
+            values = ("array", values.typecode, values.tobytes())
+        elif isinstance(values, list) is False:
+            # NumPy array, int64 and float64 have the same layout as the 'q' and 'd' typecodes
+            if values.dtype.kind in ("i", "f") and values.dtype.itemsize == 8:
+                values = ("array", "q" if values.dtype.kind == "i" else "d", values.tobytes())
+            else:
+                values = ("list", values.tolist())
+        else:
+            values = ("list", values)
+        return (
+            self.answer_type,
+            self.value_type,
+            self.tui,
+            self.allow_blanks,
+            bytes(self.answer_found),
+            values,
+            self.raw_user_answers,
+            self.raw_user_answer_codes.tobytes(),
+            self.messages,
+            self.message_codes.tobytes()
+        )
+
+    @classmethod
+    def from_columns(cls, columns: BatchColumns) -> "ResponseBatch":
+        """ Rebuild a batch exported with to_columns """
+        batch = cls(columns[0], columns[1], tui=columns[2], allow_blanks=columns[3])
+        batch.merge_columns(columns)
+        return batch
+
+    @staticmethod
+    def _remap_codes(index: Dict[str, int], table: List[str], chunk_table: List[str], chunk_codes: bytes) -> array:
+        """ Translate the dictionary codes of a chunk to the codes of the batch """
+        remap = []
+        for value in chunk_table:
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(table)
+                table.append(value)
+            remap.append(code)
+        codes = array("I")
+        codes.frombytes(chunk_codes)
+        return array("I", map(remap.__getitem__, codes))
+
+    def merge_columns(self, columns: BatchColumns) -> None:
+        """ Append the rows of a batch exported with to_columns """
+        self.answer_found.extend(columns[4])
+        kind, *payload = columns[5]
+        if kind == "array" and isinstance(self.values, array) and self.values.typecode == payload[0]:
+            self.values.frombytes(payload[1])
+        else:
+            if kind == "array":
+                chunk_values = array(payload[0])
+                chunk_values.frombytes(payload[1])
+                payload = [chunk_values]
+            if isinstance(self.values, list) is False:
+                self.values = list(self.values)
+            self.values.extend(payload[0])
+        self.raw_user_answer_codes.extend(
+            self._remap_codes(self._raw_user_answer_index, self.raw_user_answers, columns[6], columns[7])
+        )
+        self.message_codes.extend(
+            self._remap_codes(self._message_index, self.messages, columns[8], columns[9])
+        )
+
+    def __len__(self) -> int:
+        """ Return the number of answers in the batch """
+        return len(self.answer_found)
+
+    def _check_index(self, index: int) -> int:
+        """ Convert a negative index and make sure it is in range """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("ResponseBatch index out of range")
+        return index
+
+    def get_answer_found(self, index: int) -> bool:
+        """ Get if the answer at the given index was accepted """
+        return self.answer_found[self._check_index(index)] == 1
+
+    def get_raw_user_answer(self, index: int) -> str:
+        """ Get the answer at the given index as it was provided """
+        return self.raw_user_answers[self.raw_user_answer_codes[self._check_index(index)]]
+
+    def get_message(self, index: int) -> str:
+        """ Get the message generated for the answer at the given index """
+        return self.messages[self.message_codes[self._check_index(index)]]
+
+    def get_user_answer(self, index: int) -> Union[str, int, float, None, bool]:
+        """ Get the converted answer at the given index """
+        index = self._check_index(index)
+        if self.answer_found[index] == 0:
+            return ""
+        if self.value_type in _VALUE_TYPECODES:
+            raw_user_answer = self.raw_user_answers[self.raw_user_answer_codes[index]]
+            # Blank answers are accepted as an empty string which the typed column cannot hold
+            if raw_user_answer == "" or raw_user_answer.isspace():
+                return ""
+            return self.value_type(self.values[index])
+        return self.values[index]
+
+    def __getitem__(self, index: int) -> AskQuestionResponse:
+        """ Build the response for the answer at the given index """
+        index = self._check_index(index)
+        return AskQuestionResponse(
+            tui=self.tui,
+            allow_blanks=self.allow_blanks,
+            message=self.get_message(index),
+            question=None,
+            answer_type=self.answer_type,
+            answer_found=self.get_answer_found(index),
+            raw_user_answer=self.get_raw_user_answer(index),
+            user_answer=self.get_user_answer(index)
+        )
+
+    def __iter__(self) -> Iterator[AskQuestionResponse]:
+        """ Iterate over the responses of the batch """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}(answer_type={self.answer_type!r}, size={len(self)}, found={self.found_count})"
+
+    @property
+    def found_count(self) -> int:
+        """ The number of accepted answers """
+        return self.answer_found.count(1)
+
+    def user_answers(self) -> List[Union[str, int, float, None, bool]]:
+        """ Get the converted answers of every row """
+        return [self.get_user_answer(index) for index in range(len(self))]
@@ -2,11 +2,15 @@
     File in charge of returning the user response under the form of a packet rather than an dictionnary
 """
 
-from typing import Union, List, Any, Dict, get_type_hints, TypeVar, Type, Iterable, Generic
+from copy import deepcopy
+from typing import Union, List, Any, Dict, TypeVar, Type, Iterable, Iterator, Generic, Tuple
 
 _KT = TypeVar("_KT")
 VT = TypeVar("VT")
 
+# The default of a declared field that does not have one
+_MISSING = object()
+
 
 class AQFlexibleDictionary(Generic[_KT, VT]):
     """ Class in charge of emulating the functionalities of a dictionary as well as a C type structure 
@@ -14,8 +18,52 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
 
     Provides dictionary-like behavior with attribute access, default values from type hints,
     recursive dictionary wrapping, and support for serialization and merging.
+
+    The nested dictionaries are copied when they are stored (every level of dictionaries, the caller keeps its own)
+    and only wrapped the first time they are read, the wrapper then takes their place.
+
+    A copy shares its content with the original, a level is only duplicated the first time one of them changes it
+    (or reads one of its nested dictionaries, which can then be changed).
     """
 
+    # The content lives in _data (shared with a copy while _shared is True),
+    # the __dict__ is only created when an attribute starting with _ is set on the instance
+    __slots__ = ("_data", "_shared", "__dict__", "__weakref__")
+
+    # The declared fields of the class (the annotated names of the class and of its parents) and their defaults,
+    # computed once per class by __init_subclass__ (not annotated, they would be fields themselves)
+    _fields = ()
+    _field_defaults = {}
+
+    # The frozen form of the class (see freeze), created on its first use and kept for each class
+    _frozen_class = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Compute the declared fields and their defaults once per class, and give the declared fields an accessor
+        reading the instance content (the undeclared keys still go through __getattr__).
+        """
+        super().__init_subclass__(**kwargs)
+        fields: Dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            fields.update(dict.fromkeys(klass.__dict__.get("__annotations__", {})))
+        defaults: Dict[str, Any] = {}
+        for name in fields:
+            attribute = _class_attribute(cls, name)
+            if isinstance(attribute, _Field):
+                attribute = attribute.default
+            if attribute is not _MISSING:
+                defaults[name] = attribute
+        cls._fields = tuple(fields)
+        cls._field_defaults = defaults
+        # Not inherited, the frozen form of a parent would lose the fields and the methods of the class
+        cls._frozen_class = None
+        for name in fields:
+            # The names starting with _ are attributes of the instance, not keys
+            if name.startswith("_") or isinstance(_class_attribute(cls, name), _Field):
+                continue
+            setattr(cls, name, _Field(name, defaults.get(name, _MISSING)))
+
     def __init__(self, **kwargs) -> None:
         """
         Initialize a new AQFlexibleDictionary instance.
@@ -26,26 +74,14 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Notes:
             Class attributes with type hints will be used as defaults if not overridden by kwargs.
         """
-        # Store the name of the class
-        self._class_name: str = self.__class__.__name__
+        # initialise the reference dictionnary with the defaults of the declared fields (computed once per class)
+        data: Dict[str, Any] = dict(self._field_defaults)
+        self._shared = False
 
-        # initialise the reference dictionnary
-        self._data: Dict[str, Any] = {}
-
-        # Use type hints (if any) for default values
-        defaults = {
-            k: getattr(self.__class__, k)
-            for k in get_type_hints(self.__class__)
-            if hasattr(self.__class__, k)
-        }
-
-        # Load defaults first
-        for key, value in defaults.items():
-            self._data[key] = self._wrap(value)
-
-        # Override with explicit kwargs
-        for key, value in kwargs.items():
-            self._data[key] = self._wrap(value)
+        # Override with explicit kwargs, the nested dictionaries are copied now (every level) and wrapped when they are read
+        data.update(kwargs)
+        _own_nested(data)
+        self._data = data
 
     def _wrap(self, value):
         """
@@ -57,10 +93,70 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             The original value or an AQFlexibleDictionary if value is a dict.
         """
-        if isinstance(value, Dict) and not isinstance(value, AQFlexibleDictionary):
+        if isinstance(value, dict):
             return self.__class__(**value)
         return value
 
+    def _own(self) -> Dict[str, Any]:
+        """
+        Get the internal dictionary before changing it, it is duplicated first when it is shared with a copy.
+        The nested dictionaries never read stay shared, they are never changed in place (see __getitem__).
+
+        Returns:
+            The internal data, owned by this instance only.
+        """
+        data = self._data
+        if self._shared is True:
+            data = {
+                key: value.copy() if isinstance(value, AQFlexibleDictionary) else value
+                for key, value in data.items()
+            }
+            object.__setattr__(self, "_data", data)
+            object.__setattr__(self, "_shared", False)
+        return data
+
+    def _wrap_all(self) -> None:
+        """
+        Wrap the nested dictionaries of this level that were never read (their own content stays as it is).
+        """
+        data = self._own()
+        for key, value in data.items():
+            if isinstance(value, dict):
+                data[key] = self._wrap(value)
+
+    @property
+    def _class_name(self) -> str:
+        """
+        The name of the class, used in the messages and representations.
+
+        Returns:
+            The name of the class of the instance.
+        """
+        return self.__class__.__name__
+
+    def _mapping(self) -> Dict[str, Any]:
+        """
+        Get the content as a dictionary without forcing a compact instance to build its _data.
+
+        Returns:
+            The internal data (or a temporary dictionary of it).
+        """
+        return self._data
+
+    def _materialize(self) -> Dict[str, Any]:
+        """
+        Build the internal dictionary of an instance that does not have one yet.
+
+        Returns:
+            The internal data.
+
+        Raises:
+            AttributeError: If the instance cannot build it.
+        """
+        raise AttributeError(
+            f"'{self._class_name}' object has no attribute '_data'"
+        )
+
     def __getattr__(self, name):
         """
         Fallback for attribute access when not found on the instance.
@@ -74,8 +170,13 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Raises:
             AttributeError: If the key does not exist.
         """
+        if name == "_data":
+            return self._materialize()
+        if name == "_shared":
+            # Not initialised yet (while unpickling)
+            return False
         try:
-            return self._data[name]
+            return self[name]
         except KeyError as e:
             raise AttributeError(
                 f"'{self._class_name}' object has no attribute '{name}'"
@@ -89,11 +190,11 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
             name: Attribute name.
             value: Value to assign.
         """
-        if name in self.__dict__ or name.startswith('_'):
+        if name.startswith('_'):
             # Let Python handle internal attributes normally
             super().__setattr__(name, value)
         else:
-            self._data[name] = self._wrap(value)
+            self[name] = value
 
     def __getitem__(self, key):
         """
@@ -105,7 +206,16 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             Corresponding value from the internal data.
         """
-        return self._data[key]
+        data = self._data
+        value = data[key]
+        if isinstance(value, _NESTED_TYPES):
+            # The nested value can be changed by the caller, it must not be shared with a copy
+            if self._shared is True:
+                data = self._own()
+                value = data[key]
+            if isinstance(value, dict):
+                value = data[key] = self._wrap(value)
+        return value
 
     def __setitem__(self, key, value):
         """
@@ -115,7 +225,9 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
             key: Key to assign to.
             value: Value to store.
         """
-        self._data[key] = self._wrap(value)
+        if isinstance(value, dict):
+            value = _own_tree(value)
+        self._own()[key] = value
 
     def __delitem__(self, key):
         """
@@ -124,7 +236,7 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Args:
             key: Key to remove.
         """
-        del self._data[key]
+        del self._own()[key]
 
     def __delattr__(self, key):
         """
@@ -133,7 +245,7 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Args:
             key: Key to remove.
         """
-        del self._data[key]
+        del self._own()[key]
 
     def __contains__(self, key):
         """
@@ -175,21 +287,34 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             True if contents are equal, False otherwise.
         """
-        if isinstance(other, AQFlexibleDictionary):
-            return self._data == other._data
-        if isinstance(other, dict):
-            return self.to_dict() == other
+        if isinstance(other, _NESTED_TYPES):
+            return _equal(self, other)
         return NotImplemented
 
     def __copy__(self):
         """
-        Create a shallow copy of the dictionary.
+        Create a copy of the dictionary, see copy.
 
         Returns:
             A new AQFlexibleDictionary with the same content.
         """
         return self.copy()
 
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        """
+        Create a fully independent copy of the dictionary.
+
+        Args:
+            memo: The objects already copied, see copy.deepcopy.
+
+        Returns:
+            A new AQFlexibleDictionary sharing nothing with this one.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone.__setstate__(_deepcopy_tree(self.__getstate__(), memo))
+        return clone
+
     def __repr__(self):
         """
         Return the official string representation.
@@ -197,7 +322,7 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             A developer-friendly string of the internal data.
         """
-        return f"{self._class_name}({self._data})"
+        return _format(self)
 
     def __reversed__(self):
         """
@@ -206,7 +331,7 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             A reversed iterator of keys.
         """
-        return reversed(list(self._data))
+        return reversed(list(self._mapping()))
 
     def __or__(self, other):
         """
@@ -216,12 +341,12 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
             other: Another dictionary.
 
         Returns:
-            A new merged AQFlexibleDictionary.
+            A new merged AQFlexibleDictionary, sharing the content of this one until it changes.
         """
         if isinstance(other, dict):
-            merged = self.to_dict()
+            merged = self.copy()
             merged.update(other)
-            return self.__class__(**merged)
+            return merged
         return NotImplemented
 
     def __ior__(self, other):
@@ -255,9 +380,10 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Args:
             state: Dictionary representing internal data.
         """
-        object.__setattr__(self, "_data", {})
-        for key, value in state.items():
-            self._data[key] = self._wrap(value)
+        data = dict(state)
+        _own_nested(data)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_shared", False)
 
     def __str__(self):
         """
@@ -266,7 +392,12 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             A stringified dictionary.
         """
-        return str(self.to_dict())
+        tree = self.to_dict()
+        try:
+            return repr(tree)
+        except RecursionError:
+            # Nested deeper than the recursion limit
+            return _format(tree)
 
     def __json__(self):
         """
@@ -284,6 +415,7 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             dict_items of internal data.
         """
+        self._wrap_all()
         return self._data.items()
 
     def keys(self):
@@ -302,6 +434,7 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             dict_values of internal data.
         """
+        self._wrap_all()
         return self._data.values()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -309,23 +442,65 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Convert to a standard Python dictionary.
 
         Returns:
-            A dict with all nested AQFlexibleDictionaries unwrapped.
-        """
-        # Optionally convert back to plain dict
-        def unwrap(val):
-            if isinstance(val, AQFlexibleDictionary):
-                return val.to_dict()
-            return val
-        return {k: unwrap(v) for k, v in self._data.items()}
+            A dict with all nested AQFlexibleDictionaries unwrapped and the nested dictionaries
+            copied, changing it never changes this object. A nested dictionary met twice (shared or cyclic)
+            is converted once, the result shares it the same way.
+        """
+        result: Dict[str, Any] = {}
+        # Walked with a stack, the depth of the nesting is not limited by the recursion limit
+        converted = {id(self): result}
+        stack = [(self._mapping(), self, result)]
+        while stack:
+            mapping, owner, target = stack.pop()
+            for key, value in mapping.items():
+                if not isinstance(value, _NESTED_TYPES):
+                    target[key] = value
+                    continue
+                child, child_owner = _comparable(owner, value)
+                plain = converted.get(id(value))
+                if plain is None:
+                    plain = converted[id(value)] = {}
+                    stack.append((child, child_owner, plain))
+                target[key] = plain
+        return result
 
     def copy(self) -> "AQFlexibleDictionary":
         """
-        Shallow copy of this object.
+        Copy of this object, it shares the content of the original until one of them changes it
+        (a change made through one never shows in the other, nested dictionaries included:
+        they are wrapped in a new level when read and copied by to_dict).
+
+        Returns:
+            A new AQFlexibleDictionary instance.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        object.__setattr__(clone, "_data", self._data)
+        object.__setattr__(clone, "_shared", True)
+        object.__setattr__(self, "_shared", True)
+        return clone
+
+    def deepcopy(self) -> "AQFlexibleDictionary":
+        """
+        Fully independent copy of this object, nothing is shared with the original
+        (the lists and the other mutable values included).
 
         Returns:
             A new AQFlexibleDictionary instance.
         """
-        return self.__class__(**self.to_dict())
+        return deepcopy(self)
+
+    def freeze(self) -> "AQFlexibleDictionary":
+        """
+        Immutable and hashable copy of this object, the nested dictionaries are frozen as well.
+
+        Returns:
+            A new FrozenAQFlexibleDictionary (FrozenAskQuestionResponse for a response),
+            for a subclass a frozen subclass of it created on its first use.
+
+        Raises:
+            ValueError: If the dictionary contains itself.
+        """
+        return _frozen_class_of(type(self))(**self._mapping())
 
     def pop(self, key, default=None):
         """
@@ -338,7 +513,9 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             The value associated with the key, or default.
         """
-        return self._data.pop(key, default)
+        if key not in self._data:
+            return default
+        return self._wrap(self._own().pop(key))
 
     def get(self, key, default=None):
         """
@@ -351,7 +528,9 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             The value or default.
         """
-        return self._data.get(key, default)
+        if key in self._data:
+            return self[key]
+        return default
 
     def setdefault(self, key, default=None):
         """
@@ -364,7 +543,11 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         Returns:
             The value associated with the key.
         """
-        return self._data.setdefault(key, self._wrap(default))
+        if key not in self._data:
+            if isinstance(default, dict):
+                default = _own_tree(default)
+            self._own()[key] = default
+        return self[key]
 
     def update(self, other=(), **kwargs):
         """
@@ -379,15 +562,20 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         else:
             items = other  # assume iterable of pairs
         for k, v in items:
-            self._data[k] = self._wrap(v)
+            self[k] = v
         for k, v in kwargs.items():
-            self._data[k] = self._wrap(v)
+            self[k] = v
 
     def clear(self):
         """
         Remove all items from the dictionary.
         """
-        self._data.clear()
+        data = self._data
+        if self._shared is True:
+            object.__setattr__(self, "_data", {})
+            object.__setattr__(self, "_shared", False)
+        else:
+            data.clear()
 
     @classmethod
     def fromkeys(cls: Type["AQFlexibleDictionary"], iterable: Iterable[str], value: Any = None):
@@ -404,13 +592,276 @@ class AQFlexibleDictionary(Generic[_KT, VT]):
         return cls(**{k: value for k in iterable})
 
 
+# The stored values that to_dict converts
+_NESTED_TYPES = (AQFlexibleDictionary, dict)
+
+
+class _OwnedDict(dict):
+    """ A nested dictionary copied when it was stored, it is never changed in place and never given to the caller (it is shared between the dictionaries without being copied again) """
+
+    __slots__ = ()
+
+
+def _own_tree(tree: Dict[Any, Any], copies: Union[Dict[int, "_OwnedDict"], None] = None) -> "_OwnedDict":
+    """ Copy a nested dictionary and every dictionary nested in it with a stack (the other values are kept), a dictionary met twice (shared or cyclic) is copied once """
+    if type(tree) is _OwnedDict:
+        return tree
+    if copies is None:
+        copies = {}
+    result = copies.get(id(tree))
+    if result is not None:
+        return result
+    result = copies[id(tree)] = _OwnedDict(tree)
+    stack = [result]
+    while stack:
+        target = stack.pop()
+        for key, value in target.items():
+            if not isinstance(value, dict) or type(value) is _OwnedDict:
+                continue
+            copied = copies.get(id(value))
+            if copied is None:
+                copied = copies[id(value)] = _OwnedDict(value)
+                stack.append(copied)
+            target[key] = copied
+    return result
+
+
+def _own_nested(data: Dict[Any, Any]) -> None:
+    """ Replace the nested dictionaries of a new content by copies of every level, none of them stays the caller's """
+    copies: Dict[int, _OwnedDict] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            data[key] = _own_tree(value, copies)
+
+
+def _comparable(owner: Union[AQFlexibleDictionary, None], value: Any) -> Tuple[Union[Dict, None], Union[AQFlexibleDictionary, None]]:
+    """ Get the content compared or converted for a value and the owner of its nested values (None, None for a plain value) """
+    if isinstance(value, AQFlexibleDictionary):
+        return value._mapping(), value
+    if isinstance(value, dict):
+        # A nested dictionary that was never read is compared to its wrapped form
+        if owner is not None and len(owner._field_defaults) > 0:
+            wrapped = owner._wrap(value)
+            return wrapped._mapping(), wrapped
+        return value, owner
+    return None, None
+
+
+def _equal(first: Any, second: Any) -> bool:
+    """ Compare two dictionaries and their nested dictionaries with a stack, a pair met twice (shared or cyclic) is compared once """
+    compared = set()
+    stack: List[Tuple[Any, Any, Any, Any]] = [(first, None, second, None)]
+    while stack:
+        value, owner, other, other_owner = stack.pop()
+        if value is other:
+            continue
+        if isinstance(value, _Frozen) and isinstance(other, _Frozen) and value._hash is not None and other._hash is not None and value._hash != other._hash:
+            return False
+        mapping, owner = _comparable(owner, value)
+        other_mapping, other_owner = _comparable(other_owner, other)
+        if mapping is None or other_mapping is None:
+            if not value == other:
+                return False
+            continue
+        pair = (id(value), id(other))
+        if pair in compared:
+            continue
+        compared.add(pair)
+        if len(mapping) != len(other_mapping):
+            return False
+        for key, item in mapping.items():
+            if key not in other_mapping:
+                return False
+            stack.append((item, owner, other_mapping[key], other_owner))
+    return True
+
+
+def _format_items(node: Any) -> Iterator[Tuple[Any, Any, Any]]:
+    """ Get the keys, the shown values and the stored values of a formatted dictionary (a nested dictionary that was never read is shown wrapped) """
+    if isinstance(node, AQFlexibleDictionary):
+        for key, value in node._mapping().items():
+            yield key, node._wrap(value), value
+    else:
+        for key, value in node.items():
+            yield key, value, value
+
+
+def _format(root: Any) -> str:
+    """ Format a dictionary like repr with a stack, a dictionary met again inside itself is written {...} """
+    parts: List[str] = []
+    # The ids of the stored dictionaries being written, a plain dictionary is stored as the copy made once for its source, so a cycle of them meets the same ids again
+    path = set()
+    # [items, id, closing text, first item]
+    stack: List[List[Any]] = []
+    items: Union[Tuple[Any, Any, Any], None] = (None, root, root)
+    while True:
+        if items is not None:
+            _, value, stored = items
+            if type(value) is dict and not any(isinstance(item, _NESTED_TYPES) for item in value.values()):
+                # Nothing nested, the builtin repr is faster
+                parts.append(repr(value))
+            elif isinstance(value, AQFlexibleDictionary) or type(value) is dict:
+                prefix = f"{value._class_name}(" if isinstance(value, AQFlexibleDictionary) else ""
+                suffix = ")" if prefix else ""
+                if id(stored) in path:
+                    parts.append(f"{prefix}{{...}}{suffix}")
+                else:
+                    parts.append(prefix + "{")
+                    path.add(id(stored))
+                    stack.append([_format_items(value), id(stored), "}" + suffix, True])
+            else:
+                parts.append(repr(value))
+        if len(stack) == 0:
+            return "".join(parts)
+        frame = stack[-1]
+        items = next(frame[0], None)
+        if items is None:
+            parts.append(frame[2])
+            path.discard(frame[1])
+            stack.pop()
+            continue
+        if frame[3] is True:
+            frame[3] = False
+        else:
+            parts.append(", ")
+        parts.append(f"{items[0]!r}: ")
+
+
+def _deepcopy_tree(tree: Dict[Any, Any], memo: Dict[int, Any]) -> Dict[Any, Any]:
+    """ copy.deepcopy of a tree of dictionaries with a stack (the other values still go through copy.deepcopy) """
+    # Kept alive with the memo like copy.deepcopy does, the ids of the temporary dictionaries must not be reused
+    memo.setdefault(id(memo), []).append(tree)
+    result: Dict[Any, Any] = {}
+    memo[id(tree)] = result
+    stack = [(tree, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            key = deepcopy(key, memo)
+            if type(value) is not dict:
+                target[key] = deepcopy(value, memo)
+                continue
+            copied = memo.get(id(value))
+            if copied is None:
+                copied = memo[id(value)] = {}
+                stack.append((value, copied))
+            target[key] = copied
+    return result
+
+
+def _class_attribute(cls: type, name: str) -> Any:
+    """ Get an attribute as stored in the class or its parents, without calling the accessors (_MISSING when there is none) """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return _MISSING
+
+
+class _Field:
+    """ Accessor of a declared field, reads the instance content before the class default can be found """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: Any) -> None:
+        """
+        Args:
+            name: Name of the field.
+            default: Value returned when the field is read on the class (_MISSING when there is none).
+        """
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        """
+        Read the field from the instance content.
+
+        Raises:
+            AttributeError: If the field is not set.
+        """
+        if instance is None:
+            if self.default is _MISSING:
+                raise AttributeError(
+                    f"type object '{owner.__name__}' has no attribute '{self.name}'"
+                )
+            return self.default
+        try:
+            value = instance._data[self.name]
+        except KeyError as e:
+            raise AttributeError(
+                f"'{instance._class_name}' object has no attribute '{self.name}'"
+            ) from e
+        if isinstance(value, _NESTED_TYPES):
+            return instance[self.name]
+        return value
+
+    def __set__(self, instance, value):
+        """
+        Store the field the same way as an item.
+        """
+        instance[self.name] = value
+
+    def __delete__(self, instance):
+        """
+        Delete the field the same way as an item.
+        """
+        del instance[self.name]
+
+
+class _ResponseField(_Field):
+    """ Accessor of a declared AskQuestionResponse field, reads the compact storage directly """
+
+    __slots__ = ("index",)
+
+    def __init__(self, name: str, index: int, default: Any) -> None:
+        """
+        Args:
+            name: Name of the field.
+            index: Position of the field in the compact storage.
+            default: Value returned when the field is read on the class.
+        """
+        super().__init__(name, default)
+        self.index = index
+
+    def __get__(self, instance, owner=None):
+        """
+        Read the field from the compact storage (or from _data once built).
+
+        Raises:
+            AttributeError: If the field was deleted.
+        """
+        if instance is None:
+            return self.default
+        values = instance._values
+        if values is not None:
+            value = values[self.index]
+            if isinstance(value, _NESTED_TYPES):
+                return instance[self.name]
+            return value
+        try:
+            return instance[self.name]
+        except KeyError as e:
+            raise AttributeError(
+                f"'{instance._class_name}' object has no attribute '{self.name}'"
+            ) from e
+
+
 class AskQuestionResponse(AQFlexibleDictionary[str, Any]):
     """
     Specialized response container for CLI or GUI question prompts.
 
     Includes fields such as `question`, `answer_type`, and `user_answer`.
     Supports both dictionary-style and attribute-style access.
+
+    The declared fields are stored in a compact list, the internal dictionary
+    is only built when a dictionary view is requested (items, keys, pop, an undeclared key, ...).
     """
+
+    # The values of the declared fields, None once the instance uses _data
+    __slots__ = ("_values",)
+
+    # False for the subclasses that change the declared fields
+    _compact_layout = True
+
     tui: bool = False
     allow_blanks: bool = False
     message: str = ""
@@ -419,3 +870,680 @@ class AskQuestionResponse(AQFlexibleDictionary[str, Any]):
     answer_found: bool = False
     raw_user_answer: str = ""
     user_answer: Union[str, int, float,  None, bool, List[Any]] = ""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Disable the compact storage for the subclasses declaring their own fields (and for their own subclasses).
+        """
+        super().__init_subclass__(**kwargs)
+        cls._compact_layout = cls._compact_layout is True and len(cls.__dict__.get("__annotations__", {})) == 0 and not any(
+            name in cls.__dict__ for name in _RESPONSE_FIELDS
+        )
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Initialize a new AskQuestionResponse instance.
+
+        Args:
+            **kwargs: Values of the fields (undeclared keys are allowed).
+        """
+        if self._compact_layout is False:
+            object.__setattr__(self, "_values", None)
+            super().__init__(**kwargs)
+            return
+        object.__setattr__(self, "_shared", False)
+        values = list(_RESPONSE_DEFAULTS)
+        extra = None
+        for key, value in kwargs.items():
+            index = _RESPONSE_INDEX.get(key)
+            if index is not None:
+                values[index] = value
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        # user_answer is the only field that is not a plain value
+        if isinstance(values[_USER_ANSWER_INDEX], dict):
+            values[_USER_ANSWER_INDEX] = _own_tree(values[_USER_ANSWER_INDEX])
+        if extra is None:
+            object.__setattr__(self, "_values", values)
+            return
+        data = dict(zip(_RESPONSE_FIELDS, values))
+        data.update(extra)
+        _own_nested(data)
+        object.__setattr__(self, "_values", None)
+        object.__setattr__(self, "_data", data)
+
+    @classmethod
+    def from_fields(cls, tui: bool, allow_blanks: bool, message: str, question: Union[str, None], answer_type: str, answer_found: bool, raw_user_answer: str, user_answer: Any) -> "AskQuestionResponse":
+        """
+        Create a response from the values of its declared fields, faster than setting them one by one.
+
+        Args:
+            tui, allow_blanks, message, question, answer_type, answer_found, raw_user_answer, user_answer: The values of the fields.
+
+        Returns:
+            A new AskQuestionResponse instance.
+        """
+        # user_answer is the only field that is not a plain value
+        if isinstance(user_answer, dict):
+            user_answer = _own_tree(user_answer)
+        values = [tui, allow_blanks, message, question, answer_type, answer_found, raw_user_answer, user_answer]
+        if cls._compact_layout is False:
+            return cls(**dict(zip(_RESPONSE_FIELDS, values)))
+        response = cls.__new__(cls)
+        object.__setattr__(response, "_values", values)
+        object.__setattr__(response, "_shared", False)
+        return response
+
+    def _own_values(self) -> List[Any]:
+        """
+        Get the compact storage before changing it, it is duplicated first when it is shared with a copy.
+
+        Returns:
+            The values of the declared fields, owned by this instance only.
+        """
+        values = self._values
+        if self._shared is True:
+            values = [
+                value.copy() if isinstance(value, AQFlexibleDictionary) else value
+                for value in values
+            ]
+            object.__setattr__(self, "_values", values)
+            object.__setattr__(self, "_shared", False)
+        return values
+
+    def _mapping(self) -> Dict[str, Any]:
+        """
+        Get the content as a dictionary without building _data.
+
+        Returns:
+            The internal data, or a temporary dictionary of the compact storage.
+        """
+        values = self._values
+        if values is None:
+            return self._data
+        return dict(zip(_RESPONSE_FIELDS, values))
+
+    def _materialize(self) -> Dict[str, Any]:
+        """
+        Move the compact storage to the internal dictionary.
+
+        Returns:
+            The internal data.
+        """
+        values = self._values
+        if values is None:
+            return super()._materialize()
+        data = dict(zip(_RESPONSE_FIELDS, values))
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_values", None)
+        return data
+
+    def __getattr__(self, name):
+        """
+        Fallback for attribute access on the undeclared keys.
+
+        Args:
+            name: Attribute name.
+
+        Returns:
+            The corresponding value from internal data.
+        """
+        if name == "_values":
+            # Not initialised yet (while unpickling)
+            raise AttributeError(
+                f"'{self._class_name}' object has no attribute '{name}'"
+            )
+        return super().__getattr__(name)
+
+    def __getitem__(self, key):
+        """
+        Retrieve a value by key, without building _data for the declared fields.
+
+        Args:
+            key: Key to access.
+
+        Returns:
+            Corresponding value.
+        """
+        values = self._values
+        if values is None:
+            return super().__getitem__(key)
+        index = _RESPONSE_INDEX.get(key)
+        if index is None:
+            raise KeyError(key)
+        value = values[index]
+        if isinstance(value, _NESTED_TYPES):
+            # The nested value can be changed by the caller, it must not be shared with a copy
+            values = self._own_values()
+            value = values[index]
+            if isinstance(value, dict):
+                value = values[index] = self._wrap(value)
+        return value
+
+    def __setitem__(self, key, value):
+        """
+        Set a value by key, an undeclared key builds _data.
+
+        Args:
+            key: Key to assign to.
+            value: Value to store.
+        """
+        if isinstance(value, dict):
+            value = _own_tree(value)
+        if self._values is not None:
+            index = _RESPONSE_INDEX.get(key)
+            if index is not None:
+                self._own_values()[index] = value
+                return
+        self._own()[key] = value
+
+    def __contains__(self, key):
+        """
+        Check if a key exists in the response.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            True if key exists, False otherwise.
+        """
+        if self._values is None:
+            return key in self._data
+        return key in _RESPONSE_INDEX
+
+    def __iter__(self):
+        """
+        Return iterator over the keys.
+
+        Returns:
+            Iterator over keys.
+        """
+        if self._values is None:
+            return iter(self._data)
+        return iter(_RESPONSE_FIELDS)
+
+    def __len__(self):
+        """
+        Return the number of stored keys.
+
+        Returns:
+            The number of items.
+        """
+        if self._values is None:
+            return len(self._data)
+        return len(_RESPONSE_FIELDS)
+
+    def __eq__(self, other):
+        """
+        Equality comparison, compares the compact storages directly when possible.
+
+        Args:
+            other: Another AQFlexibleDictionary or dict.
+
+        Returns:
+            True if contents are equal, False otherwise.
+        """
+        if isinstance(other, AskQuestionResponse):
+            values = self._values
+            other_values = other._values
+            if values is not None and other_values is not None and values == other_values:
+                return True
+        return super().__eq__(other)
+
+    def __setstate__(self, state: Dict):
+        """
+        Restore from pickled state, in the compact storage when the keys are the declared fields.
+
+        Args:
+            state: Dictionary representing internal data.
+        """
+        if self._compact_layout is True and tuple(state) == _RESPONSE_FIELDS:
+            self.__init__(**state)
+            return
+        object.__setattr__(self, "_values", None)
+        super().__setstate__(state)
+
+    def copy(self) -> "AskQuestionResponse":
+        """
+        Copy of this response, it shares the compact storage of the original until one of them changes it.
+
+        Returns:
+            A new AskQuestionResponse instance.
+        """
+        values = self._values
+        if values is None:
+            clone = super().copy()
+            object.__setattr__(clone, "_values", None)
+            return clone
+        clone = self.__class__.__new__(self.__class__)
+        object.__setattr__(clone, "_values", values)
+        object.__setattr__(clone, "_shared", True)
+        object.__setattr__(self, "_shared", True)
+        return clone
+
+    def get(self, key, default=None):
+        """
+        Return value for key if present.
+
+        Args:
+            key: Key to look for.
+            default: Value to return if key is missing.
+
+        Returns:
+            The value or default.
+        """
+        values = self._values
+        if values is None:
+            return super().get(key, default)
+        index = _RESPONSE_INDEX.get(key)
+        if index is None:
+            return default
+        return self[key]
+
+
+# The declared fields of AskQuestionResponse, their position in the compact storage and their defaults
+_RESPONSE_FIELDS: Tuple[str, ...] = AskQuestionResponse._fields
+_RESPONSE_INDEX: Dict[str, int] = {
+    name: index for index, name in enumerate(_RESPONSE_FIELDS)
+}
+_USER_ANSWER_INDEX: int = _RESPONSE_INDEX["user_answer"]
+_RESPONSE_DEFAULTS: Tuple[Any, ...] = tuple(
+    AskQuestionResponse._field_defaults[name] for name in _RESPONSE_FIELDS
+)
+for _index, _name in enumerate(_RESPONSE_FIELDS):
+    setattr(
+        AskQuestionResponse,
+        _name,
+        _ResponseField(_name, _index, _RESPONSE_DEFAULTS[_index])
+    )
+
+
+def _frozen_child(owner: "_Frozen", value: Union[AQFlexibleDictionary, Dict[str, Any]]) -> "_Frozen":
+    """ Create the frozen form of a nested dictionary, its own nested dictionaries are not frozen yet """
+    if isinstance(value, AQFlexibleDictionary):
+        cls = _frozen_class_of(type(value))
+        content = value._mapping()
+    else:
+        # Wrapped the same way as a nested dictionary that is read
+        cls = owner.__class__
+        content = value
+    child = cls.__new__(cls)
+    super(_Frozen, child).__init__(**content)
+    object.__setattr__(child, "_hash", None)
+    return child
+
+
+def _freeze(root: "_Frozen") -> None:
+    """
+    Replace the nested dictionaries of a new frozen dictionary by frozen ones, walked with a stack.
+
+    Raises:
+        ValueError: If a dictionary contains itself.
+    """
+    # The frozen form of the dictionaries already met (None while their content is frozen), keyed by the stored dictionary,
+    # a nested one is read from the copy made once for its source: a cycle of plain dictionaries meets the same ids again
+    frozen: Dict[int, Any] = {}
+    # (frozen dictionary, its remaining items, the dictionary it freezes, its parent, its key in the parent)
+    stack: List[Tuple[Any, Iterator, Any, Any, Any]] = [
+        (root, iter(list(root._mapping().items())), None, None, None)
+    ]
+    while stack:
+        node, items, source, parent, parent_key = stack[-1]
+        for key, value in items:
+            if isinstance(value, _Frozen) or not isinstance(value, _NESTED_TYPES):
+                continue
+            result = frozen.get(id(value), _MISSING)
+            if result is None:
+                raise ValueError(
+                    f"'{root._class_name}' cannot freeze a dictionary that contains itself"
+                )
+            if result is not _MISSING:
+                node._store(key, result)
+                continue
+            frozen[id(value)] = None
+            child = _frozen_child(node, value)
+            stack.append(
+                (child, iter(list(child._mapping().items())), value, node, key)
+            )
+            break
+        else:
+            stack.pop()
+            if source is not None:
+                frozen[id(source)] = node
+                parent._store(parent_key, node)
+
+
+class _Frozen:
+    """
+    Immutable behaviour shared by the frozen dictionaries, placed before the dictionary class it freezes.
+
+    The nested dictionaries are frozen when the instance is created, the hash is computed on its first use and kept.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Initialize a new frozen instance.
+
+        Args:
+            **kwargs: Key-value pairs of the dictionary, the nested dictionaries are frozen.
+
+        Raises:
+            ValueError: If a nested dictionary contains itself.
+        """
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_hash", None)
+        _freeze(self)
+
+    def _store(self, key, value) -> None:
+        """
+        Set a value while the instance is being frozen.
+
+        Args:
+            key: Key to assign to.
+            value: Value to store.
+        """
+        super().__setitem__(key, value)
+
+    def _frozen_error(self) -> TypeError:
+        """
+        Build the error raised by the changes.
+
+        Returns:
+            The error to raise.
+        """
+        return TypeError(f"'{self._class_name}' object is frozen, it cannot be changed")
+
+    def __hash__(self):
+        """
+        Hash of the content, computed once.
+
+        Returns:
+            The hash of the items.
+
+        Raises:
+            TypeError: If a value cannot be hashed (a list for example).
+        """
+        value = self._hash
+        if value is None:
+            # The nested dictionaries are hashed first, from the deepest one, the recursion stays one level deep
+            pending = [self]
+            order = []
+            while pending:
+                node = pending.pop()
+                order.append(node)
+                for item in node._mapping().values():
+                    if isinstance(item, _Frozen) and item._hash is None:
+                        pending.append(item)
+            for node in reversed(order):
+                if node._hash is None:
+                    object.__setattr__(node, "_hash", hash(frozenset(node._mapping().items())))
+            value = self._hash
+        return value
+
+    def __eq__(self, other):
+        """
+        Equality comparison, two frozen dictionaries with different hashes are different without comparing them.
+
+        Args:
+            other: Another AQFlexibleDictionary or dict.
+
+        Returns:
+            True if contents are equal, False otherwise.
+        """
+        if other is self:
+            return True
+        if isinstance(other, _Frozen):
+            try:
+                if hash(self) != hash(other):
+                    return False
+            except TypeError:
+                # A value cannot be hashed, the contents are compared
+                pass
+        return super().__eq__(other)
+
+    def __setattr__(self, name, value):
+        """
+        Refuse to change a key, the internal attributes can still be set.
+
+        Raises:
+            TypeError: If name is a key.
+        """
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        raise self._frozen_error()
+
+    def __setitem__(self, key, value):
+        """
+        Refuse to change a key.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+    def __delitem__(self, key):
+        """
+        Refuse to delete a key.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+    def __delattr__(self, key):
+        """
+        Refuse to delete a key.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+    def __or__(self, other):
+        """
+        Merge two dictionaries using the | operator.
+
+        Args:
+            other: Another dictionary.
+
+        Returns:
+            A new frozen dictionary.
+        """
+        if isinstance(other, dict):
+            merged = dict(self._mapping())
+            merged.update(other)
+            return self.__class__(**merged)
+        return NotImplemented
+
+    def __ior__(self, other):
+        """
+        Merge using the |= operator, the name is bound to a new frozen dictionary (like a frozenset).
+
+        Args:
+            other: A dictionary to merge.
+
+        Returns:
+            A new frozen dictionary.
+        """
+        return self.__or__(other)
+
+    def __reduce__(self):
+        """
+        Support for pickling, through the class it freezes (the frozen classes created by freeze cannot be found by their name).
+
+        Returns:
+            The function rebuilding the instance and its arguments.
+        """
+        thawed = next(klass for klass in type(self).__mro__ if not issubclass(klass, _Frozen))
+        return (_unpickle_frozen, (thawed, self.__getstate__()))
+
+    def __setstate__(self, state: Dict):
+        """
+        Restore from pickled state, the nested dictionaries are frozen again.
+
+        Args:
+            state: Dictionary representing internal data.
+        """
+        super().__setstate__(state)
+        object.__setattr__(self, "_hash", None)
+        _freeze(self)
+
+    def items(self):
+        """
+        Return key-value pairs, without changing the instance.
+
+        Returns:
+            dict_items of the content.
+        """
+        return self._mapping().items()
+
+    def keys(self):
+        """
+        Return keys of the dictionary, without changing the instance.
+
+        Returns:
+            dict_keys of the content.
+        """
+        return self._mapping().keys()
+
+    def values(self):
+        """
+        Return values of the dictionary, without changing the instance.
+
+        Returns:
+            dict_values of the content.
+        """
+        return self._mapping().values()
+
+    def copy(self):
+        """
+        An immutable object is its own copy.
+
+        Returns:
+            This instance.
+        """
+        return self
+
+    def freeze(self):
+        """
+        An immutable object is already frozen.
+
+        Returns:
+            This instance.
+        """
+        return self
+
+    def pop(self, key, default=None):
+        """
+        Refuse to remove a key.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+    def setdefault(self, key, default=None):
+        """
+        Refuse to insert a key.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+    def update(self, other=(), **kwargs):
+        """
+        Refuse to change the keys.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+    def clear(self):
+        """
+        Refuse to remove the keys.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise self._frozen_error()
+
+
+class FrozenAQFlexibleDictionary(_Frozen, AQFlexibleDictionary[str, Any]):
+    """
+    Immutable and hashable AQFlexibleDictionary, usable as a dictionary key or in a set.
+
+    The values must be hashable for the instance to be hashed.
+    """
+
+    # The hash, None until it is computed
+    __slots__ = ("_hash",)
+
+
+class _FrozenResponse(_Frozen):
+    """ Immutable behaviour of the frozen responses, the declared fields can be given at once """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_fields(cls, tui: bool, allow_blanks: bool, message: str, question: Union[str, None], answer_type: str, answer_found: bool, raw_user_answer: str, user_answer: Any) -> "_FrozenResponse":
+        """
+        Create a frozen response from the values of its declared fields.
+
+        Args:
+            tui, allow_blanks, message, question, answer_type, answer_found, raw_user_answer, user_answer: The values of the fields.
+
+        Returns:
+            A new frozen response.
+        """
+        response = super().from_fields(tui, allow_blanks, message, question, answer_type, answer_found, raw_user_answer, user_answer)
+        object.__setattr__(response, "_hash", None)
+        _freeze(response)
+        return response
+
+
+class FrozenAskQuestionResponse(_FrozenResponse, AskQuestionResponse):
+    """
+    Immutable and hashable AskQuestionResponse, usable as a dictionary key or in a set.
+
+    The user_answer must be hashable for the response to be hashed (a list answer is not).
+    """
+
+    # The hash, None until it is computed
+    __slots__ = ("_hash",)
+
+
+def _frozen_class_of(cls: type) -> type:
+    """ Get the frozen form of a dictionary class, created on its first use for the subclasses and kept on the class """
+    if issubclass(cls, _Frozen):
+        return cls
+    frozen = cls.__dict__.get("_frozen_class")
+    if frozen is None:
+        mixin = _FrozenResponse if issubclass(cls, AskQuestionResponse) else _Frozen
+        frozen = type(f"Frozen{cls.__name__}", (mixin, cls), {
+            "__doc__": f"Immutable and hashable {cls.__name__}, usable as a dictionary key or in a set.",
+            "__module__": cls.__module__,
+            "__qualname__": f"Frozen{cls.__qualname__}",
+            "__slots__": ("_hash",),
+        })
+        cls._frozen_class = frozen
+    return frozen
+
+
+def _unpickle_frozen(cls: type, state: Dict[str, Any]) -> "_Frozen":
+    """ Rebuild a pickled frozen dictionary from the class it freezes and its content """
+    frozen = _frozen_class_of(cls)
+    instance = frozen.__new__(frozen)
+    instance.__setstate__(state)
+    return instance
+
+
+# The frozen form of each dictionary class, see freeze
+AQFlexibleDictionary._frozen_class = FrozenAQFlexibleDictionary
+AskQuestionResponse._frozen_class = FrozenAskQuestionResponse
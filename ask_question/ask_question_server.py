@@ -0,0 +1,264 @@
+"""
+File in charge of serving questions to many clients at once over TCP or Unix sockets.
+The protocol is plain lines of text (a client such as nc is enough):
+the server writes the question, the client answers with one line.
+Every connection runs the handler in its own session while all the
+sessions share the validators compiled by a single AskQuestion instance.
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Union, TYPE_CHECKING
+
+from . import ask_question_async as AQA
+from .ask_question_response_paquet import AskQuestionResponse
+
+if TYPE_CHECKING:
+    from .ask_question import AskQuestion
+
+# Connections waiting to be accepted, asyncio defaults to 100 which drops the clients connecting in bursts
+DEFAULT_BACKLOG = 1024
+
+
+class SessionStatistics:
+    """ The counters of a session (or of a whole server), latencies are measured from the question to the accepted answer """
+
+    def __init__(self) -> None:
+        """ The globals for the class """
+        self.sessions = 0
+        self.questions = 0
+        self.answers = 0
+        self.answers_found = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.started_at = time.perf_counter()
+        self.finished_at: Union[float, None] = None
+
+    @property
+    def answers_not_found(self) -> int:
+        """ The number of refused answers """
+        return self.answers - self.answers_found
+
+    @property
+    def elapsed(self) -> float:
+        """ The number of seconds spent since the session started """
+        end = self.finished_at
+        if end is None:
+            end = time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def average_latency(self) -> float:
+        """ The average number of seconds spent to get an accepted answer """
+        if self.answers_found == 0:
+            return 0.0
+        return self.total_latency / self.answers_found
+
+    @property
+    def answers_per_second(self) -> float:
+        """ The number of answers received per second """
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return self.answers / elapsed
+
+    def add_latency(self, latency: float) -> None:
+        """ Record the latency of an accepted answer """
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def merge(self, other: "SessionStatistics") -> None:
+        """ Add the counters of a finished session """
+        self.sessions += other.sessions
+        self.questions += other.questions
+        self.answers += other.answers
+        self.answers_found += other.answers_found
+        self.total_latency += other.total_latency
+        if other.max_latency > self.max_latency:
+            self.max_latency = other.max_latency
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """ Convert the statistics to a dictionary """
+        return {
+            "sessions": self.sessions,
+            "questions": self.questions,
+            "answers": self.answers,
+            "answers_found": self.answers_found,
+            "answers_not_found": self.answers_not_found,
+            "elapsed": self.elapsed,
+            "average_latency": self.average_latency,
+            "max_latency": self.max_latency,
+            "answers_per_second": self.answers_per_second,
+        }
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+
+class QuestionSession:
+    """ The state of one connection, the handler asks its questions through it """
+
+    def __init__(self, answer_question: "AskQuestion", reader: asyncio.StreamReader, writer: asyncio.StreamWriter, session_id: int, timeout: Union[float, None] = None) -> None:
+        """ The globals for the class """
+        self.answer_question = answer_question
+        self.reader = reader
+        self.writer = writer
+        self.session_id = session_id
+        self.timeout = timeout
+        self.peer = writer.get_extra_info("peername")
+        self.responses: List[AskQuestionResponse] = []
+        # Free storage for the handler
+        self.data: Dict[str, Any] = {}
+        self.statistics = SessionStatistics()
+        self.statistics.sessions = 1
+
+    async def send(self, text: str) -> None:
+        """ Send a line to the client """
+        await AQA.write(f"{text}\n", self.writer)
+
+    def _count_answer(self, answer_found: bool) -> None:
+        """ Count an answer received by the session """
+        self.statistics.answers += 1
+        if answer_found is True:
+            self.statistics.answers_found += 1
+
+    async def _ask_until_valid(self, question: str, answer_type: str) -> AskQuestionResponse:
+        """ Ask the question until the answer matches the type """
+        statistics = self.statistics
+        statistics.questions += 1
+        asked_at = time.perf_counter()
+        response = await AQA._ask_until_valid(
+            self.answer_question, question, answer_type, self.reader, self.writer, self._count_answer
+        )
+        statistics.add_latency(time.perf_counter() - asked_at)
+        return response
+
+    async def ask_question_detailed(self, question: str, answer_type: str, timeout: Union[float, None] = None) -> AskQuestionResponse:
+        """_summary_
+            Ask a question to the client until the answer matches the type.
+
+        Args:
+            question (str): _description_: The question sent to the client.
+            answer_type (str): _description_: The type of answer expected.
+            timeout (Union[float, None], optional): _description_: The number of seconds given to answer. Defaults to None (the timeout of the server).
+
+        Returns:
+            AskQuestionResponse: _description_: The details of the response.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        response = await asyncio.wait_for(
+            self._ask_until_valid(str(question), answer_type),
+            timeout
+        )
+        self.responses.append(response)
+        return response
+
+    async def ask_question(self, question: str, answer_type: str, timeout: Union[float, None] = None) -> Union[str, int, float, None, bool, List[Any]]:
+        """ Ask a question to the client and return the converted answer """
+        response = await self.ask_question_detailed(question, answer_type, timeout)
+        return response["user_answer"]
+
+    async def pause(self, pause_message: str = "Press enter to continue...", timeout: Union[float, None] = None) -> None:
+        """ Wait for the client to send a line """
+        if timeout is None:
+            timeout = self.timeout
+        await AQA.pause(pause_message, reader=self.reader, writer=self.writer, timeout=timeout)
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}(session_id={self.session_id}, peer={self.peer!r})"
+
+
+SessionHandler = Callable[[QuestionSession], Awaitable[Any]]
+
+
+class AskQuestionServer:
+    """ Serve the questions of a handler to every client connecting to the server """
+
+    def __init__(self, answer_question: "AskQuestion", handler: SessionHandler, timeout: Union[float, None] = None, on_session_end: Union[Callable[[QuestionSession], None], None] = None) -> None:
+        """_summary_
+            Create the server, call start_tcp or start_unix to listen.
+
+        Args:
+            answer_question (AskQuestion): _description_: The instance whose configuration (and compiled validators) is shared by the sessions.
+            handler (SessionHandler): _description_: The coroutine run for every connection, it receives the QuestionSession.
+            timeout (Union[float, None], optional): _description_: The default number of seconds given to answer a question. Defaults to None (no limit).
+            on_session_end (Union[Callable[[QuestionSession], None], None], optional): _description_: Called with every finished session. Defaults to None.
+        """
+        self.answer_question = answer_question
+        self.handler = handler
+        self.timeout = timeout
+        self.on_session_end = on_session_end
+        self.sessions: Dict[int, QuestionSession] = {}
+        # The counters of the finished sessions
+        self.statistics = SessionStatistics()
+        self.server: Union[asyncio.AbstractServer, None] = None
+        self._session_ids = itertools.count(1)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ Run the handler for a new connection """
+        session = QuestionSession(
+            self.answer_question,
+            reader,
+            writer,
+            next(self._session_ids),
+            self.timeout
+        )
+        self.sessions[session.session_id] = session
+        try:
+            await self.handler(session)
+        except (EOFError, ConnectionError, asyncio.TimeoutError):
+            # The client left (or stopped answering)
+            pass
+        finally:
+            del self.sessions[session.session_id]
+            session.statistics.finished_at = time.perf_counter()
+            self.statistics.merge(session.statistics)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            if self.on_session_end is not None:
+                self.on_session_end(session)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0, backlog: int = DEFAULT_BACKLOG, **kwargs: Any) -> asyncio.AbstractServer:
+        """ Listen on a TCP address, a port of 0 picks a free port (see the address property) """
+        self.server = await asyncio.start_server(self._handle_connection, host, port, backlog=backlog, **kwargs)
+        return self.server
+
+    async def start_unix(self, path: str, backlog: int = DEFAULT_BACKLOG, **kwargs: Any) -> asyncio.AbstractServer:
+        """ Listen on a Unix domain socket """
+        self.server = await asyncio.start_unix_server(self._handle_connection, path, backlog=backlog, **kwargs)
+        return self.server
+
+    @property
+    def address(self) -> Any:
+        """ The address the server listens on """
+        if self.server is None or len(self.server.sockets) == 0:
+            return None
+        return self.server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        """ Serve the clients until the task is cancelled """
+        if self.server is None:
+            raise RuntimeError("The server must be started with start_tcp or start_unix first")
+        await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """ Stop listening and wait for the server to close """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def __aenter__(self) -> "AskQuestionServer":
+        """ Use the server as an async context manager """
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """ Stop the server when leaving the context """
+        await self.close()
@@ -0,0 +1,240 @@
+"""
+File in charge of validating answers read lazily from a stream (a file, stdin, a CSV column or a JSONL field).
+Only one record (or one chunk of records) is held in memory at a time
+and nothing is read before the consumer asks for the next result.
+"""
+
+import csv
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union, TYPE_CHECKING
+
+from .ask_question_response_batch import ResponseBatch
+from .ask_question_response_paquet import AskQuestionResponse
+
+if TYPE_CHECKING:
+    from .ask_question import AskQuestion
+
+SOURCE_FORMATS = ("lines", "csv", "jsonl")
+
+Schema = Dict[Union[str, int], str]
+StreamResult = Union[
+    AskQuestionResponse,
+    ResponseBatch,
+    Dict[Union[str, int], AskQuestionResponse],
+    Dict[Union[str, int], ResponseBatch]
+]
+
+
+class StreamStatistics:
+    """ The counters of a validation stream, updated while the stream is consumed """
+
+    def __init__(self) -> None:
+        """ The globals for the class """
+        self.records = 0
+        self.answers = 0
+        self.answers_found = 0
+        self.started_at = time.perf_counter()
+        self.finished_at: Union[float, None] = None
+
+    @property
+    def answers_not_found(self) -> int:
+        """ The number of refused answers """
+        return self.answers - self.answers_found
+
+    @property
+    def elapsed(self) -> float:
+        """ The number of seconds spent since the stream started """
+        end = self.finished_at
+        if end is None:
+            end = time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        """ The number of records read per second """
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return self.records / elapsed
+
+    @property
+    def answers_per_second(self) -> float:
+        """ The number of answers checked per second """
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return self.answers / elapsed
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """ Convert the statistics to a dictionary """
+        return {
+            "records": self.records,
+            "answers": self.answers,
+            "answers_found": self.answers_found,
+            "answers_not_found": self.answers_not_found,
+            "elapsed": self.elapsed,
+            "records_per_second": self.records_per_second,
+            "answers_per_second": self.answers_per_second,
+        }
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+
+def _field_to_answer(value: Any) -> str:
+    """ Convert a CSV or JSON value to the raw answer that is checked """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def read_records(source: Union[Iterable[str], None] = None, source_format: str = "lines", fields: Union[List[Union[str, int]], None] = None) -> Iterator[Union[str, Dict[Union[str, int], str]]]:
+    """_summary_
+        Lazily read the answers of a stream.
+
+    Args:
+        source (Union[Iterable[str], None], optional): _description_: A text file object (or any iterable of lines). Defaults to None (stdin).
+        source_format (str, optional): _description_: "lines", "csv" or "jsonl". Defaults to "lines".
+        fields (Union[List[Union[str, int]], None], optional): _description_: The CSV columns (names or indexes) or the JSONL fields to read. Defaults to None.
+
+    Yields:
+        Union[str, Dict[Union[str, int], str]]: _description_: The line (lines format) or a dictionary of the requested fields.
+    """
+    if source is None:
+        source = sys.stdin
+    if source_format not in SOURCE_FORMATS:
+        raise ValueError(
+            f"Unknown source format '{source_format}', expected one of {SOURCE_FORMATS}"
+        )
+    if source_format == "lines":
+        for line in source:
+            yield line.rstrip("\r\n")
+        return
+    if not fields:
+        raise ValueError(
+            f"The {source_format} format requires the column or field to read"
+        )
+    if source_format == "jsonl":
+        for line in source:
+            if line.strip() == "":
+                continue
+            record = json.loads(line)
+            yield {field: _field_to_answer(record.get(field)) for field in fields}
+        return
+    rows = csv.reader(source)
+    indexes = list(fields)
+    if any(isinstance(field, str) for field in fields):
+        header = next(rows, [])
+        for position, field in enumerate(fields):
+            if isinstance(field, str):
+                if field not in header:
+                    raise KeyError(f"Column '{field}' not found in the CSV header")
+                indexes[position] = header.index(field)
+    for row in rows:
+        yield {
+            field: row[index] if index < len(row) else ""
+            for field, index in zip(fields, indexes)
+        }
+
+
+def _build_response(answer_question: "AskQuestion", validator: Any, raw_user_answer: str) -> AskQuestionResponse:
+    """ Check one answer and wrap the result in a response """
+    answer_found, user_answer, message = validator.validate(raw_user_answer)
+    return answer_question._create_response(
+        raw_user_answer,
+        message,
+        answer_found,
+        user_answer,
+        validator.answer_type
+    )
+
+
+def validate_stream(answer_question: "AskQuestion", source: Union[Iterable[str], None], answer_type: Union[str, Schema], source_format: str = "lines", field: Union[str, int, None] = None, chunk_size: int = 0, engine: str = "auto", statistics: Union[StreamStatistics, None] = None, on_progress: Union[Callable[[StreamStatistics], None], None] = None, progress_interval: int = 10000) -> Iterator[StreamResult]:
+    """_summary_
+        Validate the answers of a stream lazily, see AskQuestion.validate_stream.
+    """
+    if isinstance(answer_type, dict):
+        schema: Schema = dict(answer_type)
+        single_field = False
+    else:
+        if source_format != "lines" and field is None:
+            raise ValueError(
+                f"The {source_format} format requires the column or field to read"
+            )
+        schema = {field: answer_type}
+        single_field = True
+        if source_format == "lines" and field is not None:
+            raise ValueError("The lines format does not have fields")
+    if source_format == "lines" and single_field is False:
+        raise ValueError("A schema can only be used with the csv and jsonl formats")
+    if statistics is None:
+        statistics = StreamStatistics()
+    validators = {name: answer_question.compile(kind) for name, kind in schema.items()}
+    records = read_records(
+        source,
+        source_format,
+        None if source_format == "lines" else list(schema)
+    )
+    next_progress = progress_interval
+
+    def _progress() -> None:
+        nonlocal next_progress
+        if on_progress is not None and progress_interval > 0 and statistics.records >= next_progress:
+            next_progress = statistics.records + progress_interval
+            on_progress(statistics)
+
+    if chunk_size <= 0:
+        for record in records:
+            if source_format == "lines":
+                record = {None: record}
+            results = {
+                name: _build_response(answer_question, validators[name], record[name])
+                for name in schema
+            }
+            statistics.records += 1
+            statistics.answers += len(results)
+            statistics.answers_found += sum(
+                1 for result in results.values() if result["answer_found"] is True
+            )
+            _progress()
+            if single_field is True:
+                yield results[field]
+            else:
+                yield results
+    else:
+        chunk: List[Any] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield _validate_chunk(answer_question, chunk, schema, source_format, single_field, engine, statistics)
+                chunk = []
+                _progress()
+        if len(chunk) > 0:
+            yield _validate_chunk(answer_question, chunk, schema, source_format, single_field, engine, statistics)
+            _progress()
+    statistics.finished_at = time.perf_counter()
+    if on_progress is not None:
+        on_progress(statistics)
+
+
+def _validate_chunk(answer_question: "AskQuestion", chunk: List[Any], schema: Schema, source_format: str, single_field: bool, engine: str, statistics: StreamStatistics) -> Union[ResponseBatch, Dict[Union[str, int], ResponseBatch]]:
+    """ Validate a chunk of records, one batch per field """
+    batches: Dict[Union[str, int], ResponseBatch] = {}
+    for name, kind in schema.items():
+        if source_format == "lines":
+            answers = chunk
+        else:
+            answers = [record[name] for record in chunk]
+        batch = answer_question.test_inputs(answers, kind, engine=engine)
+        statistics.answers += len(batch)
+        statistics.answers_found += batch.found_count
+        batches[name] = batch
+    statistics.records += len(chunk)
+    if single_field is True:
+        return next(iter(batches.values()))
+    return batches
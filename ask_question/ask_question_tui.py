@@ -14,9 +14,19 @@ Crediting the author is appreciated.
 
 __Author__ = "(c) Henry Letellier"
 
-from typing import Union, Dict
+from contextlib import contextmanager
+from time import monotonic
+from typing import Any, Iterator, Union, Dict
 
-from ask_question import Ask_Question as AskQuestionAnswerProcessing
+try:
+    from .ask_question import AskQuestion as AskQuestionAnswerProcessing
+except ImportError:
+    try:
+        from ask_question import AskQuestion as AskQuestionAnswerProcessing
+    except ImportError as exc:
+        raise ImportError(
+            "Class AskQuestion not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
 
 try:
     import asciimatics.widgets as WIG
@@ -26,14 +36,74 @@ try:
     from asciimatics_overlay_ov import AsciiMaticsOverlayMain
 except ImportError as exc:
     raise ImportError(
-        "Class AskQuestionTUI requires matplotlib. Install with `pip install ask_question[tui]`."
+        "Class AskQuestionTUI requires asciimatics. Install with `pip install ask_question[tui]`."
     ) from exc
 
+try:
+    from .ask_question_incremental import INVALID
+except ImportError:
+    try:
+        from ask_question.ask_question_incremental import INVALID
+    except ImportError as exc:
+        raise ImportError(
+            "Module ask_question_incremental not found in the module, make sure the path is valid or that your module is not corrupt"
+        ) from exc
+
+# The seconds without a key press before the live error message is updated
+DEFAULT_DEBOUNCE = 0.15
+
+
+class HeadlessScreen(SC.Screen):
+    """ A screen that draws nothing and receives no event, to build and refresh the frames without a terminal (tests, benchmarks) """
+
+    def __init__(self, height: int = 24, width: int = 80, unicode_aware: bool = True) -> None:
+        """ The globals for the class """
+        super().__init__(height, width, height, unicode_aware)
+
+    def _change_colours(self, colour: int, attr: int, bg: int) -> None:
+        """ Nothing to draw """
+
+    def _clear(self) -> None:
+        """ Nothing to draw """
+
+    def _print_at(self, text: str, x: int, y: int, width: int) -> None:
+        """ Nothing to draw """
+
+    def _scroll(self, lines: int) -> None:
+        """ Nothing to draw """
+
+    def close(self, restore: bool = True) -> None:
+        """ Nothing to restore """
+
+    def get_event(self) -> None:
+        """ No event is ever received """
+        return None
+
+    def has_resized(self) -> bool:
+        """ The size never changes """
+        return False
+
+    def set_title(self, title: str) -> None:
+        """ There is no title to set """
+
+    def wait_for_input(self, timeout: float) -> None:
+        """ No input will come """
+
+
+def _relabel(widget: WIG.Widget, label: str) -> None:
+    """ Change the label of a placed widget without placing the widgets again (asciimatics 1.15 has no label setter, its private attributes are written here only) """
+    widget._label = label
+    widget._display_label = None
+    # The layout gives a label column at most a third of the widget width, the width of the widget does not depend on it
+    limit = widget._w // 3
+    if widget._offset < limit and widget.string_len(label) + 1 > widget._offset:
+        widget._offset = limit
+
 
 class AskQuestionTUIManagement(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
     """ The class in charge of managing the TUI """
 
-    def __init__(self, screen: SC, ask_question_answer_processing: AskQuestionAnswerProcessing, question: str, answer_type: str, screen_width: int, screen_height: int, screen_offset_x: int, screen_offset_y: int) -> None:
+    def __init__(self, screen: SC, ask_question_answer_processing: AskQuestionAnswerProcessing, question: str, answer_type: str, screen_width: int, screen_height: int, screen_offset_x: int, screen_offset_y: int, live_validation: bool = False, debounce: float = DEFAULT_DEBOUNCE) -> None:
         """ The globals for the class """
         final_screen_width = self._recalculate_screen_width(
             screen.width,
@@ -53,22 +123,36 @@ class AskQuestionTUIManagement(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             has_border=True,
             title="Ask question (TUI version)"
         )
+        # Frame.__init__ does not reach the overlay classes, they provide the success/error codes and the label alignments
+        FrameNodes.__init__(self)
         self.__version__ = "1.0.0"
         self.author = "(c) Henry Letellier"
         self.version = self.__version__
         self.question = question
         self.answer_type = answer_type
-        self.screen = screen
         self.usr_answer = ""
+        self.answer_found = False
         self.error_message = ""
         self.textbox_widget = None
         self.error_message_widget = None
         self.user_has_decided_to_quit = False
         self.run_status = self.success
+        # The number of times the widgets were placed and sized (fix), a reused frame never does it again
+        self.layout_count = 0
 
         self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
         self.frame_node = FrameNodes()
         self.ask_question_answer_processing = ask_question_answer_processing
+        # Check the answer while it is typed, the error message only changes once the keys stop for debounce seconds
+        self.live_validation = live_validation
+        self.debounce = debounce
+        self.live_validator = None
+        self.live_status = ""
+        self.error_redraw_count = 0
+        self._pending_error_message = None
+        self._last_key_time = 0.0
+        if live_validation is True:
+            self.live_validator = ask_question_answer_processing.compile(answer_type).incremental()
 
         # Define a layout with three columns
         self.layout = WIG.Layout([100], fill_frame=True)
@@ -77,6 +161,36 @@ class AskQuestionTUIManagement(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         self.add_layout(self.layout_buttons)
         self.place_content_on_screen()
         self.fix()
+        # Without a value the textbox cannot be drawn before the scene resets the frame
+        self.textbox_widget.value = ""
+
+    def fix(self) -> None:
+        """ Place and size the widgets """
+        super().fix()
+        self.layout_count += 1
+
+    def set_question(self, question: str, answer_type: str) -> None:
+        """_summary_
+            Reuse the frame for another question, only the question, the answer type and the answer state change.
+            The widgets are never placed again: the first label needing more room widens the label column to its limit (a third of the width) for the rest of the session.
+
+        Args:
+            question (str): _description_: The question to display.
+            answer_type (str): _description_: The type of answer expected of the user.
+        """
+        textbox = self.textbox_widget
+        self.question = question
+        self.answer_type = answer_type
+        self.usr_answer = ""
+        self.answer_found = False
+        self.user_has_decided_to_quit = False
+        self.run_status = self.success
+        _relabel(textbox, question)
+        if self.live_validation is True:
+            self.live_validator = self.ask_question_answer_processing.compile(answer_type).incremental()
+        textbox.value = ""
+        self._pending_error_message = None
+        self._reset_error_message()
 
     def _recalculate_screen_height(self, screen_height: int, usr_screen_height: int, usr_screen_offset: int) -> int:
         """ Recalculate the screen size """
@@ -104,7 +218,7 @@ class AskQuestionTUIManagement(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             name="usr_input",
             as_string=True,
             line_wrap=True,
-            on_change=self._reset_error_message,
+            on_change=self._on_change,
             readonly=False
         )
         self.error_message_widget = self.add_label(
@@ -138,40 +252,98 @@ class AskQuestionTUIManagement(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         self.apply_text_to_display(
             self.error_message_widget, self.error_message)
 
+    def _on_change(self) -> None:
+        """ Called on every change of the answer, only the characters that changed are checked when the live validation is enabled """
+        if self.live_validation is False or self.live_validator is None:
+            self._reset_error_message()
+            return
+        usr_input = self.textbox_widget.value
+        if usr_input is None:
+            usr_input = ""
+        self.live_status = self.live_validator.set_text(usr_input)
+        if self.live_status == INVALID:
+            self._pending_error_message = self.live_validator.message
+        else:
+            self._pending_error_message = ""
+        self._last_key_time = monotonic()
+
+    def flush_live_validation(self, now: Union[float, None] = None) -> bool:
+        """_summary_
+            Display the error message of the live validation once no key was pressed for debounce seconds.
+            Only the answers that can no longer become valid get an error message, the ones being typed are left alone.
+
+        Args:
+            now (Union[float, None], optional): _description_: The current time.monotonic() value. Defaults to None.
+
+        Returns:
+            bool: _description_: True when the error message was changed.
+        """
+        message = self._pending_error_message
+        if message is None:
+            return False
+        if now is None:
+            now = monotonic()
+        if now - self._last_key_time < self.debounce:
+            return False
+        self._pending_error_message = None
+        if message == self.error_message:
+            return False
+        self.error_message = message
+        self.apply_text_to_display(self.error_message_widget, message)
+        self.error_redraw_count += 1
+        return True
+
+    @property
+    def frame_update_count(self) -> int:
+        """ The number of frames before the next refresh, every frame while an error message waits for the debounce """
+        if self._pending_error_message is not None:
+            return 1
+        return super().frame_update_count
+
+    def _update(self, frame_no: int) -> None:
+        """ Refresh the frame """
+        self.flush_live_validation()
+        super()._update(frame_no)
+
     def _check_usr_input(self) -> Union[str, int, float, bool]:
         """ Check the input provided by the user """
         usr_input = self.get_widget_value(self.textbox_widget)
-        self.usr_answer = self.ask_question_answer_processing.test_input(
-            usr_input, self.answer_type, is_tui=True)
-        if isinstance(self.usr_answer, list) is True:
+        response = self.ask_question_answer_processing.test_input(
+            usr_input,
+            self.answer_type,
+            print_error=False,
+            tui=True
+        )
+        self.answer_found = response["answer_found"]
+        if self.answer_found is False:
             self.apply_text_to_display(
                 self.error_message_widget,
-                self.usr_answer[1]
+                response["message"]
             )
-            self.error_message = self.usr_answer[1]
+            self.error_message = response["message"]
             self.run_status = self.error
+            self.usr_answer = ""
         else:
             self._reset_error_message()
             self.run_status = self.success
-            return self.usr_answer
+            self.usr_answer = response["user_answer"]
+        return self.usr_answer
 
-    def _submit(self) -> str:
-        """ Submit the answer """
-        self._check_usr_input()
-        if isinstance(self.usr_answer, list) is True:
-            self.usr_answer = self.usr_answer[0]
-        self._exit()
+    def _submit(self) -> Union[str, int, float, bool]:
+        """ Submit the answer, it is kept only when it matches the answer type """
+        return self._check_usr_input()
 
     def _exit(self) -> None:
         """ Exit the Scene """
         self.usr_answer = ""
+        self.answer_found = False
         self.user_has_decided_to_quit = True
 
 
 class AskQuestionTUI:
     """ An advanced function that contains boiling to gain time when asking a question """
 
-    def __init__(self, screen: SC, human_type: Dict = {}, illegal_characters_nb: str = "", screen_width: int = -1, screen_height: int = -1, screen_offset_x: int = 0, screen_offset_y: int = 0, tui_enabled: bool = True) -> None:
+    def __init__(self, screen: SC, human_type: Dict = {}, illegal_characters_nb: str = "", screen_width: int = -1, screen_height: int = -1, screen_offset_x: int = 0, screen_offset_y: int = 0, tui_enabled: bool = True, input_provider: Any = None, reuse_frame: bool = False, live_validation: bool = False, debounce: float = DEFAULT_DEBOUNCE) -> None:
         """ The globals for the class """
         self.__version__ = "1.0.0"
         self.human_type = human_type
@@ -191,10 +363,16 @@ class AskQuestionTUI:
             self.tui_enabled = True
         else:
             self.tui_enabled = tui_enabled
+        # Keep the frame of the first question for the next ones (see session)
+        self.reuse_frame = reuse_frame
+        # Check the answer while it is typed (see AskQuestionTUIManagement.flush_live_validation)
+        self.live_validation = live_validation
+        self.debounce = debounce
         self.ask_question_tui_management = None
         self.ask_question_answer_processing = AskQuestionAnswerProcessing(
             human_type=human_type,
-            illegal_characters_nb=illegal_characters_nb
+            illegal_characters_nb=illegal_characters_nb,
+            input_provider=input_provider
         )
 
     def ask_question_tty(self, question: str, answer_type: str) -> Union[str, int, float, bool]:
@@ -203,19 +381,29 @@ class AskQuestionTUI:
         usr_answer = ""
         self.usr_answer = ""
         while answer_found is False:
-            usr_answer = input(str(question))
-            answer_found = self.ask_question_answer_processing.test_input(
+            usr_answer = self.ask_question_answer_processing.input_provider.read_answer(
+                str(question)
+            )
+            response = self.ask_question_answer_processing.test_input(
                 usr_answer,
                 answer_type,
-                is_tui=False
+                print_error=False,
+                tui=False
             )
-            if isinstance(answer_found, list) is True:
-                answer_found = False
+            answer_found = response["answer_found"]
+            if answer_found is False:
+                self.ask_question_answer_processing.input_provider.display(
+                    response["message"]
+                )
         self.usr_answer = self.ask_question_answer_processing.usr_answer
         return self.usr_answer
 
-    def ask_question_tui(self, question: str, answer_type: str) -> Union[str, int, float, bool]:
-        """ Display a graphical interface to ask the question """
+    def get_frame(self, question: str, answer_type: str) -> AskQuestionTUIManagement:
+        """ Get the frame displaying the question, the previous one is updated when the frames are reused """
+        aqtuim = self.ask_question_tui_management
+        if self.reuse_frame is True and aqtuim is not None and aqtuim.screen is self.screen:
+            aqtuim.set_question(question, answer_type)
+            return aqtuim
         aqtuim = AskQuestionTUIManagement(
             screen=self.screen,
             ask_question_answer_processing=self.ask_question_answer_processing,
@@ -224,8 +412,28 @@ class AskQuestionTUI:
             screen_width=self.screen_width,
             screen_height=self.screen_height,
             screen_offset_x=self.screen_offset_x,
-            screen_offset_y=self.screen_offset_y
+            screen_offset_y=self.screen_offset_y,
+            live_validation=self.live_validation,
+            debounce=self.debounce
         )
+        self.ask_question_tui_management = aqtuim
+        return aqtuim
+
+    @contextmanager
+    def session(self) -> Iterator["AskQuestionTUI"]:
+        """ Reuse a single frame for all the questions asked in the with block """
+        previous = self.reuse_frame
+        self.reuse_frame = True
+        try:
+            yield self
+        finally:
+            self.reuse_frame = previous
+            if previous is False:
+                self.ask_question_tui_management = None
+
+    def ask_question_tui(self, question: str, answer_type: str) -> Union[str, int, float, bool]:
+        """ Display a graphical interface to ask the question """
+        aqtuim = self.get_frame(question, answer_type)
         self.usr_answer = aqtuim.usr_answer
         self.user_has_decided_to_quit = aqtuim.user_has_decided_to_quit
         return self.usr_answer
@@ -241,7 +449,9 @@ class AskQuestionTUI:
     def pause(self, pause_message: str = "Press enter to continue...") -> None:
         """ Act like the windows batch pause function """
         empty = ""
-        pause_response = input(pause_message)
+        pause_response = self.ask_question_answer_processing.input_provider.read_answer(
+            pause_message
+        )
         empty += pause_response
 
 
@@ -0,0 +1,483 @@
+"""
+File in charge of compiling an answer type into a reusable validator.
+Compiling resolves the answer type (and the parsers it needs) once so that
+checking an answer only runs the parsers that can match the type.
+"""
+
+from functools import lru_cache
+from string import printable
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Tuple, Union
+
+EMPTY_RESPONSE_MESSAGE = "Response must not be empty or only contain spaces or any non visible character."
+
+DEFAULT_HUMAN_TYPE: Dict[str, str] = {
+    "int": "whole number (-1, 0, 1, 2, 3, etc...)",
+    "float": "floating number (-1.2, 0.1, 1.2, etc...)",
+    "uint": "whole positive number (0, 1, 2, etc...)",
+    "ufloat": "whole positive floating number (0.1, 1.2, etc ...)",
+    "num": "numeric (numbers from 0 onwards)",
+    "alnum": "alphanumeric (only numbers and the alphabet)",
+    "alpha": "alphabet (from a to z and A to Z)",
+    "char": "alphabet (from a to z and A to Z)",
+    "ascii": "ascii Table",
+    "str": "string (any character you can type)",
+    "version": "version (numbers separated by '.' characters)",
+    "ver": "version (numbers separated by '.' characters)",
+    "bool": "boolean (yes/True/1 or no/False/0 answer type)",
+    "up": "Convert the user input to uppercase",
+    "low": "Convert the user input to lowercase"
+}
+
+DEFAULT_ILLEGAL_CHARACTERS_NB: str = printable\
+    .replace("-", "")\
+    .replace(".", "")\
+    .replace(",", "")\
+    .replace("+", "")\
+    .replace("0123456789", "")
+
+# Characters accepted by the str type
+PRINTABLE_CHARACTERS: FrozenSet[str] = frozenset(printable)
+
+ParsedAnswer = Tuple[bool, Union[str, int, float, None, bool]]
+AnswerParser = Callable[[str, bool], ParsedAnswer]
+ValidationResult = Tuple[bool, Union[str, int, float, None, bool], str]
+# The result of a check, what decided it and the seconds spent in the (blank, illegal_characters, parse) stages
+TracedValidation = Tuple[ValidationResult, str, Tuple[float, float, float]]
+
+# What decided the result when no parser did
+RESOLVED_BY_BLANK = "blank"
+RESOLVED_BY_NOT_PRINTABLE = "not_printable"
+RESOLVED_BY_NONE = "none"
+# The result was remembered by the memo (see AskQuestion.enable_memoization)
+RESOLVED_BY_MEMO = "memo"
+
+_NOT_FOUND: ParsedAnswer = (False, "")
+
+
+def clean_answer_type(answer_type: str) -> str:
+    """ Remove the 'is' prefix variations from the answer type """
+    return answer_type\
+        .replace("is", "", 1)\
+        .replace("is_", "", 1)\
+        .replace("is ", "", 1)
+
+
+def is_version(string: str) -> bool:
+    """ Check if the given string is a version """
+    if string == "":
+        return True
+    if string[-1] == "." or string[-1] == ",":
+        return False
+    return string.replace(".", "").replace(",", "").isdigit()
+
+
+def is_float(number: str) -> bool:
+    """ Check if the given string is a float """
+    try:
+        float(number)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=32)
+def character_set(characters: str) -> FrozenSet[str]:
+    """ Compile a string of characters into a set, cached per distinct string """
+    return frozenset(characters)
+
+
+def contains_illegal_characters(string: str, illegal_characters: Union[str, FrozenSet[str]]) -> bool:
+    """ Check if there are no forbidden characters in a string destined to be converted to a number """
+    if isinstance(illegal_characters, str):
+        illegal_characters = character_set(illegal_characters)
+    return illegal_characters.isdisjoint(string) is False
+
+
+def remove_char_overflow(string: str, char: str, presence_tolerance: int = 1, case_sensitive: bool = False) -> str:
+    """ Remove the number of times a specific character appears in a string after the allowed number of times """
+    if case_sensitive is True or char.lower() == char.upper():
+        return _trim_overflow(string, char, presence_tolerance)
+    result = []
+    for i in string:
+        if i.lower() == char:
+            if presence_tolerance <= 0:
+                continue
+            presence_tolerance -= 1
+        result.append(i)
+    return "".join(result)
+
+
+def _trim_overflow(string: str, char: str, tolerance: int) -> str:
+    """ Keep the first tolerance occurrences of char (case sensitive), in linear time """
+    if char not in string:
+        return string
+    parts = string.split(char, max(tolerance, 0))
+    parts[-1] = parts[-1].replace(char, "")
+    return char.join(parts)
+
+
+def clean_number(string: str, char: str = ".", tolerance: int = 1, case_sensitive: bool = False) -> str:
+    """ Remove content that should not be in a number input """
+    if " " in string:
+        string = string.replace(" ", "")
+    if "," in string:
+        string = string.replace(",", ".")
+    if string.count(char) > tolerance:
+        string = remove_char_overflow(string, char, tolerance, case_sensitive)
+    return string
+
+
+def normalize_number(string: str, number_type: type = float) -> Tuple[str, Union[int, float, None]]:
+    """ Clean a number input (spaces, commas, extra dots and extra '-' signs) and convert it, returns the cleaned string and the number (None when it is not a number) """
+    if " " in string:
+        string = string.replace(" ", "")
+    if "," in string:
+        string = string.replace(",", ".")
+    # int answers drop every dot, float answers keep the first one
+    string = _trim_overflow(string, ".", 0 if number_type is int else 1)
+    string = _trim_overflow(string, "-", 1)
+    try:
+        return string, number_type(string)
+    except ValueError:
+        return string, None
+
+
+def _parse_int(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a whole number """
+    if illegal_characters_found is True:
+        return _NOT_FOUND
+    number = normalize_number(input_answer, int)[1]
+    if number is None:
+        return _NOT_FOUND
+    return (True, number)
+
+
+def _parse_float(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a floating number """
+    if illegal_characters_found is True:
+        return _NOT_FOUND
+    number = normalize_number(input_answer, float)[1]
+    if number is None:
+        return _NOT_FOUND
+    return (True, number)
+
+
+def _parse_uint(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a positive whole number """
+    # We don't need to check the '-' sign because isdigit does not consider '-' as a number
+    if input_answer.isdigit() is True:
+        try:
+            return (True, int(input_answer))
+        except ValueError:
+            return _NOT_FOUND
+    return _NOT_FOUND
+
+
+def _parse_ufloat(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a positive floating number """
+    if is_float(input_answer) is True and input_answer[0] != "-":
+        return (True, float(input_answer))
+    return _NOT_FOUND
+
+
+def _parse_num(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a numeric answer """
+    if input_answer.isdigit() is True:
+        try:
+            return (True, float(input_answer))
+        except ValueError:
+            return _NOT_FOUND
+    return _NOT_FOUND
+
+
+def _parse_alnum(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse an alphanumeric answer """
+    if input_answer.isalnum() is True:
+        return (True, input_answer)
+    return _NOT_FOUND
+
+
+def _parse_alpha(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse an alphabetic answer (also used for the char type) """
+    if input_answer.isalpha() is True:
+        return (True, input_answer)
+    return _NOT_FOUND
+
+
+def _parse_ascii(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse an ascii answer """
+    if input_answer.isascii() is True:
+        return (True, input_answer)
+    return _NOT_FOUND
+
+
+def _parse_str(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a string answer """
+    if PRINTABLE_CHARACTERS.issuperset(input_answer) is False:
+        return _NOT_FOUND
+    return (True, input_answer)
+
+
+def _parse_version(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a version answer """
+    if is_version(input_answer) is True:
+        return (True, input_answer)
+    return _NOT_FOUND
+
+
+def _parse_bool(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Parse a boolean answer """
+    input_answer = input_answer.lower()
+    if "y" in input_answer or "t" in input_answer or "1" in input_answer:
+        return (True, True)
+    if "n" in input_answer or "f" in input_answer or "0" in input_answer:
+        return (True, False)
+    return _NOT_FOUND
+
+
+def _parse_to_up(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Convert the answer to uppercase """
+    return (True, input_answer.upper())
+
+
+def _parse_to_low(input_answer: str, illegal_characters_found: bool) -> ParsedAnswer:
+    """ Convert the answer to lowercase """
+    return (True, input_answer.lower())
+
+
+# Python type of the answers returned by each parser
+_PARSER_VALUE_TYPES = {
+    _parse_int: int,
+    _parse_float: float,
+    _parse_uint: int,
+    _parse_ufloat: float,
+    _parse_num: float,
+    _parse_alnum: str,
+    _parse_alpha: str,
+    _parse_ascii: str,
+    _parse_str: str,
+    _parse_version: str,
+    _parse_bool: bool,
+    _parse_to_up: str,
+    _parse_to_low: str,
+}
+
+# Parsers that never reject an answer, nothing after them can be reached
+_ALWAYS_FOUND_PARSERS = (_parse_to_up, _parse_to_low)
+
+# Parsers that must know if the answer contains illegal characters
+_ILLEGAL_CHARACTERS_PARSERS = (_parse_int, _parse_float)
+
+
+def parser_name(parser: AnswerParser) -> str:
+    """ Get the name of a parser as reported by the instrumentation (_parse_uint gives uint) """
+    return parser.__name__.replace("_parse_", "", 1)
+
+
+def resolve_parsers(answer_type: str) -> Tuple[AnswerParser, ...]:
+    """ Get the parsers matching a cleaned answer type, in the order they are tried """
+    candidates = (
+        (answer_type in ("int", "isint"), _parse_int),
+        ("float" in answer_type and "ufloat" not in answer_type, _parse_float),
+        ("uint" in answer_type, _parse_uint),
+        ("ufloat" in answer_type, _parse_ufloat),
+        ("num" in answer_type, _parse_num),
+        ("low" in answer_type, _parse_to_low),
+        ("alnum" in answer_type, _parse_alnum),
+        ("alpha" in answer_type, _parse_alpha),
+        ("char" in answer_type, _parse_alpha),
+        ("ascii" in answer_type, _parse_ascii),
+        ("str" in answer_type, _parse_str),
+        ("ver" in answer_type, _parse_version),
+        ("bool" in answer_type, _parse_bool),
+        ("up" in answer_type, _parse_to_up),
+    )
+    parsers = []
+    for matches, parser in candidates:
+        if matches is False or parser in parsers:
+            continue
+        parsers.append(parser)
+        if parser in _ALWAYS_FOUND_PARSERS:
+            break
+    return tuple(parsers)
+
+
+def human_description(human_type: Any, cleaned_answer_type: str) -> Union[str, None]:
+    """ Get the description of an answer type given by the programmer (None when there is none), the validators are compiled with it """
+    if isinstance(human_type, dict) is False:
+        return None
+    return human_type.get(cleaned_answer_type)
+
+
+class AskQuestionValidator:
+    """ A compiled validator in charge of checking answers against a single answer type """
+
+    def __init__(self, answer_type: str, human_type: Union[Dict, None] = None, illegal_characters_nb: str = "", allow_blank: bool = False) -> None:
+        """ The globals for the class """
+        self.answer_type = answer_type
+        self.cleaned_answer_type = clean_answer_type(answer_type)
+        # The description given for the answer type, a change of it makes the validator outdated (see AskQuestion.compile)
+        self.human_description = human_description(human_type, self.cleaned_answer_type)
+        if isinstance(human_type, dict) is False or len(human_type) == 0:
+            human_type = DEFAULT_HUMAN_TYPE
+        if illegal_characters_nb == "":
+            illegal_characters_nb = DEFAULT_ILLEGAL_CHARACTERS_NB
+        self.illegal_characters_nb = illegal_characters_nb
+        self.illegal_characters = character_set(illegal_characters_nb)
+        self.allow_blank = allow_blank
+        self.parsers = resolve_parsers(self.cleaned_answer_type)
+        self.check_illegal_characters = any(
+            parser in _ILLEGAL_CHARACTERS_PARSERS for parser in self.parsers
+        )
+        # The type of every accepted (non blank) answer, None when the parsers disagree
+        value_types = {_PARSER_VALUE_TYPES[parser] for parser in self.parsers}
+        self.value_type: Union[type, None] = None
+        if len(value_types) == 1:
+            self.value_type = value_types.pop()
+        if self.cleaned_answer_type in human_type:
+            self.error_message = f"Please enter a response of type '{human_type[self.cleaned_answer_type]}'"
+        else:
+            self.error_message = "Please enter a response of type 'Unknown demanded type"
+        # The state machine checking the answers one character at a time, built on the first use
+        self._incremental_machine: Any = None
+        # The memo of the results (see use_memo), its keys start with everything the result depends on besides the answer
+        self.memo: Any = None
+        self._memo_key = (self.cleaned_answer_type, allow_blank, illegal_characters_nb, self.error_message)
+
+    def __repr__(self) -> str:
+        """ Return the official string representation """
+        return f"{self.__class__.__name__}({self.answer_type!r})"
+
+    def validate(self, input_answer: str, on_stage: Union[Callable[[Union[str, None]], None], None] = None) -> ValidationResult:
+        """ Check an answer, returns a tuple of (answer_found, user_answer, message), on_stage (see trace) is called at the end of every stage with what decided the result, None until it is decided """
+        if input_answer == "" or input_answer.isspace():
+            if on_stage is not None:
+                on_stage(RESOLVED_BY_BLANK)
+            if self.allow_blank is True:
+                return (True, "", "")
+            return (False, "", EMPTY_RESPONSE_MESSAGE)
+        if input_answer.isprintable() is False:
+            if on_stage is not None:
+                on_stage(RESOLVED_BY_NOT_PRINTABLE)
+            return (False, "", EMPTY_RESPONSE_MESSAGE)
+        if on_stage is not None:
+            on_stage(None)
+        illegal_characters_found = False
+        if self.check_illegal_characters is True:
+            illegal_characters_found = contains_illegal_characters(
+                input_answer,
+                self.illegal_characters
+            )
+        if on_stage is not None:
+            on_stage(None)
+        for parser in self.parsers:
+            answer_found, user_answer = parser(
+                input_answer,
+                illegal_characters_found
+            )
+            if answer_found is True:
+                if on_stage is not None:
+                    on_stage(parser_name(parser))
+                return (True, user_answer, "")
+        if on_stage is not None:
+            on_stage(RESOLVED_BY_NONE)
+        return (False, "", self.error_message)
+
+    def use_memo(self, memo: Any) -> None:
+        """_summary_
+            Remember the results of the checks in a memo, the identical answers that follow are not checked again.
+            The memoized validate replaces the plain one on this instance only.
+
+        Args:
+            memo (Any): _description_: The AnswerMemo to use (it can be shared between validators), None to stop using one.
+        """
+        self.memo = memo
+        if memo is None:
+            self.__dict__.pop("validate", None)
+        else:
+            self.validate = self._validate_memoized
+
+    def _validate_memoized(self, input_answer: str) -> ValidationResult:
+        """ validate while a memo is used """
+        key = (input_answer, self._memo_key)
+        memo = self.memo
+        result = memo.get(key)
+        if result is None:
+            result = AskQuestionValidator.validate(self, input_answer)
+            memo.put(key, result)
+        return result
+
+    def trace(self, input_answer: str) -> TracedValidation:
+        """ Check an answer like validate, also returns what decided the result and the time spent in each stage """
+        memo = self.memo
+        if memo is None:
+            return self._trace(input_answer)
+        start = perf_counter()
+        key = (input_answer, self._memo_key)
+        result = memo.get(key)
+        if result is not None:
+            return (result, RESOLVED_BY_MEMO, (0.0, 0.0, perf_counter() - start))
+        traced = self._trace(input_answer)
+        memo.put(key, traced[0])
+        return traced
+
+    def _trace(self, input_answer: str) -> TracedValidation:
+        """ trace without the memo, the time of every stage ended by validate is taken """
+        times = [perf_counter()]
+        resolutions = []
+
+        def on_stage(resolution: Union[str, None]) -> None:
+            times.append(perf_counter())
+            resolutions.append(resolution)
+
+        result = AskQuestionValidator.validate(self, input_answer, on_stage)
+        if len(times) == 2:
+            return (result, resolutions[0], (times[1] - times[0], 0.0, 0.0))
+        return (result, resolutions[2], (times[1] - times[0], times[2] - times[1], times[3] - times[2]))
+
+    def incremental_machine(self) -> Any:
+        """ Get the state machine of the validator, shared by all its incremental validators """
+        if self._incremental_machine is None:
+            from .ask_question_incremental import IncrementalMachine
+            self._incremental_machine = IncrementalMachine(self)
+        return self._incremental_machine
+
+    def incremental(self, history: bool = True) -> Any:
+        """ Create an IncrementalValidator, to check an answer while it is typed or read by chunks """
+        from .ask_question_incremental import IncrementalValidator
+        return IncrementalValidator(self, history=history)
+
+    def validate_chunks(self, chunks: Iterable[str]) -> ValidationResult:
+        """_summary_
+            Check an answer read by chunks (a large file, a socket), like validate on the joined chunks.
+            The chunks are checked as they come, the reading stops at the first chunk making the answer impossible to accept.
+
+        Args:
+            chunks (Iterable[str]): _description_: The parts of the answer, in order (iter(partial(file.read, 65536), "") for a file).
+
+        Returns:
+            ValidationResult: _description_: The same (answer_found, user_answer, message) tuple as validate, when the reading stopped early the message is the one of the characters read.
+        """
+        incremental = self.incremental(history=False)
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            incremental.feed(chunk)
+            if incremental.can_become_valid is False:
+                return (False, "", incremental.message)
+        return self.validate("".join(parts))
+
+    def __call__(self, input_answer: str) -> ValidationResult:
+        """ Shortcut for validate """
+        return self.validate(input_answer)
+
+
+def compile(answer_type: str, human_type: Union[Dict, None] = None, illegal_characters_nb: str = "", allow_blank: bool = False) -> AskQuestionValidator:
+    """ Compile an answer type into a validator that can be reused for any number of answers """
+    return AskQuestionValidator(
+        answer_type,
+        human_type=human_type,
+        illegal_characters_nb=illegal_characters_nb,
+        allow_blank=allow_blank
+    )
@@ -0,0 +1,5 @@
+"""
+The benchmarks of the ask_question hot paths.
+Run them with `python -m benchmarks` from the root of the repository,
+see `python -m benchmarks --help` for the options.
+"""
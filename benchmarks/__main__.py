@@ -0,0 +1,80 @@
+"""
+Run the benchmarks and compare them to the baseline stored in the repository.
+
+    python -m benchmarks                       # fails when a benchmark stays 25% slower than the baseline (50% above 1 ms)
+    python -m benchmarks --threshold 10 --filter test_input/int
+    python -m benchmarks --update-baseline     # record the median of 3 full runs as the baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Union
+
+from . import runner
+from . import suite  # noqa: F401, registers the benchmarks
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """ Run the benchmarks, returns the exit status """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="The baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=runner.DEFAULT_THRESHOLD, help="The allowed slowdown in percent (default: %(default)s)")
+    parser.add_argument("--filter", action="append", default=[], help="Only run the benchmarks containing this text (can be repeated)")
+    parser.add_argument("--repeat", type=int, default=runner.DEFAULT_REPEAT, help="The number of timings per benchmark (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=runner.DEFAULT_MIN_TIME, help="The minimal duration of a timing in seconds (default: %(default)s)")
+    parser.add_argument("--retries", type=int, default=runner.DEFAULT_RETRIES, help="The number of times a slower benchmark is timed again (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the median of full runs as the new baseline")
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args(argv)
+    if args.update_baseline is True and len(args.filter) > 0:
+        parser.error("the baseline is recorded by full runs, --filter cannot be used with --update-baseline")
+
+    names = [
+        name for name in runner.BENCHMARKS
+        if len(args.filter) == 0 or any(text in name for text in args.filter)
+    ]
+    if args.list is True:
+        print("\n".join(names))
+        return 0
+    baseline = runner.load_baseline(args.baseline)
+    reference = baseline.get("benchmarks", {})
+
+    def _print(name: str, result: dict) -> None:
+        change = ""
+        if name in reference:
+            change = f"{(result['relative'] / reference[name]['relative'] - 1) * 100:+7.1f}%"
+        print(f"{name:<40} {result['seconds'] * 1e6:12.3f} us {change}")
+
+    results = runner.run(names, args.repeat, args.min_time, _print)
+    if args.update_baseline is True:
+        runs = [results]
+        for index in range(1, runner.BASELINE_RUNS):
+            print(f"Run {index + 1} of {runner.BASELINE_RUNS}")
+            runs.append(runner.run(names, args.repeat, args.min_time, _print))
+        results = runner.median_results(runs)
+    regressions = [] if args.update_baseline is True else runner.compare(results, baseline, args.threshold)
+    for _ in range(args.retries):
+        if len(regressions) == 0:
+            break
+        print(f"Timing again: {', '.join(name for name, _ in regressions)}")
+        runner.keep_best(results, runner.run([name for name, _ in regressions], args.repeat, args.min_time, _print))
+        regressions = runner.compare(results, baseline, args.threshold)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+    if args.update_baseline is True:
+        runner.save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    for name, change in regressions:
+        print(f"REGRESSION {name}: {change:+.1f}% (threshold {args.threshold}%)", file=sys.stderr)
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+File in charge of timing the benchmarks and comparing them to the baseline.
+Every timing is divided by the time of a fixed pure Python workload (the
+calibration, measured alternately with the benchmark) so that a baseline
+recorded on one machine, or under another load, can be compared with the
+results of another one. The baseline is the median of several full runs,
+and a benchmark only counts as a regression when it stays slow when it is
+timed again.
+"""
+
+import json
+import platform
+import statistics
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+# The setup functions of the benchmarks, by name, they return the function to time (None to skip)
+BENCHMARKS: Dict[str, Callable[[], Union[Callable[[], Any], None]]] = {}
+
+DEFAULT_THRESHOLD = 25.0
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+
+# The number of full runs whose median is recorded as the baseline
+BASELINE_RUNS = 3
+# The number of times a slower benchmark is timed again before it counts as a regression
+DEFAULT_RETRIES = 2
+# The benchmarks lasting longer than this (in seconds) allocate large structures, their noise is higher
+LONG_BENCHMARK = 0.001
+LONG_THRESHOLD = 50.0
+
+
+def benchmark(name: str) -> Callable:
+    """ Register the setup function of a benchmark """
+    def _register(setup: Callable[[], Union[Callable[[], Any], None]]) -> Callable[[], Union[Callable[[], Any], None]]:
+        if name in BENCHMARKS:
+            raise ValueError(f"The benchmark '{name}' is registered twice")
+        BENCHMARKS[name] = setup
+        return setup
+    return _register
+
+
+def _calibration_workload() -> int:
+    """ A fixed workload mixing the operations the library relies on (calls, dictionaries, strings) """
+    data: Dict[str, int] = {}
+    for index in range(200):
+        key = str(index)
+        data[key] = len(key.replace("1", "").lower())
+    return sum(data.values())
+
+
+def _autorange(timer: timeit.Timer, min_time: float) -> Tuple[int, float]:
+    """ Get the number of calls lasting at least min_time, with their duration """
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            return number, elapsed
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+
+def time_function(function: Callable[[], Any], repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> float:
+    """ Get the best number of seconds spent per call """
+    timer = timeit.Timer(function)
+    number, elapsed = _autorange(timer, min_time)
+    best = min([elapsed] + timer.repeat(repeat=repeat - 1, number=number))
+    return best / number
+
+
+def calibrate(repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> float:
+    """ Get the time of the calibration workload """
+    return time_function(_calibration_workload, repeat, min_time)
+
+
+def time_relative(function: Callable[[], Any], repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> Tuple[float, float]:
+    """ Get the best number of seconds per call and the best calibration time, measured alternately so that both see the same load """
+    timer = timeit.Timer(function)
+    calibration_timer = timeit.Timer(_calibration_workload)
+    number, best = _autorange(timer, min_time)
+    calibration_number, calibration_best = _autorange(calibration_timer, min_time)
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number))
+        calibration_best = min(calibration_best, calibration_timer.timeit(calibration_number))
+    return best / number, calibration_best / calibration_number
+
+
+def run(names: Iterable[str], repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, on_result: Union[Callable[[str, Dict[str, float]], None], None] = None) -> Dict[str, Any]:
+    """_summary_
+        Time the benchmarks.
+
+    Args:
+        names (Iterable[str]): _description_: The benchmarks to run.
+        repeat (int, optional): _description_: The number of timings, the best one is kept. Defaults to DEFAULT_REPEAT.
+        min_time (float, optional): _description_: The minimal duration of a timing in seconds. Defaults to DEFAULT_MIN_TIME.
+        on_result (Union[Callable[[str, Dict[str, float]], None], None], optional): _description_: Called after every benchmark. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: _description_: The results, in the format of the baseline file.
+    """
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "calibration": calibrate(repeat, min_time),
+        "benchmarks": {},
+    }
+    for name in names:
+        function = BENCHMARKS[name]()
+        if function is None:
+            continue
+        seconds, calibration = time_relative(function, repeat, min_time)
+        result = {"seconds": seconds, "relative": seconds / calibration}
+        results["benchmarks"][name] = result
+        if on_result is not None:
+            on_result(name, result)
+    return results
+
+
+def median_results(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """ Merge full runs into one, every benchmark keeps its median result (the baseline is not recorded on a single lucky or unlucky run) """
+    merged = dict(runs[0])
+    merged["calibration"] = statistics.median(run["calibration"] for run in runs)
+    merged["benchmarks"] = {}
+    for name in runs[0]["benchmarks"]:
+        ordered = sorted(
+            (run["benchmarks"][name] for run in runs if name in run["benchmarks"]),
+            key=lambda result: result["relative"]
+        )
+        merged["benchmarks"][name] = ordered[(len(ordered) - 1) // 2]
+    return merged
+
+
+def keep_best(results: Dict[str, Any], retry: Dict[str, Any]) -> None:
+    """ Keep the fastest result of each benchmark timed again """
+    for name, result in retry["benchmarks"].items():
+        if result["relative"] < results["benchmarks"][name]["relative"]:
+            results["benchmarks"][name] = result
+
+
+def threshold_of(result: Dict[str, float], threshold: float = DEFAULT_THRESHOLD) -> float:
+    """ Get the allowed slowdown of a benchmark, raised to LONG_THRESHOLD for the ones lasting longer than LONG_BENCHMARK """
+    if result.get("seconds", 0.0) >= LONG_BENCHMARK:
+        return max(threshold, LONG_THRESHOLD)
+    return threshold
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float]]:
+    """ Get the benchmarks slower than the baseline by more than their threshold in percent, with their change in percent """
+    regressions = []
+    reference = baseline.get("benchmarks", {})
+    for name, result in results["benchmarks"].items():
+        if name not in reference:
+            continue
+        change = (result["relative"] / reference[name]["relative"] - 1) * 100
+        if change > threshold_of(reference[name], threshold):
+            regressions.append((name, change))
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """ Read a baseline file, an empty baseline when it does not exist """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {"benchmarks": {}}
+
+
+def save_baseline(path: str, results: Dict[str, Any]) -> None:
+    """ Write the results of full runs as the new baseline, every benchmark is recorded under the same conditions """
+    saved = dict(results)
+    saved["benchmarks"] = dict(sorted(results["benchmarks"].items()))
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(saved, file, indent=4)
+        file.write("\n")
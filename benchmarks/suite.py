@@ -0,0 +1,280 @@
+"""
+The benchmarks of the library, every function registered here prepares
+its data and returns the function that is timed.
+"""
+
+import pickle
+from collections import deque
+from typing import Any, Callable, Dict, Tuple, Union
+
+import ask_question
+from ask_question import AQFlexibleDictionary, AskQuestion, AskQuestionResponse
+
+from .runner import benchmark
+
+# Valid, invalid and long answers of every answer type (blank answers are the same for all)
+ANSWERS: Dict[str, Dict[str, str]] = {
+    "int": {"valid": "-1234", "invalid": "12a4", "long": "1" * 2000},
+    "float": {"valid": "-12,5", "invalid": "1.2a", "long": "1" * 1000 + "." + "5" * 1000},
+    "uint": {"valid": "1234", "invalid": "-1234", "long": "7" * 2000},
+    "ufloat": {"valid": "12.5", "invalid": "-12.5", "long": "1" * 200 + "." + "5" * 200},
+    "num": {"valid": "1234", "invalid": "12.34", "long": "9" * 300},
+    "alnum": {"valid": "abc123", "invalid": "abc 123", "long": "a1" * 1000},
+    "alpha": {"valid": "abcdef", "invalid": "abc1", "long": "ab" * 1000},
+    "ascii": {"valid": "Hello!", "invalid": "Héllo", "long": "Hello! " * 300},
+    "str": {"valid": "Hello world", "invalid": "Helloé", "long": "Hello world " * 200},
+    "version": {"valid": "1.2.3", "invalid": "1.2.", "long": "1." * 999 + "1"},
+    "bool": {"valid": "yes", "invalid": "maybe", "long": "yes" * 600},
+    "up": {"valid": "hello", "invalid": "é\t", "long": "hello" * 400},
+    "low": {"valid": "HELLO", "invalid": "é\t", "long": "HELLO" * 400},
+}
+
+NESTED_DEPTH = 4
+NESTED_WIDTH = 4
+
+# A chain deeper than the recursion limit, and a tree of 10**LARGE_DEPTH leaves
+DEEP_DEPTH = 10_000
+LARGE_DEPTH = 6
+LARGE_WIDTH = 10
+
+
+def _test_input(answer_type: str, answer: str) -> Callable[[], Any]:
+    """ Time test_input on a single answer """
+    aqi = AskQuestion()
+    aqi.test_input(answer, answer_type, print_error=False)
+    return lambda: aqi.test_input(answer, answer_type, print_error=False)
+
+
+def _register_test_input() -> None:
+    """ Register the test_input benchmarks of every answer type """
+    for answer_type, answers in ANSWERS.items():
+        for case in ("valid", "invalid", "blank", "long"):
+            answer = answers.get(case, " ")
+            benchmark(f"test_input/{answer_type}/{case}")(
+                lambda answer_type=answer_type, answer=answer: _test_input(answer_type, answer)
+            )
+
+
+_register_test_input()
+
+
+@benchmark("test_input/memo/skewed_feed")
+def _memo_skewed_feed() -> Callable[[], Any]:
+    """ Time 1000 answers of a feed where a few values make most of the rows, with the memoization enabled """
+    aqi = AskQuestion()
+    aqi.enable_memoization()
+    common = ["1,5", "0", "-2.25", "10", "3.5"]
+    feed = [common[index % len(common)] if index % 10 else f"{index}.{index}" for index in range(1000)]
+
+    def _check_feed() -> None:
+        for answer in feed:
+            aqi.test_input(answer, "float", print_error=False)
+    return _check_feed
+
+
+def _nested(depth: int = NESTED_DEPTH, width: int = NESTED_WIDTH) -> Dict[str, Any]:
+    """ Create a nested dictionary """
+    if depth == 0:
+        return {f"leaf{index}": index for index in range(width)}
+    return {f"node{index}": _nested(depth - 1, width) for index in range(width)}
+
+
+def _response() -> AskQuestionResponse:
+    """ Create a filled response """
+    return AskQuestionResponse(
+        tui=False,
+        allow_blanks=False,
+        message="",
+        question="How old are you?",
+        answer_type="uint",
+        answer_found=True,
+        raw_user_answer="42",
+        user_answer=42
+    )
+
+
+@benchmark("ask_question/construction")
+def _construction() -> Callable[[], Any]:
+    """ Time the creation of an instance (check_load included) """
+    return AskQuestion
+
+
+@benchmark("response/create")
+def _response_create() -> Callable[[], Any]:
+    """ Time the creation of a response """
+    return _response
+
+
+@benchmark("response/to_dict")
+def _response_to_dict() -> Callable[[], Any]:
+    """ Time the conversion of a response to a dictionary """
+    return _response().to_dict
+
+
+@benchmark("response/copy")
+def _response_copy() -> Callable[[], Any]:
+    """ Time the copy of a response """
+    return _response().copy
+
+
+@benchmark("response/pickle")
+def _response_pickle() -> Callable[[], Any]:
+    """ Time a round trip of a response through pickle """
+    response = _response()
+    return lambda: pickle.loads(pickle.dumps(response))
+
+
+@benchmark("response/frozen_dedup")
+def _response_frozen_dedup() -> Callable[[], Any]:
+    """ Time the deduplication of 1000 frozen responses in a set (100 different ones) """
+    responses = [
+        AskQuestionResponse(question="How old are you?", answer_type="uint", answer_found=True, raw_user_answer=str(index % 100), user_answer=index % 100).freeze()
+        for index in range(1000)
+    ]
+    return lambda: set(responses)
+
+
+@benchmark("flexible_dictionary/nested_wrap")
+def _nested_wrap() -> Callable[[], Any]:
+    """ Time the wrapping of a nested dictionary """
+    data = _nested()
+    return lambda: AQFlexibleDictionary(**data)
+
+
+def _deep_chain(depth: int = DEEP_DEPTH) -> AQFlexibleDictionary:
+    """ Create a chain of wrapped dictionaries, one per level """
+    node = AQFlexibleDictionary(value=0)
+    for _ in range(depth):
+        node = AQFlexibleDictionary(child=node)
+    return node
+
+
+def _large_tree(depth: int = LARGE_DEPTH, width: int = LARGE_WIDTH) -> AQFlexibleDictionary:
+    """ Create a tree of wrapped dictionaries, built level by level from the leaves """
+    level = [AQFlexibleDictionary(**{f"leaf{index}": index for index in range(width)}) for _ in range(width ** (depth - 1))]
+    while len(level) > 1:
+        level = [
+            AQFlexibleDictionary(**{f"node{index}": node for index, node in enumerate(level[start:start + width])})
+            for start in range(0, len(level), width)
+        ]
+    return level[0]
+
+
+@benchmark("flexible_dictionary/deep_to_dict")
+def _deep_to_dict() -> Callable[[], Any]:
+    """ Time the conversion of a chain deeper than the recursion limit """
+    return _deep_chain().to_dict
+
+
+@benchmark("flexible_dictionary/deep_equal")
+def _deep_equal() -> Callable[[], Any]:
+    """ Time the comparison of two chains deeper than the recursion limit """
+    first = _deep_chain()
+    second = _deep_chain()
+    return lambda: first == second
+
+
+@benchmark("flexible_dictionary/large_to_dict")
+def _large_to_dict() -> Callable[[], Any]:
+    """ Time the conversion of a tree of a million leaves """
+    return _large_tree().to_dict
+
+
+class _Settings(AQFlexibleDictionary):
+    """ A typed dictionary with a few declared fields """
+    name: str = "default"
+    retries: int = 3
+    verbose: bool = False
+    timeout: float = 1.5
+
+
+@benchmark("flexible_dictionary/typed_create")
+def _typed_create() -> Callable[[], Any]:
+    """ Time the creation and the field reads of a typed subclass """
+    def _create() -> Any:
+        settings = _Settings(name="bench", retries=5)
+        return settings.name, settings.retries, settings.verbose
+    return _create
+
+
+@benchmark("flexible_dictionary/merge")
+def _merge() -> Callable[[], Any]:
+    """ Time the merge of a nested dictionary with the | operator """
+    flexible = AQFlexibleDictionary(**_nested())
+    other = {"node0": {"leaf0": -1}, "extra": 1}
+    return lambda: flexible | other
+
+
+def _headless_tui() -> Union[Tuple[Any, Any], None]:
+    """ Get the TUI class and a screen that draws nothing, None when asciimatics is not installed """
+    if ask_question.TUI_AVAILABLE is False:
+        return None
+    from ask_question.ask_question_tui import AskQuestionTUI, HeadlessScreen
+    return AskQuestionTUI, HeadlessScreen()
+
+
+@benchmark("tui/frame")
+def _tui_frame() -> Union[Callable[[], Any], None]:
+    """ Time the creation of the TUI frame of a question """
+    tui = _headless_tui()
+    if tui is None:
+        return None
+    tui_class, screen = tui
+    aqi = tui_class(screen)
+    return lambda: aqi.get_frame("How old are you?", "uint")
+
+
+@benchmark("tui/session_question")
+def _tui_session_question() -> Union[Callable[[], Any], None]:
+    """ Time the next question of a session reusing its frame, redraw of the frame and of the screen included """
+    tui = _headless_tui()
+    if tui is None:
+        return None
+    tui_class, screen = tui
+    aqi = tui_class(screen, reuse_frame=True)
+    questions = deque(["How old are you?", "Age?", "How many cats do you have at home?", "Your city?"])
+
+    def _next_question() -> None:
+        questions.rotate()
+        frame = aqi.get_frame(questions[0], "uint")
+        frame.update(0)
+        screen.refresh()
+    return _next_question
+
+
+@benchmark("tui/live_keystroke")
+def _tui_live_keystroke() -> Union[Callable[[], Any], None]:
+    """ Time a key press checked by the live validation of a long answer, typing a character then deleting it """
+    tui = _headless_tui()
+    if tui is None:
+        return None
+    tui_class, screen = tui
+    aqi = tui_class(screen, live_validation=True)
+    frame = aqi.get_frame("How much did it cost?", "float")
+    answer = "1" * 200
+    frame.textbox_widget.value = answer
+    textbox = frame.textbox_widget
+
+    def _keystroke() -> None:
+        textbox.value = answer + "5"
+        textbox.value = answer
+    return _keystroke
+
+
+@benchmark("incremental/feed")
+def _incremental_feed() -> Callable[[], Any]:
+    """ Time a chunk of 1000 characters fed to an incremental validator without history """
+    validator = ask_question.compile("float")
+    chunk = "1" * 1000
+
+    def _feed() -> None:
+        validator.incremental(history=False).feed(chunk)
+    return _feed
+
+
+@benchmark("incremental/reject_stream")
+def _incremental_reject_stream() -> Callable[[], Any]:
+    """ Time a stream of 1000 chunks refused by its second chunk, the other ones are never read """
+    validator = ask_question.compile("int")
+    chunks = ["1" * 1000, "x"] + ["1" * 1000] * 1000
+    return lambda: validator.validate_chunks(iter(chunks))
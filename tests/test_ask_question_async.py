@@ -0,0 +1,91 @@
+# tests/test_ask_question_async.py
+import asyncio
+import os
+import sys
+import pytest
+from ask_question import AskQuestion, AskQuestionResponse
+
+
+def _reader(*lines: str) -> asyncio.StreamReader:
+    """ Create a stream reader already containing the lines """
+    reader = asyncio.StreamReader()
+    for line in lines:
+        reader.feed_data(f"{line}\n".encode("utf-8"))
+    return reader
+
+
+def test_ask_question_async(capsys: pytest.CaptureFixture) -> None:
+    """ Test that the async prompt asks again until the answer matches the type """
+    aqi = AskQuestion()
+
+    async def _main() -> AskQuestionResponse:
+        return await aqi.ask_question_detailed_async("Age? ", "uint", reader=_reader("abc", "-1", "42"))
+
+    response = asyncio.run(_main())
+    assert response["user_answer"] == 42
+    assert response["raw_user_answer"] == "42"
+    assert response["question"] == "Age? "
+    assert aqi.usr_answer == 42
+    assert capsys.readouterr().out.count("Age? ") == 3
+
+
+def test_ask_question_async_concurrent_sources() -> None:
+    """ Test several prompts waiting at once on different readers """
+    aqi = AskQuestion()
+
+    async def _main() -> list:
+        first = asyncio.StreamReader()
+        second = asyncio.StreamReader()
+        tasks = [
+            asyncio.ensure_future(aqi.ask_question_async("", "int", reader=first)),
+            asyncio.ensure_future(aqi.ask_question_async("", "bool", reader=second)),
+        ]
+        await asyncio.sleep(0)
+        second.feed_data(b"yes\n")
+        first.feed_data(b"12\n")
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(_main()) == [12, True]
+
+
+def test_ask_question_async_timeout_and_eof() -> None:
+    """ Test the timeout, the cancellation and the end of the stream """
+    aqi = AskQuestion()
+
+    async def _timeout() -> None:
+        await aqi.ask_question_async("", "int", reader=asyncio.StreamReader(), timeout=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_timeout())
+
+    async def _eof() -> None:
+        reader = _reader("abc")
+        reader.feed_eof()
+        await aqi.ask_question_async("", "int", reader=reader)
+
+    with pytest.raises(EOFError):
+        asyncio.run(_eof())
+
+    async def _cancel() -> None:
+        task = asyncio.ensure_future(aqi.pause_async("", reader=asyncio.StreamReader()))
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(_cancel())
+
+
+def test_stdin_blocking_mode_restored(monkeypatch: pytest.MonkeyPatch) -> None:
+    """ Test that stdin is blocking again once the loop that read it asynchronously has ended """
+    read_fd, write_fd = os.pipe()
+    stdin = os.fdopen(read_fd, "r")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    try:
+        os.write(write_fd, b"42\n7\n")
+        assert asyncio.run(AskQuestion().ask_question_async("", "int")) == 42
+        assert os.get_blocking(read_fd) is True
+        assert stdin.closed is False
+    finally:
+        os.close(write_fd)
+        stdin.close()
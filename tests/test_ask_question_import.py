@@ -0,0 +1,60 @@
+# tests/test_ask_question_import.py
+import os
+import subprocess
+import sys
+import pytest
+import ask_question
+
+# The maximum number of milliseconds spent in `import ask_question`, raise it with ASK_QUESTION_IMPORT_BUDGET_MS on slow machines
+IMPORT_BUDGET_MS = float(os.environ.get("ASK_QUESTION_IMPORT_BUDGET_MS", "100"))
+
+# The modules that must only be imported when they are used
+HEAVY_MODULES = ("numpy", "asyncio", "asciimatics", "asciimatics_overlay_ov", "concurrent.futures", "dataclasses")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    """ Run python code in a new interpreter from the root of the repository """
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+def test_heavy_modules_are_not_imported() -> None:
+    """ Test that importing the package does not import the optional dependencies """
+    result = _run(f"import sys, ask_question; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])")
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_time_budget() -> None:
+    """ Test the time spent importing the package with python -X importtime (best of 3 runs) """
+    timings = []
+    for _ in range(3):
+        result = _run("import ask_question", "-X", "importtime")
+        lines = [line for line in result.stderr.splitlines() if line.rstrip().endswith("| ask_question")]
+        timings.append(int(lines[-1].split("|")[1]) / 1000)
+    assert min(timings) < IMPORT_BUDGET_MS, f"import ask_question took {min(timings):.1f}ms (budget {IMPORT_BUDGET_MS}ms)"
+
+
+def test_lazy_attributes() -> None:
+    """ Test that the lazy classes and the aliases are resolved on their first use """
+    assert issubclass(ask_question.Ask_Question, ask_question.AskQuestion)
+    assert ask_question.ASKQUESTION is ask_question.ASKQUESTION
+    assert ask_question.AskQuestionServer.__name__ == "AskQuestionServer"
+    assert "Questionnaire" in dir(ask_question)
+    for name in ask_question.__all__:
+        assert getattr(ask_question, name) is not None
+    with pytest.raises(AttributeError):
+        ask_question.does_not_exist
+
+
+@pytest.mark.skipif(ask_question.TUI_AVAILABLE is False, reason="asciimatics is not installed")
+def test_tui_is_available() -> None:
+    """ Test that the TUI classes can be imported from the package """
+    from ask_question import AskQuestionTUI, ask_question_tui
+    assert issubclass(ask_question_tui, AskQuestionTUI)
@@ -0,0 +1,123 @@
+# tests/test_ask_question_incremental.py
+import itertools
+import pytest
+import ask_question
+from ask_question.ask_question_incremental import VALID, INCOMPLETE, INVALID, _Machine
+
+
+def test_statuses_while_typing() -> None:
+    """ Test the status of an answer after every character """
+    incremental = ask_question.compile("uint").incremental()
+    assert incremental.status == INCOMPLETE
+    assert incremental.push("4") == VALID
+    assert incremental.push("2") == VALID
+    assert incremental.push("a") == INVALID
+    assert incremental.pop() == VALID
+    assert incremental.text == "42"
+    incremental.reset()
+    assert incremental.text == ""
+    assert incremental.status == INCOMPLETE
+
+
+def test_incomplete_answers() -> None:
+    """ Test that the beginnings of valid answers are not refused """
+    float_answer = ask_question.compile("float").incremental()
+    assert float_answer.set_text("-") == INCOMPLETE
+    assert float_answer.set_text("-1.") == VALID
+    assert float_answer.set_text("-1.5") == VALID
+    version = ask_question.compile("version").incremental()
+    assert version.set_text("1.") == INCOMPLETE
+    assert version.set_text("1.2") == VALID
+    assert version.set_text("1.a") == INVALID
+    boolean = ask_question.compile("bool").incremental()
+    assert boolean.set_text("ye") == VALID
+    assert boolean.set_text("ma") == INCOMPLETE
+
+
+def test_set_text_only_checks_the_changes() -> None:
+    """ Test that replacing the answer keeps the states of the common beginning """
+    incremental = ask_question.compile("int").incremental()
+    incremental.set_text("12345")
+    first_states = incremental._states[:4]
+    assert incremental.set_text("123a") == INVALID
+    assert incremental._states[:4] == first_states
+    assert incremental.set_text("1239") == VALID
+
+
+def test_same_result_as_validate() -> None:
+    """ Test that the statuses match the validators on every short answer """
+    alphabet = "1-.,a _e"
+    for answer_type in ("int", "uint", "float", "ufloat", "num", "alnum", "alpha", "bool", "version", "str", "up", "low", "ascii"):
+        for allow_blank in (False, True):
+            validator = ask_question.AskQuestionValidator(answer_type, allow_blank=allow_blank)
+            incremental = validator.incremental()
+            for length in range(4):
+                for characters in itertools.product(alphabet, repeat=length):
+                    answer = "".join(characters)
+                    status = incremental.set_text(answer)
+                    assert (status == VALID) == validator.validate(answer)[0], (answer_type, answer)
+
+
+def test_feed_stops_at_the_first_refused_character() -> None:
+    """ Test that the characters after an impossible beginning are not checked """
+    incremental = ask_question.compile("float").incremental()
+    assert incremental.feed("12") == VALID
+    assert incremental.feed("a" + "3" * 1000) == INVALID
+    assert incremental._checked == 3
+    assert incremental.length == 1003
+    assert incremental.message == incremental.validator.error_message
+    assert incremental.pop(1001) == VALID
+    assert incremental.text == "12"
+
+
+def test_message_after_an_early_rejection() -> None:
+    """ Test that the message matches validate when characters are added after the answer was refused """
+    for answer_type in ("isint", "float", "alpha"):
+        validator = ask_question.compile(answer_type)
+        for answer in ("N\t2", "N\t", " \x00", "a b", " a", "N2\n", "\tN"):
+            for history in (True, False):
+                incremental = validator.incremental(history=history)
+                incremental.feed(answer[0])
+                incremental.feed(answer[1:])
+                assert incremental.message == validator.validate(answer)[2], (answer_type, answer)
+            incremental = validator.incremental()
+            incremental.set_text(answer + "\x00")
+            incremental.pop()
+            assert incremental.message == validator.validate(answer)[2], (answer_type, answer)
+
+
+def test_without_history() -> None:
+    """ Test that only the last state is kept without history """
+    incremental = ask_question.compile("uint").incremental(history=False)
+    for _ in range(100):
+        incremental.feed("1234567890")
+    assert incremental.is_valid is True
+    assert len(incremental._states) == 1
+    assert incremental.text == ""
+    try:
+        incremental.pop()
+    except ValueError:
+        pass
+    else:
+        assert False, "pop must need the history"
+
+
+def test_validate_chunks_rejects_early() -> None:
+    """ Test that the chunks after an impossible beginning are not read """
+    validator = ask_question.compile("int")
+    read = []
+
+    def _chunks():
+        for chunk in ("-12", "x", "3", "4"):
+            read.append(chunk)
+            yield chunk
+    assert validator.validate_chunks(_chunks()) == (False, "", validator.error_message)
+    assert read == ["-12", "x"]
+    assert validator.validate_chunks(iter(["-1", "2", "3"])) == validator.validate("-123")
+    assert validator.validate_chunks(iter(["", " "])) == validator.validate(" ")
+
+
+def test_machine_is_abstract() -> None:
+    """ Test that a state machine must define step and accepts """
+    with pytest.raises(TypeError):
+        _Machine()
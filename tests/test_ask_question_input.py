@@ -0,0 +1,101 @@
+# tests/test_ask_question_input.py
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from unittest.mock import patch
+import pytest
+from ask_question import (
+    AskQuestion, InputProvider, BufferedInputProvider, FileInputProvider, EnvironmentInputProvider,
+    CallableInputProvider, AutoInputProvider, TTYInputProvider
+)
+from ask_question.ask_question_input import read_lines
+
+
+def test_read_lines_in_chunks() -> None:
+    """ Test the splitting of a stream read in small chunks """
+    data = "first\r\nsecond\n\nété\nlast"
+    assert list(read_lines(io.BytesIO(data.encode("utf-8")), chunk_size=3)) == ["first", "second", "", "été", "last"]
+    assert list(read_lines(io.StringIO(data), chunk_size=4)) == ["first", "second", "", "été", "last"]
+
+
+def test_buffered_provider(capsys: pytest.CaptureFixture) -> None:
+    """ Test that the prompts are not displayed and that a refused answer reads the next one """
+    aqi = AskQuestion(input_provider=["abc", "12", ""])
+    assert isinstance(aqi.input_provider, BufferedInputProvider)
+    assert aqi.input_provider.interactive is False
+    assert aqi.ask_question("Number? ", "int") == 12
+    aqi.pause()
+    with pytest.raises(EOFError):
+        aqi.ask_question("Number? ", "int")
+    output = capsys.readouterr().out
+    assert "Number? " not in output
+    assert "Please enter a response of type" in output
+
+
+def test_buffered_provider_echo() -> None:
+    """ Test the prompts echoed to an output """
+    output = io.StringIO()
+    aqi = AskQuestion(input_provider=BufferedInputProvider(["x", "y"], output=output))
+    assert aqi.ask_question("Letter? ", "alpha") == "x"
+    assert output.getvalue() == "Letter? x\n"
+
+
+def test_file_provider() -> None:
+    """ Test the answers read from an answer file """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "answers.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(str(index) for index in range(1000)))
+        with FileInputProvider(path, chunk_size=64) as provider:
+            aqi = AskQuestion(input_provider=provider)
+            assert [aqi.ask_question("", "uint") for _ in range(1000)] == list(range(1000))
+
+
+def test_environment_and_callable_providers() -> None:
+    """ Test the answers read from variables and from a function """
+    provider = EnvironmentInputProvider(
+        environ={"ASK_QUESTION_HOW_OLD_ARE_YOU": "42", "CUSTOM": "yes"},
+        variables={"Sure?": "CUSTOM"},
+        fallback=CallableInputProvider(lambda prompt: "fallback")
+    )
+    assert provider.variable_name("How old are you?") == "ASK_QUESTION_HOW_OLD_ARE_YOU"
+    aqi = AskQuestion(input_provider=provider)
+    assert aqi.ask_question("How old are you?", "uint") == 42
+    assert aqi.ask_question("Sure?", "bool") is True
+    assert aqi.ask_question("Name?", "str") == "fallback"
+    with pytest.raises(EOFError):
+        EnvironmentInputProvider(environ={}).read_answer("Name?")
+    assert AskQuestion(input_provider=str.upper).ask_question("abc", "alpha") == "ABC"
+
+
+def test_default_provider_keeps_input() -> None:
+    """ Test that the default provider still calls input when it is replaced """
+    aqi = AskQuestion()
+    assert isinstance(aqi.input_provider, AutoInputProvider)
+    with patch("builtins.input", side_effect=["7"]):
+        assert aqi.ask_question("Number? ", "int") == 7
+    with patch("builtins.input", side_effect=["7"]):
+        assert AskQuestion(input_provider=TTYInputProvider()).ask_question("Number? ", "int") == 7
+
+
+def test_piped_stdin_is_shared() -> None:
+    """ Test that several instances and input read the same piped stdin one after the other """
+    script = (
+        "from ask_question import AskQuestion;"
+        "first = AskQuestion(); second = AskQuestion();"
+        "print(first.ask_question('q', 'int'), second.ask_question('q', 'int'), input(), first.ask_question('q', 'int'))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], input="1\n2\nthree\n4\n",
+        capture_output=True, text=True, check=True, timeout=60,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    assert result.stdout.split() == ["1", "2", "three", "4"]
+
+
+def test_input_provider_is_abstract() -> None:
+    """ Test that a provider must define read_answer """
+    with pytest.raises(TypeError):
+        InputProvider()
@@ -0,0 +1,77 @@
+# tests/test_ask_question_instrumentation.py
+import json
+from ask_question import AskQuestion, AskQuestionValidator, BufferedInputProvider, Instrumentation
+
+
+def test_disabled_by_default() -> None:
+    """ Test that the plain methods run while the instrumentation is disabled """
+    aqi = AskQuestion()
+    assert aqi.instrumentation is None
+    assert aqi.check_input.__func__ is AskQuestion.check_input
+    instrumentation = aqi.enable_instrumentation()
+    assert aqi.check_input.__func__ is not AskQuestion.check_input
+    assert aqi.disable_instrumentation() is instrumentation
+    assert "check_input" not in aqi.__dict__
+    assert "ask_question_detailed" not in aqi.__dict__
+    aqi.test_input("12", "uint", print_error=False)
+    assert instrumentation.calls == {}
+
+
+def test_validator_trace_matches_validate() -> None:
+    """ Test that trace returns the same result as validate and what decided it """
+    validator = AskQuestionValidator("float")
+    for answer in ("1.5", "12", "1a", " ", "\t", "é"):
+        result, _, stages = validator.trace(answer)
+        assert result == validator.validate(answer)
+        assert len(stages) == 3
+    assert validator.trace("1.5")[1] == "float"
+    assert validator.trace(" ")[1] == "blank"
+    assert validator.trace("1\x00")[1] == "not_printable"
+    assert validator.trace("abc")[1] == "none"
+
+
+def test_counters_of_the_checks() -> None:
+    """ Test the counts per answer type, result and parser """
+    aqi = AskQuestion()
+    instrumentation = aqi.enable_instrumentation()
+    assert aqi.test_input("12", "uint", print_error=False)["user_answer"] == 12
+    aqi.test_input("-12", "uint", print_error=False)
+    aqi.test_input("", "uint", print_error=False)
+    aqi.test_input("hello", "up", print_error=False)
+    snapshot = instrumentation.snapshot()
+    assert snapshot["calls"] == {"uint": 3, "up": 1}
+    assert snapshot["answers_found"] == {"uint": 1, "up": 1}
+    assert snapshot["answers_not_found"] == {"uint": 2}
+    assert snapshot["resolutions"] == {"uint": {"uint": 1, "none": 1, "blank": 1}, "up": {"to_up": 1}}
+    assert snapshot["stage_seconds"]["parse"] > 0
+    assert json.loads(instrumentation.to_json()) == snapshot
+
+
+def test_retries_and_hooks() -> None:
+    """ Test the retries of ask_question_detailed and the events sent to the hooks """
+    events = []
+    aqi = AskQuestion(input_provider=BufferedInputProvider(["a", "", "4", "5"]))
+    instrumentation = aqi.enable_instrumentation(Instrumentation(hooks=[lambda event, details: events.append((event, details))]))
+    assert aqi.ask_question("How old are you?", "uint") == 4
+    assert aqi.ask_question("How old are you?", "uint") == 5
+    assert instrumentation.questions == 2
+    assert instrumentation.retries == 2
+    assert instrumentation.retries_per_question == {2: 1, 0: 1}
+    assert [event for event, _ in events] == ["validation"] * 3 + ["question", "validation", "question"]
+    assert events[3][1]["attempts"] == 3
+    assert instrumentation.stage_seconds["read_answer"] > 0
+
+
+def test_prometheus_export() -> None:
+    """ Test the Prometheus text format """
+    aqi = AskQuestion()
+    instrumentation = aqi.enable_instrumentation()
+    aqi.check_input("1", "int")
+    aqi.check_input("x", "int")
+    text = instrumentation.to_prometheus()
+    assert "# TYPE ask_question_validations_total counter" in text
+    assert 'ask_question_validations_total{answer_type="int",answer_found="true"} 1' in text
+    assert 'ask_question_resolutions_total{answer_type="int",resolution="none"} 1' in text
+    assert "ask_question_questions_total 0" in text
+    instrumentation.reset()
+    assert instrumentation.calls == {}
@@ -0,0 +1,96 @@
+# tests/test_ask_question_memo.py
+import ask_question
+from ask_question import AskQuestion, AnswerMemo
+
+
+def test_memo_hits_and_misses() -> None:
+    """ Test that an identical answer is only checked once """
+    aqi = AskQuestion()
+    memo = aqi.enable_memoization(max_size=8)
+    for _ in range(3):
+        assert aqi.test_input("1,5", "float", print_error=False)["user_answer"] == 1.5
+    assert aqi.test_input("abc", "float", print_error=False)["answer_found"] is False
+    assert (memo.hits, memo.misses) == (2, 2)
+    assert len(memo) == 2
+    assert memo.statistics()["hit_rate"] == 0.5
+
+
+def test_memo_evicts_the_least_recently_used() -> None:
+    """ Test the bound of the memo """
+    memo = AnswerMemo(max_size=2)
+    memo.put("a", (True, "a", ""))
+    memo.put("b", (True, "b", ""))
+    assert memo.get("a") == (True, "a", "")
+    memo.put("c", (True, "c", ""))
+    assert memo.get("b") is None
+    assert memo.get("a") is not None
+    assert memo.evictions == 1
+
+
+def test_memo_keys_and_invalidation() -> None:
+    """ Test that the results follow the configuration of the instance """
+    aqi = AskQuestion()
+    memo = aqi.enable_memoization()
+    assert aqi.check_input("", "str")["answer_found"] is False
+    aqi.allow_blank = True
+    assert aqi.check_input("", "str")["answer_found"] is True
+    refused = aqi.check_input("x", "uint")["message"]
+    aqi.human_type = {"uint": "age"}
+    assert aqi.check_input("x", "uint")["message"] == "Please enter a response of type 'age'"
+    assert aqi.check_input("x", "uint")["message"] != refused
+    assert aqi.check_input("1 0", "int")["answer_found"] is False
+    aqi.illegal_characters_nb = "y"
+    assert aqi.check_input("1 0", "int")["answer_found"] is True
+    assert aqi.check_input("7", "isuint")["user_answer"] == 7
+    hits = memo.hits
+    assert aqi.check_input("7", "uint")["answer_type"] == "uint"
+    assert memo.hits == hits + 1
+
+
+def test_memo_human_type_changed_in_place() -> None:
+    """ Test that the results are checked again when human_type is changed in place """
+    aqi = AskQuestion()
+    memo = aqi.enable_memoization()
+    aqi.check_input("x", "uint")
+    aqi.check_input("1", "int")
+    assert len(memo) == 2
+    aqi.human_type["uint"] = "age"
+    assert aqi.check_input("x", "uint")["message"] == "Please enter a response of type 'age'"
+    assert len(memo) == 1
+    assert aqi.test_input("x", "uint", print_error=False)["message"] == "Please enter a response of type 'age'"
+    assert memo.hits == 1
+
+
+def test_memo_responses_are_not_shared() -> None:
+    """ Test that changing a response does not change the next ones """
+    aqi = AskQuestion()
+    aqi.enable_memoization()
+    first = aqi.check_input("yes", "bool")
+    first["user_answer"] = "changed"
+    first["extra"] = 1
+    second = aqi.check_input("yes", "bool")
+    assert second["user_answer"] is True
+    assert "extra" not in second
+    assert second is not first
+
+
+def test_disable_memoization() -> None:
+    """ Test that the compiled validators stop using the memo """
+    aqi = AskQuestion()
+    memo = aqi.enable_memoization()
+    aqi.check_input("1", "int")
+    assert aqi.disable_memoization() is memo
+    aqi.check_input("1", "int")
+    aqi.check_input("2", "int")
+    assert memo.misses == 1
+    assert aqi.memo is None
+
+
+def test_memo_with_instrumentation() -> None:
+    """ Test that the instrumentation counts the checks answered by the memo """
+    aqi = AskQuestion()
+    aqi.enable_memoization()
+    instrumentation = aqi.enable_instrumentation()
+    aqi.check_input("42", "uint")
+    aqi.check_input("42", "uint")
+    assert instrumentation.resolutions["uint"] == {"uint": 1, ask_question.ask_question_validator.RESOLVED_BY_MEMO: 1}
@@ -0,0 +1,65 @@
+# tests/test_ask_question_numpy.py
+import math
+import pytest
+from ask_question import AskQuestion, compile
+from ask_question import ask_question_numpy as AQN
+
+np = pytest.importorskip("numpy")
+
+ANSWERS = [
+    "42", "-42", "--5", "1,5", "1.2.3", "5.", ".5", "-.5", "-0", "1-", "+5",
+    "1e5", "inf", "abc", "", " ", "1 2", "٣", "9" * 18, "9" * 25, "1" * 50,
+    "0.1", "12345678901234.5", "-", ".", "3,14"
+]
+
+
+def _same(expected, value) -> bool:
+    """ Compare two numbers including the nan and the sign of zero """
+    if isinstance(expected, float):
+        if math.isnan(expected):
+            return math.isnan(value)
+        return expected == value and math.copysign(1, expected) == math.copysign(1, value)
+    return expected == value
+
+
+@pytest.mark.parametrize("answer_type", ["int", "float", "uint", "ufloat", "num"])
+@pytest.mark.parametrize("config", [{}, {"illegal_characters_nb": "#"}, {"allow_blank": True}])
+def test_numeric_column_matches_validator(answer_type: str, config: dict) -> None:
+    """ Test that the numpy engine returns what the validator returns for every answer """
+    validator = compile(answer_type, **config)
+    values, mask = AQN.validate_numeric_column(validator, ANSWERS, chunk_size=7)
+    for index, answer in enumerate(ANSWERS):
+        answer_found, user_answer, _ = validator.validate(answer)
+        assert mask[index] == answer_found, answer
+        if answer_found is True and user_answer != "":
+            assert _same(user_answer, values[index]), answer
+
+
+def test_numeric_column_unsupported_type() -> None:
+    """ Test that the non numeric types are refused """
+    assert AQN.supports(compile("str")) is False
+    with pytest.raises(ValueError):
+        AQN.validate_numeric_column(compile("str"), ["a"])
+
+
+def test_test_inputs_numpy_engine() -> None:
+    """ Test that the numpy engine gives the same batch as the python engine """
+    aqi = AskQuestion()
+    for answer_type in ("int", "float", "uint", "ufloat", "num"):
+        python_batch = aqi.test_inputs(ANSWERS, answer_type, engine="python")
+        numpy_batch = aqi.test_inputs(ANSWERS, answer_type, engine="numpy")
+        assert isinstance(numpy_batch.values, np.ndarray)
+        for index in range(len(ANSWERS)):
+            assert numpy_batch[index]["answer_found"] == python_batch[index]["answer_found"]
+            assert numpy_batch[index]["message"] == python_batch[index]["message"]
+            assert _same(python_batch.get_user_answer(index), numpy_batch.get_user_answer(index))
+
+
+def test_test_inputs_numpy_fallback(monkeypatch) -> None:
+    """ Test that the python engine is used when numpy is not installed """
+    monkeypatch.setattr(AQN, "NUMPY_AVAILABLE", False)
+    batch = AskQuestion().test_inputs(["1", "x"], "int")
+    assert isinstance(batch.values, np.ndarray) is False
+    assert batch.user_answers() == [1, ""]
+    with pytest.raises(ImportError):
+        AQN.validate_numeric_column(compile("int"), ["1"])
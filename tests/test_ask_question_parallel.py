@@ -0,0 +1,60 @@
+# tests/test_ask_question_parallel.py
+import pickle
+from ask_question import AskQuestion, AskQuestionProcessPool, ResponseBatch
+
+ANSWERS = ["42", "-42", "3.14", "abc", "", " ", "1,5", "99999999999999999999999", "yes"] * 7
+
+
+def _same_batches(first: ResponseBatch, second: ResponseBatch) -> bool:
+    """ Compare the rows of two batches """
+    return len(first) == len(second) and all(first[index] == second[index] for index in range(len(first)))
+
+
+def test_batch_columns_round_trip() -> None:
+    """ Test that a batch survives being exported to columns and pickled """
+    aqi = AskQuestion()
+    for engine in ("python", "numpy"):
+        batch = aqi.test_inputs(ANSWERS, "int", engine=engine)
+        columns = pickle.loads(pickle.dumps(batch.to_columns()))
+        assert _same_batches(ResponseBatch.from_columns(columns), batch)
+
+
+def test_batch_merge_columns() -> None:
+    """ Test that merged batches keep the order and the dictionaries """
+    aqi = AskQuestion()
+    merged = ResponseBatch("int", int)
+    merged.merge_columns(aqi.test_inputs(ANSWERS[:10], "int", engine="python").to_columns())
+    merged.merge_columns(aqi.test_inputs(ANSWERS[10:], "int", engine="python").to_columns())
+    assert _same_batches(merged, aqi.test_inputs(ANSWERS, "int", engine="python"))
+    assert len(merged.raw_user_answers) == len(set(ANSWERS))
+
+
+def test_process_pool_keeps_order() -> None:
+    """ Test that the process pool gives the same batch as a single process """
+    aqi = AskQuestion(allow_blank=True, human_type={"int": "a number"})
+    with AskQuestionProcessPool(aqi, processes=2) as pool:
+        for answer_type in ("int", "float", "str", "bool"):
+            expected = aqi.test_inputs(ANSWERS, answer_type)
+            assert _same_batches(pool.test_inputs(ANSWERS, answer_type, chunk_size=4), expected)
+    assert _same_batches(aqi.test_inputs(ANSWERS, "uint", processes=2, chunk_size=5), aqi.test_inputs(ANSWERS, "uint"))
+
+
+def test_process_pool_follows_the_config() -> None:
+    """ Test that a pool kept between calls uses the current configuration and bounds the chunks in flight """
+    aqi = AskQuestion()
+    with AskQuestionProcessPool(aqi, processes=2) as pool:
+        assert pool.max_in_flight == 4
+        assert pool.test_inputs(["", "1"], "int")[0].answer_found is False
+        executor = pool.executor
+        assert pool.test_inputs(["2"], "int")[0].user_answer == 2
+        assert pool.executor is executor
+        assert pool.config_version == 1
+        aqi.allow_blank = True
+        assert _same_batches(pool.test_inputs(["", "1"], "int"), aqi.test_inputs(["", "1"], "int"))
+        assert pool.executor is not executor
+        assert pool.config_version == 2
+        aqi.human_type["int"] = "a number"
+        assert pool.test_inputs(["x"], "int")[0].message == "Please enter a response of type 'a number'"
+        assert pool.config_version == 3
+        streamed = pool.test_inputs((str(index) for index in range(50)), "uint", chunk_size=3)
+        assert [row.user_answer for row in streamed] == list(range(50))
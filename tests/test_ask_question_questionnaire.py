@@ -0,0 +1,72 @@
+# tests/test_ask_question_questionnaire.py
+import io
+import json
+import dataclasses
+from unittest.mock import patch
+import pytest
+from ask_question import AskQuestion, Questionnaire, QuestionnaireError
+
+DEFINITION = {
+    "questions": [
+        {"name": "name", "question": "Name? ", "answer_type": "alpha"},
+        {"name": "admin", "question": "Admin? ", "answer_type": "bool", "default": False},
+        {"name": "level", "question": "Level? ", "answer_type": "uint", "when": {"question": "admin", "equals": True}},
+        {"name": "cores", "question": "Cores? ", "answer_type": "uint", "default": 2},
+    ]
+}
+
+
+def test_questionnaire_compile() -> None:
+    """ Test that the answer types are resolved once when compiling """
+    aqi = AskQuestion()
+    plan = Questionnaire.from_json(json.dumps(DEFINITION)).compile(aqi)
+    assert len(plan) == 4
+    assert [step[2] for step in plan.steps] == [aqi.compile(kind) for kind in ("alpha", "bool", "uint", "uint")]
+    with pytest.raises(QuestionnaireError):
+        Questionnaire.from_dict({"questions": [{"name": "a", "when": {"question": "b", "equals": 1}}, {"name": "b"}]}).compile(aqi)
+    with pytest.raises(QuestionnaireError):
+        Questionnaire.from_dict({"questions": [{"name": "a"}, {"name": "a"}]}).compile(aqi)
+
+
+def test_questionnaire_answer_file() -> None:
+    """ Test a run against prepared answers, with the conditions and the defaults """
+    plan = Questionnaire.from_dict(DEFINITION).compile(AskQuestion())
+    assert plan.run({"name": "bob"}) == {"name": "bob", "admin": False, "cores": 2}
+    assert plan.run({"name": "bob", "admin": True, "level": 3, "cores": "8"}) == {"name": "bob", "admin": True, "level": 3, "cores": 8}
+    with pytest.raises(QuestionnaireError):
+        plan.run({"name": "bob", "admin": "yes"})
+    with pytest.raises(QuestionnaireError):
+        plan.run({"name": "b0b"})
+
+
+def test_questionnaire_lines() -> None:
+    """ Test a run against a stream of answers, one line per asked question """
+    plan = Questionnaire.from_dict(DEFINITION).compile(AskQuestion())
+    assert plan.run(io.StringIO("alice\nyes\n4\n\n")) == {"name": "alice", "admin": True, "level": 4, "cores": 2}
+    responses = plan.run_detailed(["alice", "no", "16"])
+    assert responses["cores"]["user_answer"] == 16
+    assert responses["cores"]["question"] == "Cores? "
+    assert "level" not in responses
+
+
+def test_questionnaire_interactive(capsys: pytest.CaptureFixture) -> None:
+    """ Test the interactive run, an invalid answer is asked again """
+    plan = Questionnaire.from_dict(DEFINITION).compile(AskQuestion())
+    with patch("builtins.input", side_effect=["al1ce", "alice", "", "x", ""]):
+        assert plan.run() == {"name": "alice", "admin": False, "cores": 2}
+    assert "Please enter a response of type" in capsys.readouterr().out
+
+
+def test_questionnaire_from_dataclass() -> None:
+    """ Test a questionnaire described by a dataclass """
+    @dataclasses.dataclass
+    class Server:
+        hostname: str = dataclasses.field(metadata={"answer_type": "alnum", "question": "Host? "})
+        cores: int = 2
+        ratio: float = 0.5
+        backup: bool = dataclasses.field(default=False, metadata={"when": lambda answers: answers["cores"] > 4})
+
+    plan = Questionnaire.from_dataclass(Server).compile(AskQuestion())
+    assert [step[2].answer_type for step in plan.steps] == ["alnum", "int", "float", "bool"]
+    assert Server(**plan.run(["web1", "8", "", "yes"])) == Server("web1", 8, 0.5, True)
+    assert Server(**plan.run(["web1", "1", "0,25"])) == Server("web1", 1, 0.25, False)
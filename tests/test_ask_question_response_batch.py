@@ -0,0 +1,54 @@
+# tests/test_ask_question_response_batch.py
+from array import array
+from ask_question import AskQuestion, ResponseBatch
+
+
+def test_test_inputs_matches_test_input() -> None:
+    """ Test that every row of a batch is the response test_input would give """
+    aqi = AskQuestion()
+    answers = ["42", "-1", "abc", "", "1,5", "42"]
+    for answer_type in ("int", "uint", "float", "str", "bool", "alnum"):
+        batch = aqi.test_inputs(answers, answer_type)
+        assert isinstance(batch, ResponseBatch)
+        assert len(batch) == len(answers)
+        for index, answer in enumerate(answers):
+            assert batch[index] == aqi.test_input(answer, answer_type, print_error=False)
+
+
+def test_test_inputs_columns() -> None:
+    """ Test the compact columns of a batch """
+    aqi = AskQuestion()
+    batch = aqi.test_inputs(["1", "2", "x", "1"], "int", engine="python")
+    assert isinstance(batch.values, array)
+    assert batch.answer_found == bytearray([1, 1, 0, 1])
+    assert batch.raw_user_answers == ["1", "2", "x"]
+    assert list(batch.raw_user_answer_codes) == [0, 1, 2, 0]
+    assert len(batch.messages) == 2
+    assert batch.found_count == 3
+    assert batch.user_answers() == [1, 2, "", 1]
+    assert batch[-1]["user_answer"] == 1
+
+
+def test_test_inputs_big_numbers() -> None:
+    """ Test that numbers too big for the typed column are kept """
+    aqi = AskQuestion()
+    batch = aqi.test_inputs(["1", "123456789012345678901234567890"], "int", engine="python")
+    assert batch.user_answers() == [1, 123456789012345678901234567890]
+
+
+def test_test_inputs_blank_answers() -> None:
+    """ Test that accepted blank answers are returned as empty strings """
+    aqi = AskQuestion(allow_blank=True)
+    batch = aqi.test_inputs([" ", "3.5"], "float")
+    assert batch.user_answers() == ["", 3.5]
+    assert batch[0]["answer_found"] is True
+
+
+def test_test_inputs_index_error() -> None:
+    """ Test the out of range indexes """
+    batch = AskQuestion().test_inputs(["1"], "int")
+    try:
+        batch[1]
+    except IndexError:
+        return
+    assert False, "IndexError not raised"
@@ -0,0 +1,397 @@
+# tests/test_ask_question_response_paquet.py
+import copy
+import pickle
+import sys
+import pytest
+from ask_question import AQFlexibleDictionary, AskQuestionResponse, FrozenAQFlexibleDictionary, FrozenAskQuestionResponse
+
+
+def test_response_fields_as_attributes() -> None:
+    """ Test that the declared fields are read from the instance and not from the class defaults """
+    response = AskQuestionResponse(message="hello", user_answer=42)
+    assert response.message == "hello"
+    assert response.user_answer == 42
+    assert response.tui is False
+    response.tui = True
+    assert response.tui is True
+    assert response["tui"] is True
+    assert AskQuestionResponse.tui is False
+
+
+def test_response_stays_compact() -> None:
+    """ Test that the dictionary view is only built when it is requested """
+    response = AskQuestionResponse(answer_found=True, user_answer=1)
+    assert "answer_found" in response
+    assert "other" not in response
+    assert len(response) == 8
+    assert response.get("other", 5) == 5
+    assert response == {**AskQuestionResponse().to_dict(), "answer_found": True, "user_answer": 1}
+    assert response == AskQuestionResponse(answer_found=True, user_answer=1)
+    assert response._values is not None
+    assert list(response.keys())[-1] == "user_answer"
+    assert response._values is None
+    assert response.user_answer == 1
+
+
+def test_response_undeclared_keys() -> None:
+    """ Test the keys that are not declared fields """
+    response = AskQuestionResponse(extra="value")
+    assert response.extra == "value"
+    assert response["extra"] == "value"
+    response.other = {"a": 1}
+    assert response.other.a == 1
+    assert response.to_dict()["other"] == {**AskQuestionResponse().to_dict(), "a": 1}
+    del response.tui
+    assert "tui" not in response
+
+
+def test_response_copy_and_pickle() -> None:
+    """ Test that the compact responses survive a copy and a pickling """
+    response = AskQuestionResponse(question="q", user_answer=1.5)
+    for clone in (copy.copy(response), copy.deepcopy(response), pickle.loads(pickle.dumps(response))):
+        assert clone == response
+        assert clone.user_answer == 1.5
+        assert clone._values is not None
+    response["extra"] = 1
+    assert pickle.loads(pickle.dumps(response)) == response
+
+
+def test_response_subclass() -> None:
+    """ Test a subclass declaring its own fields """
+    class ScoredResponse(AskQuestionResponse):
+        score: int = 3
+
+    response = ScoredResponse(message="x")
+    assert response.score == 3
+    assert response.message == "x"
+    assert response.to_dict()["score"] == 3
+    assert copy.copy(response) == response
+
+
+def test_nested_dictionaries_are_wrapped_when_read() -> None:
+    """ Test that the nested dictionaries are only wrapped on their first read """
+    blob = {"config": {"depth": {"value": 1}}, "list": [1, 2]}
+    flexible = AQFlexibleDictionary(blob=blob)
+    assert isinstance(flexible._data["blob"], dict)
+    assert flexible.to_dict()["blob"] == blob
+    config = flexible.blob.config
+    assert isinstance(config, AQFlexibleDictionary)
+    assert flexible.blob.config is config
+    assert isinstance(flexible._data["blob"], AQFlexibleDictionary)
+    assert config.depth.value == 1
+    config.depth.value = 2
+    assert blob["config"]["depth"]["value"] == 1
+    assert flexible.to_dict() == {"blob": {"config": {"depth": {"value": 2}}, "list": [1, 2]}}
+
+
+def test_nested_dictionaries_are_not_shared() -> None:
+    """ Test that the nested dictionaries given or returned are independent of the object """
+    source = {"y": {"z": 1}}
+    flexible = AQFlexibleDictionary(x=source)
+    source["w"] = 2
+    assert flexible.to_dict() == {"x": {"y": {"z": 1}}}
+    flexible.to_dict()["x"]["y"]["z"] = 9
+    assert flexible.x.y.z == 1
+    flexible["v"] = source
+    flexible.v.y.z = 4
+    assert source["y"]["z"] == 1
+    response = AskQuestionResponse(user_answer=source)
+    response.to_dict()["user_answer"]["y"]["z"] = 9
+    assert response.user_answer.y.z == 1
+    response = AskQuestionResponse.from_fields(False, False, "", "", "", True, "", source)
+    source["w"] = 5
+    assert response.to_dict()["user_answer"]["w"] == 2
+
+
+def test_deep_caller_dictionaries_are_not_shared() -> None:
+    """ Test that changing a dictionary of the caller three levels deep never shows in the object """
+    source = {"a": {"b": {"c": {"d": 1}}}}
+    flexible = AQFlexibleDictionary(x=source)
+    response = AskQuestionResponse(user_answer=source)
+    compact = AskQuestionResponse.from_fields(False, False, "", "", "", True, "", source)
+    source["a"]["b"]["c"]["d"] = 2
+    source["a"]["b"]["e"] = 3
+    assert flexible.x.a.b.c.d == 1
+    assert "e" not in flexible.x.a.b
+    assert response.user_answer.a.b.c.d == 1
+    assert compact.user_answer.a.b.c.d == 1
+    source["a"]["b"]["c"]["d"] = 4
+    assert flexible.to_dict() == {"x": {"a": {"b": {"c": {"d": 1}}}}}
+    flexible["y"] = source
+    flexible.setdefault("z", source)
+    source["a"]["b"]["c"]["d"] = 5
+    assert flexible.y.a.b.c.d == 4
+    assert flexible.z.a.b.c.d == 4
+
+
+def test_nested_equality_before_and_after_reading() -> None:
+    """ Test that a nested dictionary equals its wrapped form """
+    first = AskQuestionResponse(extra={"a": {"b": 1}})
+    second = AskQuestionResponse(extra={"a": {"b": 1}})
+    assert second.extra.a.b == 1
+    assert first == second
+    assert second == first
+    assert first.to_dict() == second.to_dict()
+    assert isinstance(dict(first.items())["extra"], AskQuestionResponse)
+
+
+def test_copy_shares_until_changed() -> None:
+    """ Test that a copy shares the content of the original until one of them changes it """
+    original = AQFlexibleDictionary(name="a", config={"depth": {"value": 1}})
+    clone = original.copy()
+    assert clone._data is original._data
+    clone.name = "b"
+    clone.config.depth.value = 2
+    assert clone._data is not original._data
+    assert original.to_dict() == {"name": "a", "config": {"depth": {"value": 1}}}
+    assert clone.to_dict() == {"name": "b", "config": {"depth": {"value": 2}}}
+    original.config.depth.value = 3
+    assert clone.config.depth.value == 2
+
+
+def test_copy_of_unread_nested_dictionaries() -> None:
+    """ Test that the nested dictionaries never read are not shared through a copy either """
+    original = AQFlexibleDictionary(x={"y": 1}, deep={"a": {"b": 1}})
+    clone = original.copy()
+    clone.to_dict()["x"]["y"] = 7
+    assert original.x.y == 1
+    clone.deep.a.b = 7
+    assert original.to_dict()["deep"] == {"a": {"b": 1}}
+    response = AskQuestionResponse(user_answer={"y": 1})
+    response.copy().to_dict()["user_answer"]["y"] = 7
+    assert response.user_answer.y == 1
+
+
+def test_merge_shares_the_original() -> None:
+    """ Test that | does not change the original """
+    response = AskQuestionResponse(question="q", user_answer=1)
+    merged = response | {"user_answer": 2, "extra": {"a": 1}}
+    assert response.user_answer == 1
+    assert "extra" not in response
+    assert merged.user_answer == 2
+    assert merged.extra.a == 1
+    assert merged.question == "q"
+    clone = copy.copy(response)
+    assert clone._values is response._values
+    clone.user_answer = 3
+    assert response.user_answer == 1
+
+
+def test_deepcopy_shares_nothing() -> None:
+    """ Test that deepcopy also copies the mutable values """
+    original = AQFlexibleDictionary(items=[1, 2], nested={"list": [3]})
+    for clone in (original.deepcopy(), copy.deepcopy(original)):
+        clone["items"].append(4)
+        clone.nested.list.append(5)
+        assert clone == {"items": [1, 2, 4], "nested": {"list": [3, 5]}}
+    assert original == {"items": [1, 2], "nested": {"list": [3]}}
+
+
+def test_typed_subclass_fields() -> None:
+    """ Test that the declared fields of a subclass read the instance and not the class default """
+    class Scored(AskQuestionResponse):
+        """ A response with an extra declared field """
+        score: int = 3
+        label: str
+
+    response = Scored(score=5)
+    assert response.score == 5
+    response.score = 7
+    assert response["score"] == 7
+    assert Scored.score == 3
+    assert "label" not in response
+    with pytest.raises(AttributeError):
+        _ = response.label
+    response.label = "x"
+    assert response.to_dict()["label"] == "x"
+    assert response.question == ""
+    response.undeclared = 1
+    assert response.undeclared == 1
+
+
+def test_schema_computed_once_per_class() -> None:
+    """ Test that the fields and the defaults of a class are computed when the class is created """
+    class Base(AQFlexibleDictionary):
+        """ A typed dictionary """
+        name: str = "n"
+        size: int
+
+    class Child(Base):
+        """ A typed dictionary overriding a default """
+        name = "child"
+        depth: int = 2
+
+    assert Base._fields == ("name", "size")
+    assert Base._field_defaults == {"name": "n"}
+    assert Child._fields == ("name", "size", "depth")
+    assert Child._field_defaults == {"name": "child", "depth": 2}
+    assert Child().to_dict() == {"name": "child", "depth": 2}
+    assert Child(name="x").name == "x"
+    assert AskQuestionResponse._fields[0] == "tui"
+
+
+def test_deeper_than_the_recursion_limit() -> None:
+    """ Test the conversions and the comparisons of a nesting deeper than the recursion limit """
+    depth = sys.getrecursionlimit() * 3
+    first = AQFlexibleDictionary(value=0)
+    second = AQFlexibleDictionary(value=0)
+    for _ in range(depth):
+        first = AQFlexibleDictionary(child=first)
+        second = AQFlexibleDictionary(child=second)
+    plain = first.to_dict()
+    assert first == second
+    assert first == plain
+    assert str(first).count("{") == depth + 1
+    assert repr(first).startswith("AQFlexibleDictionary({'child': AQFlexibleDictionary(")
+    assert copy.deepcopy(first) == first
+
+
+def test_shared_and_cyclic_values() -> None:
+    """ Test that a value met twice is converted once and that a cycle ends """
+    shared = AQFlexibleDictionary(leaf=1)
+    tree = AQFlexibleDictionary(left=shared, right=shared)
+    plain = tree.to_dict()
+    assert plain["left"] is plain["right"]
+    looped = AQFlexibleDictionary(x=1)
+    looped.me = looped
+    plain = looped.to_dict()
+    assert plain["me"] is plain
+    assert str(looped) == "{'x': 1, 'me': {...}}"
+    assert repr(looped) == "AQFlexibleDictionary({'x': 1, 'me': AQFlexibleDictionary({...})})"
+    other = AQFlexibleDictionary(x=1)
+    other.me = other
+    assert looped == other
+    other.x = 2
+    assert looped != other
+    restored = pickle.loads(pickle.dumps(looped))
+    assert restored == looped
+    assert restored.me.me.x == 1
+    assert copy.deepcopy(looped) == looped
+
+
+def test_frozen_response_is_immutable() -> None:
+    """ Test that a frozen response and its nested dictionaries cannot be changed """
+    response = AskQuestionResponse(question="q", user_answer=42, extra={"a": {"b": 1}})
+    frozen = response.freeze()
+    assert isinstance(frozen, FrozenAskQuestionResponse)
+    assert frozen == response
+    assert frozen.extra.a.b == 1
+    for change in (
+        lambda: setattr(frozen, "user_answer", 1),
+        lambda: frozen.__setitem__("question", "other"),
+        lambda: frozen.extra.a.__setitem__("b", 2),
+        lambda: frozen.pop("question"),
+        lambda: frozen.update(question="other"),
+        frozen.clear,
+    ):
+        with pytest.raises(TypeError):
+            change()
+    assert frozen.copy() is frozen
+    merged = frozen | {"user_answer": 43}
+    assert merged.user_answer == 43
+    assert frozen.user_answer == 42
+    response.user_answer = 0
+    assert frozen.user_answer == 42
+
+
+def test_frozen_hash_and_sets() -> None:
+    """ Test that the frozen dictionaries are hashed by content and deduplicated in sets """
+    first = AskQuestionResponse(question="q", user_answer=1).freeze()
+    second = FrozenAskQuestionResponse(question="q", user_answer=1)
+    other = FrozenAskQuestionResponse(question="q", user_answer=2)
+    assert hash(first) == hash(second)
+    assert first == second
+    assert first != other
+    assert len({first, second, other}) == 2
+    assert {first: "found"}[second] == "found"
+    nested = FrozenAQFlexibleDictionary(config={"depth": {"value": 1}})
+    assert hash(nested) == hash(FrozenAQFlexibleDictionary(config={"depth": {"value": 1}}))
+    assert nested == {"config": {"depth": {"value": 1}}}
+    with pytest.raises(TypeError):
+        hash(FrozenAQFlexibleDictionary(items=[1, 2]))
+    restored = pickle.loads(pickle.dumps(first))
+    assert isinstance(restored, FrozenAskQuestionResponse)
+    assert restored == first
+    assert hash(restored) == hash(first)
+
+
+class _Settings(AQFlexibleDictionary):
+    """ A typed dictionary, its nested dictionaries get its defaults """
+    depth: int = 1
+    sub: dict
+
+    def describe(self) -> str:
+        """ A method of the subclass """
+        return f"depth {self.depth}"
+
+
+class _ScoredResponse(AskQuestionResponse):
+    """ A response declaring its own field """
+    score: int = 3
+
+
+def test_freeze_keeps_the_subclass() -> None:
+    """ Test that a subclass is frozen into a frozen subclass of it, with its defaults and its methods """
+    settings = _Settings(sub={"depth": 2})
+    frozen = settings.freeze()
+    assert isinstance(frozen, _Settings)
+    assert isinstance(frozen, FrozenAQFlexibleDictionary) is False
+    assert settings == frozen
+    assert frozen.sub.depth == 2
+    assert frozen.sub.describe() == "depth 2"
+    assert type(frozen) is type(_Settings().freeze())
+    with pytest.raises(TypeError):
+        frozen.depth = 2
+    response = _ScoredResponse(user_answer=1)
+    frozen_response = response.freeze()
+    assert isinstance(frozen_response, _ScoredResponse)
+    assert frozen_response.score == 3
+    assert response == frozen_response
+    assert hash(frozen_response) == hash(_ScoredResponse(user_answer=1).freeze())
+    fields = (False, False, "", "q", "uint", True, "1", 1)
+    built = type(frozen_response).from_fields(*fields)
+    assert hash(built) == hash(_ScoredResponse.from_fields(*fields).freeze())
+    assert built.score == 3
+    for clone in (pickle.loads(pickle.dumps(frozen)), pickle.loads(pickle.dumps(frozen_response))):
+        assert type(clone) is type(clone.freeze())
+        assert hash(clone) == hash(clone.freeze())
+    assert pickle.loads(pickle.dumps(frozen)) == settings
+    assert pickle.loads(pickle.dumps(frozen_response)) == response
+
+
+def test_freeze_a_cycle() -> None:
+    """ Test that a dictionary containing itself cannot be frozen """
+    looped = AQFlexibleDictionary(x=1)
+    looped.me = looped
+    with pytest.raises(ValueError):
+        looped.freeze()
+
+
+def test_cyclic_plain_dictionary() -> None:
+    """ Test that a plain dictionary containing itself ends in repr, to_dict and freeze """
+    cyclic = {"v": 1}
+    cyclic["me"] = cyclic
+    for flexible in (AQFlexibleDictionary(d=cyclic), AskQuestionResponse(user_answer=cyclic)):
+        field = "d" if "d" in flexible else "user_answer"
+        assert "({...})" in repr(flexible)
+        plain = flexible.to_dict()
+        assert plain[field]["me"] is plain[field]
+        assert plain[field]["v"] == 1
+        with pytest.raises(ValueError):
+            flexible.freeze()
+        assert flexible[field]["me"]["me"]["v"] == 1
+        assert "({...})" in repr(flexible)
+        with pytest.raises(ValueError):
+            flexible.freeze()
+
+
+def test_private_instance_attributes() -> None:
+    """ Test that the attributes starting with _ are kept on the instance and not in the content """
+    for flexible in (AQFlexibleDictionary(a=1), AskQuestionResponse(user_answer=1)):
+        flexible._tag = "mine"
+        assert flexible._tag == "mine"
+        assert "_tag" not in flexible
+        assert "_tag" not in flexible.to_dict()
+    response = AskQuestionResponse(user_answer=1)
+    response._tag = 1
+    assert response._values is not None
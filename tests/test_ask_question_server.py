@@ -0,0 +1,90 @@
+# tests/test_ask_question_server.py
+import asyncio
+import os
+import sys
+import tempfile
+import pytest
+from ask_question import AskQuestion, AskQuestionServer, QuestionSession
+
+
+async def _provisioning(session: QuestionSession) -> None:
+    """ The questions asked to every client """
+    name = await session.ask_question("name: ", "alpha")
+    age = await session.ask_question("age: ", "uint")
+    session.data["name"] = name
+    await session.send(f"{name} is {age}")
+
+
+async def _client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, *answers: str) -> str:
+    """ Send the answers and return everything the server wrote """
+    for answer in answers:
+        writer.write(f"{answer}\n".encode("utf-8"))
+    await writer.drain()
+    output = await reader.read()
+    writer.close()
+    return output.decode("utf-8")
+
+
+def test_server_sessions_over_tcp() -> None:
+    """ Test many loopback clients answering at once """
+    finished = []
+
+    async def _main() -> list:
+        server = AskQuestionServer(AskQuestion(), _provisioning, on_session_end=finished.append)
+        async with server:
+            await server.start_tcp("127.0.0.1", 0)
+            host, port = server.address[:2]
+
+            async def _one(index: int) -> str:
+                reader, writer = await asyncio.open_connection(host, port)
+                return await _client(reader, writer, f"user{index}", "bob", "-1", str(index))
+
+            outputs = await asyncio.gather(*[_one(index) for index in range(50)])
+        return outputs, server
+
+    outputs, server = asyncio.run(_main())
+    for index, output in enumerate(outputs):
+        assert output.startswith("name: ")
+        assert output.count("Please enter a response of type") == 2
+        assert output.endswith(f"bob is {index}\n")
+    assert server.sessions == {}
+    assert server.statistics.sessions == 50
+    assert server.statistics.questions == 100
+    assert server.statistics.answers == 200
+    assert server.statistics.answers_not_found == 100
+    assert server.statistics.max_latency >= server.statistics.average_latency > 0
+    assert len(finished) == 50
+    assert {session.data["name"] for session in finished} == {"bob"}
+
+
+def test_server_timeout_and_disconnect() -> None:
+    """ Test that the sessions of clients that leave or do not answer are closed """
+    async def _main() -> AskQuestionServer:
+        server = AskQuestionServer(AskQuestion(), _provisioning, timeout=0.05)
+        async with server:
+            await server.start_tcp("127.0.0.1", 0)
+            host, port = server.address[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            assert await reader.read() == b"name: "
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write_eof()
+            assert await reader.read() == b"name: "
+        return server
+
+    server = asyncio.run(_main())
+    assert server.statistics.sessions == 2
+    assert server.statistics.answers_found == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_server_over_unix_socket() -> None:
+    """ Test a client connecting through a Unix domain socket """
+    async def _main(path: str) -> str:
+        async with AskQuestionServer(AskQuestion(), _provisioning) as server:
+            await server.start_unix(path)
+            reader, writer = await asyncio.open_unix_connection(path)
+            return await _client(reader, writer, "alice", "30")
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = asyncio.run(_main(os.path.join(directory, "questions.sock")))
+    assert output == "name: age: alice is 30\n"
@@ -0,0 +1,76 @@
+# tests/test_ask_question_stream.py
+import io
+import pytest
+from ask_question import AskQuestion, ResponseBatch, StreamStatistics
+
+
+def test_validate_stream_lines() -> None:
+    """ Test the validation of a file, one answer per line """
+    aqi = AskQuestion()
+    source = io.StringIO("42\n-1\r\nabc\n7")
+    results = list(aqi.validate_stream(source, "uint"))
+    assert [result["user_answer"] for result in results] == [42, "", "", 7]
+    assert [result["raw_user_answer"] for result in results] == ["42", "-1", "abc", "7"]
+
+
+def test_validate_stream_is_lazy() -> None:
+    """ Test that the lines are only read when the results are requested """
+    read = []
+
+    def lines():
+        for line in ("1\n", "2\n", "3\n"):
+            read.append(line)
+            yield line
+    stream = AskQuestion().validate_stream(lines(), "int")
+    assert read == []
+    assert next(stream)["user_answer"] == 1
+    assert read == ["1\n"]
+
+
+def test_validate_stream_csv() -> None:
+    """ Test the validation of csv columns, by name and with a schema """
+    aqi = AskQuestion()
+    data = "name,age\nbob,42\nalice,old\n"
+    results = list(aqi.validate_stream(io.StringIO(data), "uint", source_format="csv", field="age"))
+    assert [result["answer_found"] for result in results] == [True, False]
+    results = list(aqi.validate_stream(io.StringIO("bob,42\n"), "uint", source_format="csv", field=1))
+    assert results[0]["user_answer"] == 42
+    results = list(aqi.validate_stream(io.StringIO(data), {"name": "alpha", "age": "uint"}, source_format="csv"))
+    assert results[1]["name"]["user_answer"] == "alice"
+    assert results[1]["age"]["answer_found"] is False
+
+
+def test_validate_stream_jsonl() -> None:
+    """ Test the validation of a jsonl field """
+    aqi = AskQuestion()
+    data = '{"answer": "yes"}\n\n{"answer": false}\n{"other": 1}\n'
+    results = list(aqi.validate_stream(io.StringIO(data), "bool", source_format="jsonl", field="answer"))
+    assert [result["user_answer"] for result in results] == [True, False, ""]
+
+
+def test_validate_stream_chunks_and_statistics() -> None:
+    """ Test the chunked output and the statistics """
+    aqi = AskQuestion()
+    statistics = StreamStatistics()
+    progress = []
+    source = io.StringIO("".join(f"{i}\n" for i in range(10)) + "x\n")
+    chunks = list(aqi.validate_stream(source, "int", chunk_size=4, statistics=statistics,
+                                      on_progress=lambda stats: progress.append(stats.records), progress_interval=8))
+    assert all(isinstance(chunk, ResponseBatch) for chunk in chunks)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 3]
+    assert statistics.records == 11
+    assert statistics.answers_found == 10
+    assert statistics.answers_not_found == 1
+    assert statistics.answers_per_second > 0
+    assert progress == [8, 11]
+
+
+def test_validate_stream_errors() -> None:
+    """ Test the invalid combinations of arguments """
+    aqi = AskQuestion()
+    with pytest.raises(ValueError):
+        list(aqi.validate_stream(io.StringIO(""), "int", source_format="csv"))
+    with pytest.raises(ValueError):
+        list(aqi.validate_stream(io.StringIO(""), {"a": "int"}))
+    with pytest.raises(ValueError):
+        list(aqi.validate_stream(io.StringIO(""), "int", source_format="xml", field="a"))
@@ -0,0 +1,41 @@
+# tests/test_ask_question_threads.py
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from ask_question import AskQuestion
+
+ANSWERS = ["42", "-42", "3.14", "abc", "1.0.0", "yes", "", " ", "1,5", "--7", "A1"]
+ANSWER_TYPES = ["int", "uint", "float", "ufloat", "alnum", "version", "bool", "str"]
+
+
+def test_check_input_does_not_touch_the_instance() -> None:
+    """ Test that check_input only returns its results """
+    aqi = AskQuestion()
+    aqi.usr_answer = "previous"
+    response = aqi.check_input("42", "int")
+    assert response["user_answer"] == 42
+    assert aqi.usr_answer == "previous"
+    assert aqi.check_input("42", "int", tui=True)["tui"] is True
+
+
+def test_shared_instance_stress() -> None:
+    """ Hammer a single instance from many threads while the validator cache keeps evicting """
+    cases = [(answer, answer_type) for answer in ANSWERS for answer_type in ANSWER_TYPES]
+    expected = {case: AskQuestion().check_input(*case).to_dict() for case in cases}
+    shared = AskQuestion(validator_cache_size=2)
+
+    def worker(offset: int) -> int:
+        mismatches = 0
+        for index in range(len(cases) * 4):
+            case = cases[(index + offset) % len(cases)]
+            if shared.test_input(case[0], case[1], print_error=False) != expected[case]:
+                mismatches += 1
+        return mismatches
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(worker, range(64)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert sum(results) == 0
@@ -0,0 +1,95 @@
+# tests/test_ask_question_tui.py
+import pytest
+import ask_question
+
+pytestmark = pytest.mark.skipif(ask_question.TUI_AVAILABLE is False, reason="asciimatics is not installed")
+
+
+def _tui(**kwargs):
+    """ Create a TUI drawing on a headless screen """
+    from ask_question.ask_question_tui import AskQuestionTUI, HeadlessScreen
+    return AskQuestionTUI(HeadlessScreen(), **kwargs)
+
+
+def test_new_frame_per_question() -> None:
+    """ Test that every question gets its own frame outside of a session """
+    aqi = _tui()
+    first = aqi.get_frame("How old are you?", "uint")
+    second = aqi.get_frame("How old are you?", "uint")
+    assert first is not second
+
+
+def test_session_reuses_the_frame() -> None:
+    """ Test that a session builds the frame once and only swaps the question """
+    aqi = _tui()
+    with aqi.session():
+        frame = aqi.get_frame("How many questions will be asked today?", "uint")
+        for index in range(50):
+            assert aqi.get_frame(f"Question number {index} of the session?", "int") is frame
+        assert frame.layout_count == 1
+        assert frame.question == "Question number 49 of the session?"
+        assert frame.answer_type == "int"
+        assert frame.textbox_widget.label == frame.question
+    assert aqi.get_frame("How old are you?", "uint") is not frame
+
+
+def test_session_resets_the_answer_state() -> None:
+    """ Test that the error and the answer of the previous question are cleared """
+    aqi = _tui(reuse_frame=True)
+    frame = aqi.get_frame("How old are you?", "uint")
+    frame.textbox_widget.value = "-4"
+    frame._submit()
+    assert frame.answer_found is False
+    assert frame.error_message != ""
+    assert aqi.get_frame("What is your name?", "str") is frame
+    assert frame.error_message == ""
+    assert frame.textbox_widget.value == ""
+    frame.textbox_widget.value = "Henry"
+    assert frame._submit() == "Henry"
+    assert frame.answer_found is True
+
+
+def test_label_column_sized_once() -> None:
+    """ Test that labels of every length reuse the placed widgets, the label column is widened to its limit once """
+    aqi = _tui(reuse_frame=True)
+    frame = aqi.get_frame("Age?", "uint")
+    textbox = frame.textbox_widget
+    assert textbox._offset == len("Age?") + 1
+    width = textbox.width + textbox._offset
+    for question in ("Name?", "Id?", "Your city?", "How many cats do you have at home?", "Ok?") * 10:
+        assert aqi.get_frame(question, "str") is frame
+        assert textbox.label == question
+        assert textbox._offset == width // 3
+        frame.update(0)
+        aqi.screen.refresh()
+    assert frame.layout_count == 1
+    assert textbox.width + textbox._offset == width
+
+
+def test_live_validation_is_debounced() -> None:
+    """ Test that the live error message only changes once the keys stop """
+    aqi = _tui(live_validation=True, debounce=0.5)
+    frame = aqi.get_frame("How old are you?", "uint")
+    for answer in ("4", "42", "42a"):
+        frame.textbox_widget.value = answer
+        assert frame.flush_live_validation(frame._last_key_time + 0.1) is False
+    assert frame.live_status == "invalid"
+    assert frame.error_message == ""
+    assert frame.flush_live_validation(frame._last_key_time + 0.5) is True
+    assert frame.error_message != ""
+    frame.textbox_widget.value = "42"
+    assert frame.live_status == "valid"
+    assert frame.flush_live_validation(frame._last_key_time + 0.5) is True
+    assert frame.error_message == ""
+    assert frame.error_redraw_count == 2
+
+
+def test_live_validation_follows_the_question() -> None:
+    """ Test that a reused frame checks the answers against the new answer type """
+    aqi = _tui(live_validation=True, reuse_frame=True)
+    frame = aqi.get_frame("How old are you?", "uint")
+    frame.textbox_widget.value = "-4"
+    assert frame.live_status == "invalid"
+    aqi.get_frame("What is the temperature?", "int")
+    frame.textbox_widget.value = "-4"
+    assert frame.live_status == "valid"
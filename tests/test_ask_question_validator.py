@@ -0,0 +1,107 @@
+# tests/test_ask_question_validator.py
+import ask_question
+from ask_question import AskQuestion, AskQuestionValidator
+
+
+def test_compile_returns_validator() -> None:
+    """ Test that the package level compile returns a reusable validator """
+    validator = ask_question.compile("uint")
+    assert isinstance(validator, AskQuestionValidator)
+    assert validator.validate("42") == (True, 42, "")
+    assert validator.validate("-42")[0] is False
+    assert validator("7") == (True, 7, "")
+
+
+def test_compile_resolves_is_prefix() -> None:
+    """ Test that the 'is' prefix is removed when the type is compiled """
+    validator = ask_question.compile("isfloat")
+    assert validator.cleaned_answer_type == "float"
+    assert validator.validate("1,5") == (True, 1.5, "")
+
+
+def test_compile_keeps_overlapping_types() -> None:
+    """ Test that types containing other type names keep trying them in order """
+    validator = ask_question.compile("alnum")
+    assert validator.validate("42") == (True, 42.0, "")
+    assert validator.validate("a42") == (True, "a42", "")
+
+
+def test_compile_error_messages() -> None:
+    """ Test the messages returned for refused answers """
+    validator = ask_question.compile("int")
+    response = validator.validate("abc")
+    assert response[0] is False
+    assert response[2] == "Please enter a response of type 'whole number (-1, 0, 1, 2, 3, etc...)'"
+    response = ask_question.compile("int", human_type={"int": "a number"}).validate("abc")
+    assert response[2] == "Please enter a response of type 'a number'"
+    response = ask_question.compile("unknown").validate("abc")
+    assert response[2] == "Please enter a response of type 'Unknown demanded type"
+
+
+def test_compile_blank_answers() -> None:
+    """ Test that blank answers follow the allow_blank setting """
+    assert ask_question.compile("int").validate(" ")[0] is False
+    assert ask_question.compile("int", allow_blank=True).validate(" ") == (True, "", "")
+
+
+def test_compile_custom_illegal_characters() -> None:
+    """ Test that custom illegal characters are used for the numbers """
+    validator = ask_question.compile("int", illegal_characters_nb="#")
+    assert validator.validate("1 2") == (True, 12, "")
+    assert validator.validate("1#2")[0] is False
+
+
+def test_instance_validator_cache() -> None:
+    """ Test that the instance reuses its compiled validators and forgets them when the configuration changes """
+    aqi = AskQuestion(validator_cache_size=2)
+    validator = aqi.compile("int")
+    assert aqi.compile("int") is validator
+    aqi.compile("float")
+    aqi.compile("int")
+    aqi.compile("str")
+    assert aqi.compile("int") is validator
+    assert "float" not in aqi._validators
+    aqi.allow_blank = True
+    assert aqi.compile("int") is not validator
+    assert aqi.test_input("", "int", print_error=False)["answer_found"] is True
+    aqi.human_type = {"int": "a number"}
+    response = aqi.test_input("abc", "int", print_error=False)
+    assert response["message"] == "Please enter a response of type 'a number'"
+
+
+def test_human_type_changed_in_place() -> None:
+    """ Test that a validator is compiled again when the description of its answer type is changed in place """
+    aqi = AskQuestion()
+    validator = aqi.compile("int")
+    float_validator = aqi.compile("float")
+    aqi.human_type["int"] = "a whole number"
+    response = aqi.test_input("abc", "int", print_error=False)
+    assert response["message"] == "Please enter a response of type 'a whole number'"
+    assert aqi.compile("int") is not validator
+    assert aqi.compile("float") is float_validator
+    aqi.human_type.clear()
+    assert aqi.test_input("abc", "int", print_error=False)["message"] == AskQuestionValidator("int").error_message
+
+
+def test_character_sets_are_cached() -> None:
+    """ Test that the character sets are compiled once per distinct string """
+    from ask_question import ask_question_validator as AQV
+    assert AQV.character_set("#$") is AQV.character_set("#$")
+    assert ask_question.compile("int", illegal_characters_nb="#$").illegal_characters == frozenset("#$")
+    assert AQV.contains_illegal_characters("1" * 10000 + "$", "#$") is True
+    assert AQV.contains_illegal_characters("1" * 10000, frozenset("#$")) is False
+    assert ask_question.compile("str").validate("a" * 10000 + "é")[0] is False
+
+
+def test_normalize_number() -> None:
+    """ Test the cleaning and conversion of the number inputs """
+    from ask_question import ask_question_validator as AQV
+    assert AQV.normalize_number("1 234,5", float) == ("1234.5", 1234.5)
+    assert AQV.normalize_number("1.2.3", float) == ("1.23", 1.23)
+    assert AQV.normalize_number("1.2.3", int) == ("123", 123)
+    assert AQV.normalize_number("-1-2", int) == ("-12", -12)
+    assert AQV.normalize_number("1-", int) == ("1-", None)
+    long_number = "1" * 3000 + "." * 3000
+    assert AQV.normalize_number(long_number, int) == ("1" * 3000, int("1" * 3000))
+    assert AQV.remove_char_overflow("a.b.c.d", ".", 1) == "a.bcd"
+    assert AQV.remove_char_overflow("aAbA", "a", 1) == "ab"
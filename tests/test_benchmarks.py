@@ -0,0 +1,58 @@
+# tests/test_benchmarks.py
+import json
+import os
+import tempfile
+from benchmarks import runner, suite  # noqa: F401
+from benchmarks.__main__ import DEFAULT_BASELINE
+
+
+def test_baseline_covers_the_benchmarks() -> None:
+    """ Test that every registered benchmark has a baseline """
+    baseline = runner.load_baseline(DEFAULT_BASELINE)
+    assert baseline["calibration"] > 0
+    assert set(runner.BENCHMARKS) == set(baseline["benchmarks"])
+
+
+def test_benchmarks_run() -> None:
+    """ Test that every benchmark can be prepared and called """
+    for setup in runner.BENCHMARKS.values():
+        function = setup()
+        if function is not None:
+            function()
+
+
+def test_compare_with_threshold() -> None:
+    """ Test the detection of the regressions """
+    baseline = {"benchmarks": {"fast": {"relative": 10}, "slow": {"relative": 10}, "long": {"seconds": 0.01, "relative": 10}}}
+    results = {"benchmarks": {"fast": {"relative": 11}, "slow": {"relative": 15}, "long": {"relative": 14}, "new": {"relative": 99}}}
+    assert runner.compare(results, baseline, 25) == [("slow", 50.0)]
+    assert [name for name, _ in runner.compare(results, baseline, 5)] == ["fast", "slow"]
+    results["benchmarks"]["long"]["relative"] = 16
+    assert [name for name, _ in runner.compare(results, baseline, 25)] == ["slow", "long"]
+
+
+def test_median_and_best_results() -> None:
+    """ Test the merge of the runs recorded as the baseline and of the benchmarks timed again """
+    runs = [
+        {"calibration": calibration, "benchmarks": {"a": {"seconds": relative, "relative": relative}}}
+        for calibration, relative in ((1, 5), (3, 9), (2, 1))
+    ]
+    merged = runner.median_results(runs)
+    assert merged["calibration"] == 2
+    assert merged["benchmarks"]["a"]["relative"] == 5
+    runner.keep_best(merged, {"benchmarks": {"a": {"seconds": 4, "relative": 4}}})
+    runner.keep_best(merged, {"benchmarks": {"a": {"seconds": 7, "relative": 7}}})
+    assert merged["benchmarks"]["a"]["relative"] == 4
+
+
+def test_run_and_save_baseline() -> None:
+    """ Test a short run written as a baseline """
+    results = runner.run(["response/create"], repeat=1, min_time=0.001)
+    assert results["benchmarks"]["response/create"]["relative"] > 0
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "baseline.json")
+        runner.save_baseline(path, results)
+        with open(path, "r", encoding="utf-8") as file:
+            saved = json.load(file)
+        assert set(saved["benchmarks"]) == {"response/create"}
+        assert runner.compare(results, saved) == []